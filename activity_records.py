@@ -0,0 +1,263 @@
+"""
+=============================================================================
+🗂️ DAS-WORKLOG 활동 레코드 타입
+=============================================================================
+
+수집 단계에서 만들어지는 활동 데이터(Jira 이슈/댓글/워크로그, Gerrit 리뷰/댓글,
+Confluence 페이지, 이메일)를 __slots__ 기반의 가벼운 객체로 표현합니다.
+
+   - 인스턴스마다 __dict__가 없어 팀 단위 대량 수집에서도 메모리가 일정하게 유지됨
+   - get()/[]/in/keys()를 지원하므로 기존 dict 기반 코드를 그대로 사용 가능
+   - 타임라인 뷰(ActivityView)는 원본 레코드를 복사하지 않고 참조만 보관
+   - JSON 직렬화는 dumps()/dump() 한 경로로 통일 (디버그 덤프, LLM 프롬프트 등)
+
+설정되지 않은 필드는 키가 없는 것으로 취급합니다 (dict에 키가 없던 기존 동작과 동일).
+=============================================================================
+"""
+
+import functools
+import json
+
+# 수집 시 정규화한 epoch 필드 접미사 (프롬프트 등 외부 출력에서는 제외 가능)
+INTERNAL_SUFFIX = "_ts"
+
+
+class Record:
+    """dict 호환 인터페이스를 제공하는 __slots__ 레코드 공통 부모"""
+
+    __slots__ = ()
+
+    # dict 키 -> 속성 이름 (파이썬 예약어 등 속성으로 쓰기 어려운 키용)
+    _aliases = {}
+
+    # 레코드 목록을 담는 키 -> 항목 레코드 타입 (from_dict에서 중첩 레코드까지 복원)
+    _nested = {}
+
+    def __init__(self, **fields):
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data):
+        """dict(예: 디버그 덤프에서 읽은 데이터)로부터 레코드 생성"""
+        record = cls()
+        for key, value in data.items():
+            item_type = cls._nested.get(key)
+            if item_type is not None and isinstance(value, list):
+                value = [item_type.from_dict(item) if isinstance(item, dict) else item for item in value]
+            record[key] = value
+        return record
+
+    @classmethod
+    def _attr(cls, key):
+        return cls._aliases.get(key, key)
+
+    @classmethod
+    def _fields(cls):
+        return _field_pairs(cls)
+
+    def __getitem__(self, key):
+        attr = self._attr(key)
+        if attr not in self.__slots__:
+            raise KeyError(key)
+        try:
+            return getattr(self, attr)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        attr = self._attr(key)
+        if attr not in self.__slots__:
+            raise KeyError(f"{type(self).__name__}에 없는 필드입니다: {key}")
+        setattr(self, attr, value)
+
+    def __contains__(self, key):
+        attr = self._attr(key)
+        return attr in self.__slots__ and hasattr(self, attr)
+
+    def get(self, key, default=None):
+        attr = self._attr(key)
+        if attr not in self.__slots__:
+            return default
+        return getattr(self, attr, default)
+
+    def keys(self):
+        return [key for key, attr in self._fields() if hasattr(self, attr)]
+
+    def items(self):
+        return [(key, getattr(self, attr)) for key, attr in self._fields() if hasattr(self, attr)]
+
+    def to_dict(self, internal=True):
+        """
+        일반 dict로 변환 (중첩 레코드는 그대로 두며 json 직렬화 시 재귀 변환됨)
+
+        Args:
+            internal (bool): False이면 *_ts 같은 내부 정규화 필드 제외
+        """
+        return {key: value for key, value in self.items()
+                if internal or not key.endswith(INTERNAL_SUFFIX)}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+@functools.lru_cache(maxsize=None)
+def _field_pairs(cls):
+    """직렬화 순서대로 (dict 키, 속성 이름) 목록 (클래스별로 한 번만 계산)"""
+    reverse = {attr: key for key, attr in cls._aliases.items()}
+    return tuple((reverse.get(attr, attr), attr) for attr in cls.__slots__)
+
+
+# =============================================================================
+# Jira
+# =============================================================================
+
+class JiraComment(Record):
+    __slots__ = ("author", "author_name", "created", "created_ts", "updated", "body")
+
+
+class JiraWorklog(Record):
+    __slots__ = ("author", "created", "started", "started_ts", "updated", "timeSpent", "comment")
+
+
+class JiraIssue(Record):
+    """
+    Jira 이슈 (detailed_issue / basic_issue)
+
+    comment_count, worklog_count는 내가 작성한 항목 수, total_*는 전체 항목 수입니다.
+    """
+    __slots__ = (
+        "source", "type", "issue_key", "summary", "description", "status",
+        "assignee", "reporter", "priority", "created", "updated", "updated_ts",
+        "resolutiondate", "comments", "worklogs", "attachments", "changelog", "url",
+        "comment_count", "worklog_count", "attachment_count", "total_comments", "total_worklogs",
+    )
+    _nested = {"comments": JiraComment, "worklogs": JiraWorklog}
+
+
+# =============================================================================
+# Confluence
+# =============================================================================
+
+class ConfluencePage(Record):
+    """Confluence 페이지 (versions: 기간 내 내가 작성한 버전 {"number", "when", "message"} 목록)"""
+    __slots__ = ("source", "type", "page_id", "title", "space", "space_key",
+                 "last_modified", "last_modified_ts", "url", "versions", "my_version_count")
+
+
+# =============================================================================
+# Gerrit
+# =============================================================================
+
+class GerritReview(Record):
+    __slots__ = ("source", "type", "change_id", "change_number", "subject", "status",
+                 "project", "branch", "created", "updated", "updated_ts", "url")
+
+
+class GerritComment(Record):
+    """Gerrit 댓글 (review_comment는 file_path/line이 없음)"""
+    __slots__ = ("source", "type", "change_id", "change_number", "subject", "project",
+                 "file_path", "line", "message", "created", "created_ts", "url")
+
+
+# =============================================================================
+# 이메일
+# =============================================================================
+
+class EmailRecord(Record):
+    __slots__ = ("file_path", "file_name", "subject", "from_", "to", "cc", "bcc", "date",
+                 "message_id", "body_text", "body_html", "attachments", "is_multipart",
+                 "body_clean", "source", "type")
+    _aliases = {"from": "from_"}
+
+
+# =============================================================================
+# 통합 타임라인 뷰
+# =============================================================================
+
+class ActivityView(Record):
+    """
+    통합 타임라인의 한 행
+
+    원본 레코드는 record에 참조로만 보관하며, 기존 키 raw_data/full_description은
+    원본에서 바로 읽어 옵니다 (복사본을 만들지 않음).
+    """
+    __slots__ = ("timestamp", "timestamp_epoch", "source", "type", "reference",
+                 "description", "content", "record")
+
+    # 직렬화/CSV에서 보이는 키 (record 대신 full_description 제공)
+    _view_keys = ("timestamp", "timestamp_epoch", "source", "type", "reference",
+                  "description", "content", "full_description")
+
+    @property
+    def raw_data(self):
+        return self.record
+
+    @property
+    def full_description(self):
+        if self.record.get("source") == "jira":
+            return self.record.get("description", "")
+        return None
+
+    def __getitem__(self, key):
+        if key == "raw_data":
+            return self.record
+        if key == "full_description":
+            value = self.full_description
+            if value is None:
+                raise KeyError(key)
+            return value
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        if key == "raw_data":
+            return True
+        if key == "full_description":
+            return self.full_description is not None
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return [key for key in self._view_keys if key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+
+# =============================================================================
+# 직렬화 (공용 경로)
+# =============================================================================
+
+def to_jsonable(obj, internal=True):
+    """레코드를 json 직렬화 가능한 값으로 변환 (json.dumps의 default 훅)"""
+    if isinstance(obj, Record):
+        return obj.to_dict(internal=internal)
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입입니다: {type(obj).__name__}")
+
+
+def _external(obj):
+    return to_jsonable(obj, internal=False)
+
+
+def dumps(data, indent=2, internal=True):
+    """
+    레코드가 섞인 데이터를 JSON 문자열로 변환
+
+    Args:
+        data: 레코드/리스트/dict 등
+        indent (int, optional): 들여쓰기 (None이면 한 줄)
+        internal (bool): False이면 *_ts 내부 필드 제외 (LLM 프롬프트용)
+    """
+    return json.dumps(data, ensure_ascii=False, indent=indent,
+                      default=to_jsonable if internal else _external)
+
+
+def dump(data, f, indent=2, internal=True):
+    """dumps()와 같은 규칙으로 파일 객체에 기록"""
+    json.dump(data, f, ensure_ascii=False, indent=indent,
+              default=to_jsonable if internal else _external)
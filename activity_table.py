@@ -0,0 +1,256 @@
+"""
+=============================================================================
+📊 DAS-WORKLOG 컬럼형 활동 타임라인
+=============================================================================
+
+process_activity_data()가 만든 통합 타임라인을 컬럼 단위로 보관합니다.
+
+   - 시간(epoch)은 float 배열, 소스/타입/프로젝트는 코드 배열 + 라벨 목록(범주형)
+   - NumPy가 설치되어 있으면 NumPy 배열로 집계하고, 없으면 표준 라이브러리 array로 동작
+   - 소스/타입/일자/프로젝트별 건수, 기간, 히스토그램을 한 번에 계산
+   - CSV/JSON 내보내기도 같은 컬럼에서 생성
+
+사용 예:
+   table = ActivityTable.from_activities(integrated_activities, parse=parse_timestamp)
+   table.count_by("source")      # {"JIRA": 12, "GERRIT_NA": 30, ...}
+   table.count_by("day")         # {"2025-10-01": 7, ...}
+   table.histogram(bins=7)       # (경계 epoch 목록, 구간별 건수)
+=============================================================================
+"""
+
+import csv
+import json
+import math
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 array 기반으로 집계
+    np = None
+
+SECONDS_PER_DAY = 86400
+MISSING = float("nan")
+
+
+def _day_label(day):
+    return time.strftime("%Y-%m-%d", time.gmtime(day * SECONDS_PER_DAY))
+
+
+def _project_of(activity):
+    """활동의 프로젝트 구분 (Jira 프로젝트 키 / Gerrit 프로젝트 / Confluence 스페이스)"""
+    record = activity.get("raw_data") or {}
+    if record.get("source") == "jira":
+        return str(record.get("issue_key", "")).rsplit("-", 1)[0]
+    if record.get("source") == "confluence":
+        return record.get("space_key") or record.get("space", "")
+    return record.get("project", "")
+
+
+class Categorical:
+    """문자열 컬럼을 정수 코드 배열 + 라벨 목록으로 보관"""
+
+    __slots__ = ("codes", "labels", "_index")
+
+    def __init__(self):
+        self.codes = array("i")
+        self.labels = []
+        self._index = {}
+
+    def append(self, value):
+        code = self._index.get(value)
+        if code is None:
+            code = len(self.labels)
+            self._index[value] = code
+            self.labels.append(value)
+        self.codes.append(code)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, i):
+        return self.labels[self.codes[i]]
+
+    def counts(self):
+        """라벨별 건수 (처음 등장한 순서 유지)"""
+        if np is not None:
+            counts = np.bincount(np.frombuffer(self.codes, dtype=np.intc), minlength=len(self.labels))
+        else:
+            counts = [0] * len(self.labels)
+            for code in self.codes:
+                counts[code] += 1
+        return {label: int(n) for label, n in zip(self.labels, counts) if n}
+
+
+class ActivityTable:
+    """통합 활동 타임라인의 컬럼형 표현"""
+
+    # 내보내기에 사용할 수 있는 컬럼 (process_activity_data의 키와 동일 + project)
+    COLUMNS = ("timestamp", "timestamp_epoch", "source", "type", "project",
+               "reference", "description", "content", "full_description")
+
+    def __init__(self):
+        self.timestamp = []
+        self.epoch = array("d")
+        self.source = Categorical()
+        self.type = Categorical()
+        self.project = Categorical()
+        self.reference = []
+        self.description = []
+        self.content = []
+        self.full_description = []
+
+    @classmethod
+    def from_activities(cls, activities, parse=None):
+        """
+        활동 목록으로 테이블 생성
+
+        Args:
+            activities (list): process_activity_data() 결과
+            parse (callable, optional): timestamp_epoch가 없을 때 timestamp 문자열을 epoch로 바꿀 함수
+        """
+        table = cls()
+        for activity in activities:
+            table.append(activity, parse)
+        return table
+
+    def append(self, activity, parse=None):
+        epoch = activity.get("timestamp_epoch")
+        if epoch is None and parse is not None:
+            epoch = parse(activity.get("timestamp"))
+        self.timestamp.append(activity.get("timestamp", ""))
+        self.epoch.append(MISSING if epoch is None else epoch)
+        self.source.append(activity.get("source", ""))
+        self.type.append(activity.get("type", ""))
+        self.project.append(_project_of(activity))
+        self.reference.append(activity.get("reference", ""))
+        self.description.append(activity.get("description", ""))
+        self.content.append(activity.get("content", ""))
+        self.full_description.append(activity.get("full_description", ""))
+
+    def __len__(self):
+        return len(self.timestamp)
+
+    # =========================================================================
+    # 집계
+    # =========================================================================
+
+    def _valid_epochs(self):
+        """시간 정보가 있는 행의 epoch 값"""
+        if np is not None:
+            epochs = np.frombuffer(self.epoch, dtype=np.float64)
+            return epochs[~np.isnan(epochs)]
+        return [e for e in self.epoch if not math.isnan(e)]
+
+    def _day_counts(self):
+        if np is not None:
+            days, counts = np.unique(np.floor_divide(self._valid_epochs(), SECONDS_PER_DAY).astype(np.int64),
+                                     return_counts=True)
+            return {int(day): int(n) for day, n in zip(days, counts)}
+        counts = {}
+        for epoch in self._valid_epochs():
+            day = int(epoch // SECONDS_PER_DAY)
+            counts[day] = counts.get(day, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def count_by(self, column):
+        """
+        컬럼별 건수
+
+        Args:
+            column (str): "source", "type", "project", "day" 중 하나
+
+        Returns:
+            dict: {라벨: 건수} (day는 날짜 오름차순, YYYY-MM-DD)
+        """
+        if column == "day":
+            return {_day_label(day): n for day, n in self._day_counts().items()}
+        if column not in ("source", "type", "project"):
+            raise ValueError(f"집계할 수 없는 컬럼입니다: {column}")
+        return getattr(self, column).counts()
+
+    def date_range(self):
+        """(최소 epoch, 최대 epoch) - 시간 정보가 없으면 (None, None)"""
+        epochs = self._valid_epochs()
+        if len(epochs) == 0:
+            return None, None
+        if np is not None:
+            return float(epochs.min()), float(epochs.max())
+        return float(min(epochs)), float(max(epochs))
+
+    def histogram(self, bins=10):
+        """
+        시간 분포 히스토그램
+
+        Args:
+            bins (int): 구간 수 (전체 기간을 균등 분할)
+
+        Returns:
+            tuple: (구간 경계 epoch 목록 (bins + 1개), 구간별 건수 목록)
+        """
+        start, end = self.date_range()
+        if start is None:
+            return [], []
+        if end == start:
+            end = start + 1.0
+        if np is not None:
+            counts, edges = np.histogram(self._valid_epochs(), bins=bins, range=(start, end))
+            return [float(e) for e in edges], [int(c) for c in counts]
+
+        width = (end - start) / bins
+        edges = [start + width * i for i in range(bins)] + [end]
+        counts = [0] * bins
+        for epoch in self._valid_epochs():
+            counts[min(int((epoch - start) / width), bins - 1)] += 1
+        return edges, counts
+
+    def summary(self):
+        """generate_activity_summary()와 같은 형태의 요약 (+ 일자/프로젝트별 건수)"""
+        start, end = self.date_range()
+        fmt = "%Y-%m-%d"
+        return {
+            "total_activities": len(self),
+            "by_source": self.count_by("source"),
+            "by_type": self.count_by("type"),
+            "by_day": self.count_by("day"),
+            "by_project": self.count_by("project"),
+            "date_range": {
+                "start": time.strftime(fmt, time.gmtime(start)) if start is not None else None,
+                "end": time.strftime(fmt, time.gmtime(end)) if end is not None else None,
+            },
+        }
+
+    # =========================================================================
+    # 내보내기
+    # =========================================================================
+
+    def column(self, name):
+        """컬럼 값을 행 순서대로 반환"""
+        if name not in self.COLUMNS:
+            raise KeyError(name)
+        if name == "timestamp_epoch":
+            return [None if math.isnan(e) else e for e in self.epoch]
+        values = getattr(self, name)
+        if isinstance(values, Categorical):
+            return [values.labels[code] for code in values.codes]
+        return values
+
+    def iter_rows(self, headers=COLUMNS):
+        """지정한 컬럼만 담은 dict를 한 행씩 생성 (CSV/JSON 공용)"""
+        columns = [self.column(h) for h in headers]
+        for values in zip(*columns):
+            yield dict(zip(headers, values))
+
+    def write_csv(self, f, headers=COLUMNS):
+        """열린 파일 객체에 CSV 작성, 작성한 행 수 반환"""
+        writer = csv.DictWriter(f, fieldnames=list(headers))
+        writer.writeheader()
+        count = 0
+        for row in self.iter_rows(headers):
+            writer.writerow(row)
+            count += 1
+        return count
+
+    def to_json(self, headers=COLUMNS, indent=None):
+        """행 목록 JSON 문자열"""
+        return json.dumps(list(self.iter_rows(headers)), ensure_ascii=False, indent=indent)
@@ -0,0 +1,426 @@
+"""
+=============================================================================
+⏱️ DAS-WORKLOG 엔드투엔드 벤치마크
+=============================================================================
+
+fake_servers.FakeServers를 띄워 실제 호스트 없이 전체 파이프라인
+(수집 → 가공 → 개별 LLM 요약 → 주간 보고서 → Jira 업로드)을 실행하고
+데이터 규모별로 소요 시간, 요청 수, 토큰 수를 보고합니다.
+
+사용 예:
+   python benchmark.py                          # small/medium/large 전체
+   python benchmark.py --scales small --latency jira=0.05,gerrit=0.1,azure=0.3
+   python benchmark.py --error-rate 0.05 --json log/bench_result.json
+   python benchmark.py --scales medium --record log/bench.jsonl   # 응답 녹화
+   python benchmark.py --scales medium --replay log/bench.jsonl --replay-latency-scale 0.5
+   python benchmark.py --scales medium --team-size 5 --skip-llm   # 팀 모드 수집 (5명)
+   python benchmark.py --scales small --fast-deployment gpt-4o-mini   # 개별 요약을 빠른 배포로
+   python benchmark.py --scales small --structured --followups 10     # 구조화 요약 + 후속 대화 10회
+   python benchmark.py --scales small --incremental --warm-runs 1     # 리뷰 1건 추가 후 증분 재작성
+=============================================================================
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+import activity_records
+import disk_cache
+import fake_servers
+import host_limiter
+import http_client
+import llm_client
+import response_cache
+import team_report
+import worklog_extractor
+import llm_processor
+import jira_uploader
+
+# 데이터 규모 프리셋 (FakeServerConfig 인자 + 이메일 수)
+SCALES = {
+    "small": {"issues": 10, "pages": 5, "changes_per_server": 10, "master_subtasks": 2, "emails": 5},
+    "medium": {"issues": 40, "pages": 20, "changes_per_server": 40, "gerrit_page_cap": 25, "master_subtasks": 4, "emails": 15},
+    "large": {"issues": 120, "pages": 60, "changes_per_server": 120, "gerrit_page_cap": 50, "master_subtasks": 8, "emails": 40},
+}
+
+BENCH_USERNAME = "bench.user"
+BENCH_TOKEN = "bench-secret-token"
+BENCH_MASTER = "BENCH-MASTER"
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates", "weekly_report_template.md")
+
+
+def make_emails(count, payload_size):
+    """EmailProcessor.parse_eml_file 결과와 같은 형태의 가짜 이메일 데이터 생성"""
+    body = ("안녕하세요. 지난 회의에서 논의한 일정과 검토 결과를 공유드립니다. " * 50)[:payload_size * 2]
+    return [{
+        "file_name": f"bench_{i}.eml",
+        "subject": f"[BENCH] 협업 요청 메일 {i}",
+        "from": f"{BENCH_USERNAME}@example.com",
+        "to": "team@example.com",
+        "cc": "",
+        "date": "2025-10-01T09:00:00+09:00",
+        "attachments": [],
+        "body_clean": body,
+        "source": "email",
+        "type": "sent_email",
+    } for i in range(1, count + 1)]
+
+
+@contextlib.contextmanager
+def patched_endpoints(server, cache_dir=None):
+    """
+    worklog_extractor의 호스트 상수를 대체 서버 주소로 임시 변경
+
+    Args:
+        cache_dir (str, optional): 디스크 캐시 폴더 (규모마다 따로 두어 캐시가 섞이지 않게 함)
+    """
+    saved = (worklog_extractor.JIRA_BASE, worklog_extractor.CONFLUENCE_BASE, dict(worklog_extractor.GERRIT_URLS),
+             worklog_extractor._confluence_version_cache)
+    worklog_extractor.JIRA_BASE = server.jira_base
+    worklog_extractor.CONFLUENCE_BASE = server.confluence_base
+    worklog_extractor.GERRIT_URLS.clear()
+    worklog_extractor.GERRIT_URLS.update(server.gerrit_urls)
+    worklog_extractor._confluence_version_cache = disk_cache.JsonCache("confluence_versions.json", cache_dir=cache_dir)
+    try:
+        yield
+    finally:
+        worklog_extractor.JIRA_BASE, worklog_extractor.CONFLUENCE_BASE = saved[0], saved[1]
+        worklog_extractor.GERRIT_URLS.clear()
+        worklog_extractor.GERRIT_URLS.update(saved[2])
+        worklog_extractor._confluence_version_cache = saved[3]
+
+
+def team_members(size):
+    """팀 모드 구성원 (벤치마크 사용자 + 대체 서버 데이터의 다른 작성자)"""
+    return [BENCH_USERNAME] + list(fake_servers.OTHER_USERS[:max(0, size - 1)])
+
+
+def run_pipeline(server, emails, md_content, skip_llm=False, team=None, fast_deployment=None, pack_budget=None,
+                 structured=False, followups=0, batch=False, incremental=False, state_dir=None, new_review=False):
+    """
+    Worker.run + AIWorker.run과 같은 순서로 전체 파이프라인 실행
+
+    Args:
+        server (FakeServers): 실행 중인 대체 서버
+        emails (list): 이메일 데이터
+        md_content (str): 주간 보고 템플릿 내용
+        skip_llm (bool): LLM 단계 생략 여부
+        team (list, optional): 팀 모드 구성원 - 지정하면 팀 단위로 한 번 수집하고
+            LLM 단계는 구성원별 보고서 동시 생성으로 대체
+        fast_deployment (str, optional): 이슈/이메일 개별 요약에 사용할 빠른 배포 이름
+        pack_budget (int, optional): 묶음 요약 토큰 상한 (0이면 묶지 않음, 없으면 기본값)
+        structured (bool): 이슈/이메일 요약을 구조화 JSON으로 받을지 여부
+        followups (int): 보고서 생성 후 이어서 보낼 후속 수정 요청 수
+        batch (bool): 이슈/이메일 요약을 배치 작업 하나로 제출
+        incremental (bool): 직전 보고서 기록과 비교해 바뀐 요약/섹션만 다시 요청
+        state_dir (str, optional): 증분 보고서 기록 폴더
+        new_review (bool): 수집 후 Gerrit 리뷰 1건을 추가 (보고서 이후 새 활동이 생긴 상황)
+
+    Returns:
+        dict: 단계별 소요 시간(초)과 수집 건수
+    """
+    timings = {}
+    counts = {}
+    tokens = {"NA": BENCH_TOKEN, "EU": BENCH_TOKEN, "AS": BENCH_TOKEN}
+
+    def timed(stage, func, *args, **kwargs):
+        started = time.perf_counter()
+        result = func(*args, **kwargs)
+        timings[stage] = time.perf_counter() - started
+        return result
+
+    master_jira = f"{server.jira_base}/browse/{BENCH_MASTER}"
+    team_data = None
+    if team:
+        team_data = timed("team", worklog_extractor.collect_team_data, team, jira_token=BENCH_TOKEN,
+                          confluence_token=BENCH_TOKEN, gerrit_username=BENCH_USERNAME, gerrit_tokens=tokens,
+                          master_issue=master_jira)
+        mine = team_data[BENCH_USERNAME]
+        jira_data, confluence_data = mine["jira_data"], mine["confluence_data"]
+        gerrit_reviews, gerrit_comments = mine["gerrit_reviews"], mine["gerrit_comments"]
+    else:
+        jira_data = timed("jira", worklog_extractor.collect_jira_data, BENCH_USERNAME, BENCH_TOKEN,
+                          master_issue=master_jira)
+        confluence_data = timed("confluence", worklog_extractor.collect_confluence_data, BENCH_USERNAME, BENCH_TOKEN)
+        gerrit_reviews, gerrit_comments = timed("gerrit", worklog_extractor.collect_gerrit_data, BENCH_USERNAME, tokens)
+    http_client.finish_collection()
+    if new_review and gerrit_reviews:
+        first = gerrit_reviews[0]
+        review = {key: first[key] for key in first.keys()}
+        review["subject"] = f"{review.get('subject', '')} (follow-up)"
+        gerrit_reviews = gerrit_reviews + [activity_records.GerritReview.from_dict(review)]
+    cache_stats = response_cache.get_cache().stats if response_cache.get_cache() else {}
+
+    def process():
+        activities = worklog_extractor.process_activity_data(jira_data, confluence_data, gerrit_reviews, gerrit_comments)
+        return activities, worklog_extractor.generate_activity_summary(activities)
+
+    activities, _ = timed("process", process)
+    counts.update({
+        "jira": len(jira_data), "confluence": len(confluence_data),
+        "gerrit_reviews": len(gerrit_reviews), "gerrit_comments": len(gerrit_comments),
+        "activities": len(activities), "emails": len(emails),
+        "jira_detail_skipped": worklog_extractor.JIRA_PRUNE_STATS["pruned"],
+        "confluence_history_cached": worklog_extractor.CONFLUENCE_VERSION_STATS["cached"],
+        "gerrit_search_kb": round(worklog_extractor.GERRIT_PAYLOAD_STATS["search_bytes"] / 1024, 1),
+        "http_cache_hits": cache_stats.get("fresh", 0) + cache_stats.get("revalidated", 0),
+    })
+    if team_data is not None:
+        counts["team_members"] = len(team_data)
+        counts["team_activities"] = sum(len(records) for data in team_data.values() for records in data.values())
+        counts["jira_detail_calls"] = worklog_extractor.TEAM_STATS["jira_detail_calls"]
+
+    if skip_llm:
+        return timings, counts
+
+    worklog_data = {
+        "jira_data": jira_data,
+        "confluence_data": confluence_data,
+        "gerrit_reviews": gerrit_reviews,
+        "gerrit_comments": gerrit_comments,
+        "email_data": emails,
+    }
+    config = {
+        "username": BENCH_USERNAME,
+        "azure_openai_endpoint": server.azure_endpoint,
+        "azure_openai_api_key": "bench",
+        "azure_openai_api_version": "2024-05-01-preview",
+        "azure_openai_chat_deployment": "gpt-5",
+        "azure_openai_fast_deployment": fast_deployment,
+        "llm_pack_budget": llm_processor.PACK_TOKEN_BUDGET if pack_budget is None else pack_budget,
+        "llm_structured_summaries": structured,
+        "llm_batch_poll_interval": 0.05,
+        "llm_incremental_report": incremental,
+        "jira_token": BENCH_TOKEN,
+        "master_jira": master_jira,
+    }
+
+    if team_data is not None:
+        reports = timed("llm_team_reports", team_report.generate_team_reports, config, team_data,
+                        md_content=md_content)
+        counts["team_reports"] = sum(1 for result in reports.values() if result["success"])
+        return timings, counts
+
+    def summarize_items():
+        processor = llm_processor.LLMProcessor(config)
+        processor.start_new_session()
+        if incremental:
+            processor.load_report_state(BENCH_USERNAME, worklog_data, cache_dir=state_dir)
+        issues = [issue for issue in jira_data if issue.get("type") == "detailed_issue"]
+        if batch:
+            issue_results, worklog_data["email_summaries"] = processor.summarize_in_batch(issues, emails)
+        else:
+            worklog_data["email_summaries"] = processor.summarize_email_batch(emails)
+            issue_results = processor.summarize_jira_issues(issues)
+        summaries = []
+        for issue, result in zip(issues, issue_results):
+            if result["success"]:
+                summaries.append({"issue_key": result["issue_key"], "summary": result["summary"],
+                                  "structured": result.get("structured"),
+                                  "original_data": issue})
+        worklog_data["jira_issue_summaries"] = summaries
+        return processor
+
+    processor = timed("llm_items", summarize_items)
+    report = timed("llm_report", processor.generate_worklog_summary, BENCH_USERNAME, worklog_data, md_content)
+
+    def follow_up():
+        # 후속 요청마다 입력 토큰 수를 기록 (세션이 길어져도 일정해야 함)
+        prompt_tokens = []
+        for i in range(followups):
+            before = processor.task_stats.get("chat", {}).get("prompt_tokens", 0)
+            processor.continue_conversation(f"{i % 3 + 1}번 섹션을 더 간결하게 다듬어 주세요.")
+            prompt_tokens.append(processor.task_stats["chat"]["prompt_tokens"] - before)
+        return prompt_tokens
+
+    if followups:
+        followup_tokens = timed("llm_followups", follow_up)
+        counts["followup_first_prompt_tokens"] = followup_tokens[0]
+        counts["followup_last_prompt_tokens"] = followup_tokens[-1]
+
+    def upload():
+        uploader = jira_uploader.JiraUploader(config)
+        uploader.base_url = server.jira_base
+        return uploader.upload_worklog_result(report)
+
+    timed("upload", upload)
+    counts["issue_summaries"] = len(worklog_data["jira_issue_summaries"])
+    counts["llm_clients"] = llm_client.metrics()["created"]
+    counts["llm_packed_requests"] = processor.pack_stats["requests"]
+    counts["llm_packed_items"] = processor.pack_stats["items"]
+    if processor.report_state is not None:
+        counts["llm_summaries_reused"] = processor.report_state.stats["summaries_reused"]
+        counts["llm_sections_reused"] = processor.report_state.stats["sections_reused"]
+    for task, stats in processor.task_stats.items():
+        counts[f"llm_{task}_seconds"] = round(stats["seconds"], 2)
+        counts[f"llm_{task}_prompt_tokens"] = stats["prompt_tokens"]
+        counts[f"llm_{task}_completion_tokens"] = stats["completion_tokens"]
+    return timings, counts
+
+
+def run_scale(name, preset, args, md_content):
+    """
+    한 규모에 대해 대체 서버를 띄우고 파이프라인을 측정
+
+    Returns:
+        list: 실행별 결과 (첫 실행 + --warm-runs 만큼의 재실행)
+    """
+    preset = dict(preset)
+    email_count = preset.pop("emails")
+    config = fake_servers.FakeServerConfig(
+        username=BENCH_USERNAME,
+        since=worklog_extractor.SINCE,
+        until=worklog_extractor.NOW_UTC,
+        master_key=BENCH_MASTER,
+        payload_size=args.payload_size,
+        latency=args.latency,
+        latency_jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        error_retry_after=args.retry_after,
+        pack_drop_rate=args.pack_drop_rate,
+        **preset
+    )
+    emails = make_emails(email_count, args.payload_size)
+
+    cache_dir = os.path.join(disk_cache.CACHE_DIR, f"bench_{name}")
+    results = []
+    with fake_servers.FakeServers(config) as server, patched_endpoints(server, cache_dir):
+        # 재실행은 같은 서버/데이터에 대해 캐시(디스크/HTTP 응답)가 채워진 상태로 측정
+        for run in range(1 + args.warm_runs):
+            server.reset_stats()
+            host_limiter.reset_metrics()
+            response_cache.configure()  # 적중률을 실행마다 새로 집계 (디스크 캐시는 유지)
+            log_sink = io.StringIO()
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(sys.stdout if args.verbose else log_sink):
+                timings, counts = run_pipeline(server, emails, md_content, skip_llm=args.skip_llm,
+                                               team=team_members(args.team_size) if args.team_size else None,
+                                               fast_deployment=args.fast_deployment, pack_budget=args.pack_budget,
+                                               structured=args.structured, followups=args.followups,
+                                               batch=args.batch, incremental=args.incremental,
+                                               state_dir=cache_dir, new_review=args.incremental and run > 0)
+            wall = time.perf_counter() - started
+            stats = server.stats
+            host_metrics = host_limiter.metrics()
+
+            results.append({
+                "scale": name if run == 0 else f"{name} 재실행 {run}",
+                "wall_time": wall,
+                "stages": timings,
+                "counts": counts,
+                "requests": dict(stats["requests"]),
+                "endpoints": dict(stats["endpoints"]),
+                "total_requests": sum(stats["requests"].values()),
+                "errors": stats["errors"],
+                "not_modified": stats["not_modified"],
+                "bytes_sent": stats["bytes_sent"],
+                "prompt_tokens": stats["prompt_tokens"],
+                "cached_tokens": stats["cached_tokens"],
+                "completion_tokens": stats["completion_tokens"],
+                "deployments": dict(stats["deployments"]),
+                "batches": stats["batches"],
+                "retries": sum(m["retries"] for m in host_metrics.values()),
+                "throttled": sum(m["throttled"] for m in host_metrics.values()),
+            })
+    return results
+
+
+def print_report(results):
+    """규모별 측정 결과를 표 형태로 출력"""
+    print("=" * 80)
+    print("⏱️ DAS-WORKLOG 벤치마크 결과")
+    print("=" * 80)
+    for r in results:
+        print(f"\n📦 [{r['scale']}] 전체 {r['wall_time']:.2f}초 | 요청 {r['total_requests']}회 "
+              f"(오류 주입 {r['errors']}회, 재시도 {r['retries']}회, 304 {r['not_modified']}회) | "
+              f"응답 {r['bytes_sent'] / 1024:.1f} KB")
+        print(f"   - 토큰: 입력 {r['prompt_tokens']:,} (캐시 {r['cached_tokens']:,}) / 출력 {r['completion_tokens']:,}")
+        if r["deployments"]:
+            print("   - 배포별 호출: " + ", ".join(f"{k} {v}" for k, v in sorted(r["deployments"].items())))
+        print("   - 단계별: " + ", ".join(f"{k} {v:.2f}s" for k, v in r["stages"].items()))
+        print("   - 서비스별 요청: " + ", ".join(f"{k} {v}" for k, v in sorted(r["requests"].items())))
+        print("   - 수집 건수: " + ", ".join(f"{k} {v}" for k, v in r["counts"].items()))
+
+
+def _parse_latency(value):
+    """'jira=0.05,gerrit=0.1' 형식 파싱"""
+    latency = {}
+    for part in filter(None, value.split(",")):
+        service, seconds = part.split("=")
+        latency[service.strip()] = float(seconds)
+    return latency
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="DAS-WORKLOG 엔드투엔드 벤치마크")
+    parser.add_argument("--scales", default="small,medium,large", help="실행할 규모 (쉼표 구분)")
+    parser.add_argument("--latency", type=_parse_latency, default={}, help="서비스별 지연 예: jira=0.05,azure=0.3")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 랜덤 지연 최대값(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0.0 ~ 1.0)")
+    parser.add_argument("--error-status", type=int, default=500, help="주입할 오류 응답 상태 코드 (예: 429, 503)")
+    parser.add_argument("--retry-after", type=float, help="주입한 오류 응답의 Retry-After 값(초)")
+    parser.add_argument("--rate-limit", type=float, help="호스트당 초당 요청 수 (기본: host_limiter 기본값)")
+    parser.add_argument("--payload-size", type=int, default=400, help="본문 길이 (문자 수)")
+    parser.add_argument("--skip-llm", action="store_true", help="LLM/업로드 단계 생략")
+    parser.add_argument("--warm-runs", type=int, default=0, help="캐시가 채워진 상태로 같은 규모를 다시 실행할 횟수")
+    parser.add_argument("--fast-deployment", help="이슈/이메일 개별 요약에 사용할 빠른 배포 이름 (예: gpt-4o-mini)")
+    parser.add_argument("--pack-budget", type=int, help="묶음 요약 토큰 상한 (0이면 항목마다 개별 요약)")
+    parser.add_argument("--pack-drop-rate", type=float, default=0.0, help="묶음 응답에서 항목을 빠뜨릴 확률 (재시도 경로 확인)")
+    parser.add_argument("--structured", action="store_true", help="이슈/이메일 요약을 구조화 JSON으로 받아 보고서 프롬프트 축소")
+    parser.add_argument("--followups", type=int, default=0, help="보고서 생성 후 후속 수정 요청 수")
+    parser.add_argument("--batch", action="store_true", help="이슈/이메일 요약을 배치 작업 하나로 제출")
+    parser.add_argument("--incremental", action="store_true",
+                        help="증분 보고서 작성 (재실행마다 Gerrit 리뷰 1건을 추가해 바뀐 섹션만 다시 작성)")
+    parser.add_argument("--team-size", type=int, default=0,
+                        help=f"팀 모드로 수집할 구성원 수 (1 ~ {1 + len(fake_servers.OTHER_USERS)}, 0이면 개인 모드)")
+    parser.add_argument("--json", dest="json_path", help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--verbose", action="store_true", help="파이프라인 로그 출력")
+    parser.add_argument("--record", metavar="CASSETTE", help="HTTP 응답을 카세트 파일에 녹화")
+    parser.add_argument("--replay", metavar="CASSETTE", help="카세트 파일의 응답으로 재생 (Jira/Confluence/Gerrit)")
+    parser.add_argument("--replay-latency-scale", type=float, default=1.0, help="재생 시 기록된 지연 배율")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        http_client.configure(mode=http_client.MODE_RECORD, cassette=os.path.abspath(args.record))
+    elif args.replay:
+        http_client.configure(mode=http_client.MODE_REPLAY, cassette=os.path.abspath(args.replay),
+                              latency_scale=args.replay_latency_scale)
+
+    if args.rate_limit is not None:
+        host_limiter.configure(rate=args.rate_limit, burst=max(1, int(args.rate_limit * 2)))
+
+    with open(TEMPLATE_PATH, "r", encoding="utf-8") as f:
+        md_content = f.read()
+
+    results = []
+    # ./log 등 부산물이 작업 디렉토리를 오염시키지 않도록 임시 디렉토리에서 실행
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="worklog_bench_") as workdir:
+        os.chdir(workdir)
+        try:
+            for name in filter(None, args.scales.split(",")):
+                if name not in SCALES:
+                    print(f"⚠️ 알 수 없는 규모: {name} (사용 가능: {', '.join(SCALES)})")
+                    continue
+                results.extend(run_scale(name, SCALES[name], args, md_content))
+        finally:
+            os.chdir(original_cwd)
+
+    print_report(results)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.json_path}")
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
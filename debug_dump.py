@@ -0,0 +1,163 @@
+"""
+=============================================================================
+🧾 DAS-WORKLOG 디버그 덤프 (스트리밍 NDJSON)
+=============================================================================
+
+수집한 활동 데이터를 한 줄에 한 레코드씩 NDJSON으로 기록합니다.
+
+   - 수집 단계가 끝날 때마다 해당 섹션을 바로 기록 (전체 데이터를 한 번 더 모아 두지 않음)
+   - 기본으로 gzip 압축 (log/worklog_debug_YYYYMMDD_HHMMSS.ndjson.gz)
+   - iter_dump()는 파일을 한 줄씩 읽는 지연 리더, load_worklog_data()는
+     AIWorker에 그대로 넘길 수 있는 worklog_data dict를 복원 (재수집 없이 AI 단계만 재실행)
+
+줄 형식:
+   {"section": "jira_data", "kind": "JiraIssue", "data": {...}}
+
+사용 예:
+   with DebugDumpWriter() as dump:
+       dump.write_many("jira_data", jira_data)
+
+   worklog_data = load_worklog_data(latest_dump())
+   python debug_dump.py [덤프 경로]        # 섹션별 건수 확인
+=============================================================================
+"""
+
+import glob
+import gzip
+import json
+import os
+import sys
+from datetime import datetime
+
+import activity_records
+
+# worklog_data의 섹션 (Worker.run이 만드는 키와 동일)
+SECTIONS = ("jira_data", "confluence_data", "gerrit_reviews", "gerrit_comments", "email_data")
+
+DUMP_PREFIX = "worklog_debug_"
+
+
+def _open_text(path, mode):
+    """경로가 .gz로 끝나면 gzip 텍스트 스트림으로 연다"""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class DebugDumpWriter:
+    """활동 레코드를 NDJSON 줄 단위로 기록"""
+
+    def __init__(self, path=None, compress=True, log_dir="./log"):
+        """
+        Args:
+            path (str, optional): 덤프 파일 경로 (없으면 log_dir에 시간 기반 이름으로 생성)
+            compress (bool): gzip 압축 여부 (path를 지정한 경우 확장자를 따름)
+            log_dir (str): 기본 저장 폴더
+        """
+        if path is None:
+            if not os.path.exists(log_dir):
+                os.makedirs(log_dir)
+                print(f"📁 로그 폴더 생성: {log_dir}")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(log_dir, f"{DUMP_PREFIX}{timestamp}.ndjson" + (".gz" if compress else ""))
+        self.path = path
+        self.counts = {}
+        self._file = _open_text(path, "w")
+
+    def write(self, section, record):
+        """레코드 한 건 기록"""
+        line = {"section": section, "kind": type(record).__name__, "data": record}
+        self._file.write(activity_records.dumps(line, indent=None))
+        self._file.write("\n")
+        self.counts[section] = self.counts.get(section, 0) + 1
+
+    def write_many(self, section, records):
+        """
+        레코드 목록 기록
+
+        Returns:
+            int: 기록한 건수
+        """
+        count = 0
+        for record in records:
+            self.write(section, record)
+            count += 1
+        if count == 0:
+            self.counts.setdefault(section, 0)
+        self._file.flush()
+        return count
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def iter_dump(path, sections=None):
+    """
+    덤프 파일을 한 줄씩 읽어 (섹션, 레코드)를 생성 (지연 읽기)
+
+    Args:
+        path (str): 덤프 파일 경로 (.ndjson 또는 .ndjson.gz)
+        sections (iterable, optional): 읽을 섹션만 지정
+
+    Yields:
+        tuple: (section, record) - record는 원래 타입의 활동 레코드(가능한 경우) 또는 dict
+    """
+    wanted = set(sections) if sections else None
+    with _open_text(path, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            section = entry.get("section")
+            if wanted is not None and section not in wanted:
+                continue
+            yield section, _restore(entry.get("kind"), entry.get("data"))
+
+
+def _restore(kind, data):
+    """kind 이름으로 활동 레코드 타입을 복원 (알 수 없으면 dict 그대로)"""
+    record_type = getattr(activity_records, kind or "", None)
+    if isinstance(record_type, type) and issubclass(record_type, activity_records.Record) and isinstance(data, dict):
+        return record_type.from_dict(data)
+    return data
+
+
+def load_worklog_data(path, sections=None):
+    """
+    덤프 파일로부터 worklog_data dict 복원 (AI 단계만 다시 실행할 때 사용)
+
+    Returns:
+        dict: {"jira_data": [...], "confluence_data": [...], ...}
+    """
+    worklog_data = {section: [] for section in (sections or SECTIONS)}
+    for section, record in iter_dump(path, sections):
+        worklog_data.setdefault(section, []).append(record)
+    return worklog_data
+
+
+def latest_dump(log_dir="./log"):
+    """가장 최근 디버그 덤프 경로 (없으면 None)"""
+    candidates = glob.glob(os.path.join(log_dir, f"{DUMP_PREFIX}*.ndjson")) + \
+        glob.glob(os.path.join(log_dir, f"{DUMP_PREFIX}*.ndjson.gz"))
+    if not candidates:
+        return None
+    return max(candidates, key=os.path.getmtime)
+
+
+if __name__ == "__main__":
+    dump_path = sys.argv[1] if len(sys.argv) > 1 else latest_dump()
+    if not dump_path:
+        print("⚠️ 디버그 덤프 파일이 없습니다.")
+        sys.exit(1)
+    data = load_worklog_data(dump_path)
+    print(f"🧾 {dump_path}")
+    for name, records in data.items():
+        print(f"   - {name}: {len(records)}개")
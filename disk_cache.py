@@ -0,0 +1,84 @@
+"""
+=============================================================================
+💽 DAS-WORKLOG 디스크 캐시
+=============================================================================
+
+재실행 시 바뀌지 않은 데이터를 다시 받지 않도록 log/cache/ 아래에 JSON으로 보관합니다.
+(log/ 바로 아래 파일만 Jira에 첨부되므로 캐시 폴더는 업로드/삭제 대상이 아닙니다.)
+
+사용 예:
+   cache = JsonCache("confluence_versions.json")
+   entry = cache.get(page_id)
+   cache.set(page_id, {...})
+   cache.save()
+=============================================================================
+"""
+
+import json
+import os
+import threading
+
+CACHE_DIR = os.path.join("log", "cache")
+
+
+class JsonCache:
+    """키-값을 JSON 파일 하나에 보관하는 스레드 안전 캐시 (처음 접근할 때 로드)"""
+
+    def __init__(self, filename, cache_dir=None):
+        self.path = os.path.join(cache_dir or CACHE_DIR, filename)
+        self._lock = threading.Lock()
+        self._data = None
+        self._dirty = False
+
+    def _load(self):
+        if self._data is not None:
+            return
+        self._data = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ 캐시 파일을 읽지 못해 새로 만듭니다 ({self.path}): {e}")
+
+    def get(self, key, default=None):
+        with self._lock:
+            self._load()
+            return self._data.get(str(key), default)
+
+    def set(self, key, value):
+        with self._lock:
+            self._load()
+            self._data[str(key)] = value
+            self._dirty = True
+
+    def pop(self, key, default=None):
+        with self._lock:
+            self._load()
+            if str(key) in self._data:
+                self._dirty = True
+            return self._data.pop(str(key), default)
+
+    def keys(self):
+        with self._lock:
+            self._load()
+            return list(self._data)
+
+    def __len__(self):
+        with self._lock:
+            self._load()
+            return len(self._data)
+
+    def save(self):
+        """변경 사항이 있을 때만 임시 파일에 쓴 뒤 교체 (중간에 실패해도 기존 캐시 유지)"""
+        with self._lock:
+            if not self._dirty or self._data is None:
+                return
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self._dirty = False
@@ -8,10 +8,59 @@ from datetime import datetime
 import re
 from bs4 import BeautifulSoup
 import llm_processor
+import activity_records
+from activity_records import EmailRecord
 
 CONFIG_FILE_PATH = "user_config.json"
 OUTLOOK_FOLDER_PATH = r"./outlook"
 
+# 이메일 요약 시스템 메시지
+EMAIL_SYSTEM_MESSAGE = "당신은 다양한 직군(개발, 영업, 마케팅, PM, 기획, 운영 등)의 비즈니스 이메일을 분석하는 전문가입니다. 각 이메일의 업무적 맥락과 중요도를 정확히 파악하여 해당 직군의 특성에 맞는 관점으로 요약합니다. 이메일 히스토리와 전후 맥락을 모두 고려하되, 각 이메일은 독립적으로 분석하여 주간 보고서에 포함될 가치 있는 상세한 요약을 제공합니다."
+
+# 이메일 요약 지침 (모든 이메일에 같은 바이트로 반복되도록 프롬프트 맨 앞에 둠 - 접두사 캐시)
+EMAIL_ANALYSIS_INSTRUCTIONS = "".join([
+    "## 📧 비즈니스 이메일 종합 분석 및 요약\n\n",
+    "맨 아래의 발신 이메일을 다양한 직군의 업무 관점에서 종합 분석하여 상세하고 유용한 요약을 작성해주세요.\n\n",
+    
+    "### 🎯 종합 분석 및 상세 요약\n\n",
+    "다음 구조로 업무 맥락을 충분히 파악할 수 있는 상세한 요약을 작성해주세요:\n\n",
+    
+    "**📌 커뮤니케이션 분류 및 성격**\n",
+    "- [ ] 기술 문의/답변 (개발 관련)\n",
+    "- [ ] 고객 대응/영업 활동\n", 
+    "- [ ] 마케팅/홍보 관련\n",
+    "- [ ] 프로젝트 관리/기획\n",
+    "- [ ] 협업 요청/부서간 조율\n",
+    "- [ ] 결과 보고/성과 공유\n",
+    "- [ ] 회의/일정 관련\n",
+    "- [ ] 고객 지원/서비스\n",
+    "- [ ] 기타: [구체적 분류]\n\n",
+    
+    "**🎯 핵심 내용 및 맥락 (4-5줄)**\n",
+    "- [이메일을 보내게 된 배경과 목적]\n",
+    "- [주요 메시지 1 - 가장 중요한 내용]\n",
+    "- [주요 메시지 2 - 구체적 요청이나 제안]\n",
+    "- [중요한 결정사항이나 업데이트]\n",
+    "- [히스토리나 이전 논의가 있다면 맥락 설명]\n\n",
+    
+    "**💼 업무 영향도 및 가치**\n",
+    "- **우선순위**: 높음/보통/낮음\n",
+    "- **관련 업무**: [연관된 프로젝트나 업무 영역]\n",
+    "- **비즈니스 임팩트**: [조직에 미치는 영향이나 가치]\n",
+    "- **협업 범위**: [관련 부서나 팀, 외부 이해관계자]\n\n",
+    
+    "**⏰ 후속 조치 및 기대사항**\n",
+    "- **필요한 액션**: [요청된 구체적 행동이나 피드백]\n",
+    "- **중요 일정**: [마감일이나 중요 스케줄]\n",
+    "- **기대 결과**: [예상되는 결과나 다음 단계]\n\n",
+    
+    "### 작성 지침\n",
+    "- **히스토리 중시**: 이메일 본문 내 이전 대화나 맥락을 모두 고려하여 종합 분석\n",
+    "- **직군별 관점**: 해당 업무의 특성(기술/영업/마케팅/기획 등)을 반영한 전문적 해석\n",
+    "- **상세 수준**: 6-8줄로 충실하게 작성하여 업무 상황을 완전히 이해할 수 있도록\n",
+    "- **실용성**: 상급자나 동료가 해당 커뮤니케이션의 중요도와 맥락을 명확히 파악할 수 있도록\n\n",
+])
+
 class EmailProcessor:
     """EML 파일 파싱 및 이메일 요약 처리 클래스"""
     
@@ -21,18 +70,22 @@ class EmailProcessor:
         
         Args:
             config (dict): 설정 정보 (LLM 설정 포함)
-            llm_processor (LLMProcessor, optional): 외부 LLMProcessor 인스턴스. 없으면 새로 생성
+            llm_processor (LLMProcessor, optional): 외부 LLMProcessor 인스턴스. 없으면 요약할 때 생성
         """
         self.config = config
-        if llm_processor:
-            self.llm_processor = llm_processor
-            self.use_external_llm = True
+        self._llm_processor = llm_processor
+        self.use_external_llm = llm_processor is not None
+        if self.use_external_llm:
             print("📧 이메일 프로세서가 외부 LLM 세션을 사용합니다.")
-        else:
+    
+    @property
+    def llm_processor(self):
+        """LLMProcessor (EML 수집만 할 때는 만들지 않고 첫 요약 시 생성)"""
+        if self._llm_processor is None:
             import llm_processor as llm_mod
-            self.llm_processor = llm_mod.LLMProcessor(config)
-            self.use_external_llm = False
+            self._llm_processor = llm_mod.LLMProcessor(self.config)
             print("📧 이메일 프로세서가 독립적인 LLM 인스턴스를 생성했습니다.")
+        return self._llm_processor
     
     def find_eml_files(self):
         """
@@ -71,7 +124,7 @@ class EmailProcessor:
             eml_file_path (str): EML 파일 경로
             
         Returns:
-            dict: 파싱된 이메일 정보
+            EmailRecord: 파싱된 이메일 정보 (dict처럼 사용 가능)
         """
         try:
             print(f"📖 EML 파일 파싱 중: {os.path.basename(eml_file_path)}")
@@ -84,21 +137,21 @@ class EmailProcessor:
             msg = email.message_from_bytes(raw_email, policy=email.policy.default)
             
             # 기본 정보 추출
-            email_data = {
-                'file_path': eml_file_path,
-                'file_name': os.path.basename(eml_file_path),
-                'subject': self._decode_header(msg.get('Subject', '')),
-                'from': self._decode_header(msg.get('From', '')),
-                'to': self._decode_header(msg.get('To', '')),
-                'cc': self._decode_header(msg.get('Cc', '')),
-                'bcc': self._decode_header(msg.get('Bcc', '')),
-                'date': self._parse_date(msg.get('Date', '')),
-                'message_id': msg.get('Message-ID', ''),
-                'body_text': '',
-                'body_html': '',
-                'attachments': [],
-                'is_multipart': msg.is_multipart()
-            }
+            email_data = EmailRecord(
+                file_path=eml_file_path,
+                file_name=os.path.basename(eml_file_path),
+                subject=self._decode_header(msg.get('Subject', '')),
+                to=self._decode_header(msg.get('To', '')),
+                cc=self._decode_header(msg.get('Cc', '')),
+                bcc=self._decode_header(msg.get('Bcc', '')),
+                date=self._parse_date(msg.get('Date', '')),
+                message_id=msg.get('Message-ID', ''),
+                body_text='',
+                body_html='',
+                attachments=[],
+                is_multipart=msg.is_multipart()
+            )
+            email_data['from'] = self._decode_header(msg.get('From', ''))
             
             # 본문 및 첨부파일 추출
             self._extract_body_and_attachments(msg, email_data)
@@ -228,26 +281,8 @@ class EmailProcessor:
             # 이메일 요약용 프롬프트 구성
             prompt = self._build_email_summary_prompt(email_data)
             
-            if self.use_external_llm:
-                # 외부 LLM 세션을 사용하는 경우 (세션 기반 대화)
-                summary = self.llm_processor.continue_conversation(prompt)
-            else:
-                # 독립적인 LLM 인스턴스를 사용하는 경우 (기존 방식)
-                completion = self.llm_processor.client.chat.completions.create(
-                    model=self.config["azure_openai_chat_deployment"],
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "당신은 다양한 직군(개발, 영업, 마케팅, PM, 기획, 운영 등)의 비즈니스 이메일을 분석하는 전문가입니다. 각 이메일의 업무적 맥락과 중요도를 정확히 파악하여 해당 직군의 특성에 맞는 관점으로 요약합니다. 이메일 히스토리와 전후 맥락을 모두 고려하되, 각 이메일은 독립적으로 분석하여 주간 보고서에 포함될 가치 있는 상세한 요약을 제공합니다."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    max_completion_tokens=1000,
-                )
-                summary = completion.choices[0].message.content
+            # 대화 히스토리 없이 단독 호출 (작업별 라우팅: 빠른 배포가 설정되어 있으면 그 배포 사용)
+            summary = self.llm_processor.summarize_item("email", prompt, EMAIL_SYSTEM_MESSAGE)
             
             print(f"✅ 이메일 요약 완료")
             return summary
@@ -256,12 +291,10 @@ class EmailProcessor:
             raise Exception(f"이메일 요약 생성 중 오류 발생: {e}")
     
     def _build_email_summary_prompt(self, email_data):
-        """이메일 요약용 프롬프트 구성"""
+        """이메일 요약용 프롬프트 구성 (고정 지침이 맨 앞, 이메일별 데이터는 맨 뒤 - 접두사 캐시)"""
         prompt_parts = [
-            "## 📧 비즈니스 이메일 종합 분석 및 요약\n\n",
-            "다음 발신 이메일을 다양한 직군의 업무 관점에서 종합 분석하여 상세하고 유용한 요약을 작성해주세요.\n\n",
-            
-            "### � 이메일 기본 정보\n",
+            EMAIL_ANALYSIS_INSTRUCTIONS,
+            "### 📧 이메일 기본 정보\n",
             f"- **제목**: {email_data['subject']}\n",
             f"- **수신자**: {email_data['to']}\n"
         ]
@@ -276,48 +309,10 @@ class EmailProcessor:
         prompt_parts.extend([
             f"- **발송일**: {email_data.get('date', 'N/A')}\n\n",
             
-            "### � 이메일 전체 내용 (히스토리 포함)\n",
+            "### 📄 이메일 전체 내용 (히스토리 포함)\n",
             "```\n",
             email_data['body_clean'][:3000],  # 더 많은 내용 포함
-            "\n```\n\n",
-            
-            "### 🎯 종합 분석 및 상세 요약\n\n",
-            "다음 구조로 업무 맥락을 충분히 파악할 수 있는 상세한 요약을 작성해주세요:\n\n",
-            
-            "**📌 커뮤니케이션 분류 및 성격**\n",
-            "- [ ] 기술 문의/답변 (개발 관련)\n",
-            "- [ ] 고객 대응/영업 활동\n", 
-            "- [ ] 마케팅/홍보 관련\n",
-            "- [ ] 프로젝트 관리/기획\n",
-            "- [ ] 협업 요청/부서간 조율\n",
-            "- [ ] 결과 보고/성과 공유\n",
-            "- [ ] 회의/일정 관련\n",
-            "- [ ] 고객 지원/서비스\n",
-            "- [ ] 기타: [구체적 분류]\n\n",
-            
-            "**🎯 핵심 내용 및 맥락 (4-5줄)**\n",
-            "- [이메일을 보내게 된 배경과 목적]\n",
-            "- [주요 메시지 1 - 가장 중요한 내용]\n",
-            "- [주요 메시지 2 - 구체적 요청이나 제안]\n",
-            "- [중요한 결정사항이나 업데이트]\n",
-            "- [히스토리나 이전 논의가 있다면 맥락 설명]\n\n",
-            
-            "**💼 업무 영향도 및 가치**\n",
-            "- **우선순위**: 높음/보통/낮음\n",
-            "- **관련 업무**: [연관된 프로젝트나 업무 영역]\n",
-            "- **비즈니스 임팩트**: [조직에 미치는 영향이나 가치]\n",
-            "- **협업 범위**: [관련 부서나 팀, 외부 이해관계자]\n\n",
-            
-            "**⏰ 후속 조치 및 기대사항**\n",
-            "- **필요한 액션**: [요청된 구체적 행동이나 피드백]\n",
-            "- **중요 일정**: [마감일이나 중요 스케줄]\n",
-            "- **기대 결과**: [예상되는 결과나 다음 단계]\n\n",
-            
-            "### 작성 지침\n",
-            "- **히스토리 중시**: 이메일 본문 내 이전 대화나 맥락을 모두 고려하여 종합 분석\n",
-            "- **직군별 관점**: 해당 업무의 특성(기술/영업/마케팅/기획 등)을 반영한 전문적 해석\n",
-            "- **상세 수준**: 6-8줄로 충실하게 작성하여 업무 상황을 완전히 이해할 수 있도록\n",
-            "- **실용성**: 상급자나 동료가 해당 커뮤니케이션의 중요도와 맥락을 명확히 파악할 수 있도록"
+            "\n```\n"
         ])
         
         return "".join(prompt_parts)
@@ -410,7 +405,7 @@ class EmailProcessor:
             
             # JSON 파일로 저장 (이미 요약된 형태이므로 그대로 저장)
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(processed_summaries, f, ensure_ascii=False, indent=2)
+                activity_records.dump(processed_summaries, f)
             
             print(f"💾 이메일 요약 저장 완료: {output_path}")
             print(f"   - 저장된 요약 개수: {len(processed_summaries)}개")
@@ -0,0 +1,362 @@
+"""
+=============================================================================
+🚦 DAS-WORKLOG 호스트별 요청 제한기
+=============================================================================
+
+http_client.request()가 호스트(host:port)마다 하나씩 사용하는 제한기입니다.
+
+   - 토큰 버킷: 초당 요청 수(rate)와 순간 허용량(burst) 제한
+   - 동시 요청 수 제한: 관측한 지연/오류에 따라 1 ~ max_concurrency 사이에서 자동 조절
+     (성공 + 지연 정상이면 천천히 늘리고, 오류/429/지연 급증이면 빠르게 줄임)
+   - Retry-After: 429/503 응답의 대기 시간 동안 해당 호스트의 모든 요청을 보류
+   - 재시도 대기: 지수 백오프 + 지터 (Retry-After가 있으면 그 값을 우선)
+   - 서킷 브레이커: 연속 실패가 쌓이면 일정 시간 요청을 즉시 실패시킨 뒤 한 건으로 복구 확인
+   - 지표: 호스트별 요청/재시도/오류/429/차단 수, 평균·최대 지연, 현재 동시성
+
+설정 (user_config.json, 모두 선택):
+   "http_rate_limit": 20,            # 호스트당 초당 요청 수
+   "http_burst": 40,
+   "http_max_concurrency": 8,
+   "http_max_retries": 3,
+   "http_host_limits": {"vgit.lge.com": {"rate": 5, "max_concurrency": 2}}
+=============================================================================
+"""
+
+import email.utils
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+# 호스트별 기본값 (http_host_limits로 호스트마다 덮어쓸 수 있음)
+DEFAULT_LIMITS = {
+    "rate": 20.0,                # 초당 요청 수
+    "burst": 40,                 # 토큰 버킷 크기
+    "max_concurrency": 8,        # 동시 요청 상한
+    "initial_concurrency": 4,    # 시작 동시성
+    "max_retries": 3,            # 재시도 횟수 (첫 요청 제외)
+    "backoff_base": 0.5,         # 재시도 대기 기본값 (초), 시도마다 2배
+    "backoff_max": 30.0,         # 재시도 대기 상한 (Retry-After 포함)
+    "failure_threshold": 5,      # 서킷을 여는 연속 실패 수
+    "open_seconds": 30.0,        # 서킷이 열린 채 유지되는 시간
+    "latency_tolerance": 2.0,    # 기준 지연의 몇 배부터 혼잡으로 보고 동시성을 줄일지
+}
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """서킷 브레이커가 열려 요청을 보내지 않고 실패"""
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지는 토큰 버킷"""
+
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def take(self, now):
+        """
+        토큰 하나 사용 (호출자가 잠금 보유)
+
+        Returns:
+            float: 토큰이 없을 때 기다려야 하는 시간 (0이면 바로 사용)
+        """
+        if self.rate <= 0:
+            return 0.0
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class HostLimiter:
+    """한 호스트의 속도/동시성 제한, 서킷 브레이커, 지표"""
+
+    def __init__(self, host, **limits):
+        self.host = host
+        self.settings = dict(DEFAULT_LIMITS, **limits)
+        self.bucket = TokenBucket(self.settings["rate"], self.settings["burst"])
+        self.limit = float(min(self.settings["initial_concurrency"], self.settings["max_concurrency"]))
+        self.in_flight = 0
+        self.blocked_until = 0.0      # Retry-After로 보류된 시각 (monotonic)
+        self.failures = 0             # 연속 실패 수
+        self.open_until = 0.0         # 서킷이 열려 있는 시각 (monotonic)
+        self.probing = False          # 반열림 상태에서 확인 요청이 진행 중인지
+        self.baseline = None          # 기준 지연 (관측한 정상 지연의 하한 근사)
+        self._cond = threading.Condition()
+        self.metrics = {
+            "requests": 0, "retries": 0, "errors": 0, "throttled": 0,
+            "circuit_opened": 0, "rejected": 0,
+            "latency_total": 0.0, "latency_max": 0.0, "peak_in_flight": 0,
+        }
+
+    @property
+    def max_retries(self):
+        return self.settings["max_retries"]
+
+    # =========================================================================
+    # 요청 슬롯
+    # =========================================================================
+
+    def acquire(self):
+        """
+        요청을 보낼 수 있을 때까지 대기 (동시성, Retry-After, 토큰 버킷 순)
+
+        Returns:
+            bool: 반열림 상태의 확인 요청이면 True
+                  (결과를 observe()로 반영하지 못하고 끝나면 end_probe()로 해제해야 함)
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있는 경우
+        """
+        with self._cond:
+            probe = self._check_circuit()
+            try:
+                while self.in_flight >= int(self.limit):
+                    self._cond.wait()
+            except BaseException:
+                self.end_probe(probe)
+                raise
+            self.in_flight += 1
+            self.metrics["peak_in_flight"] = max(self.metrics["peak_in_flight"], self.in_flight)
+
+        try:
+            while True:
+                with self._cond:
+                    now = time.monotonic()
+                    wait = self.blocked_until - now
+                    if wait <= 0:
+                        wait = self.bucket.take(now)
+                    if wait <= 0:
+                        return probe
+                time.sleep(wait)
+        except BaseException:
+            self.release()
+            self.end_probe(probe)
+            raise
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def end_probe(self, probe):
+        """결과 없이 끝난 확인 요청의 표시 해제 (그대로 두면 서킷이 계속 열린 상태로 남음)"""
+        if not probe:
+            return
+        with self._cond:
+            self.probing = False
+            self._cond.notify_all()
+
+    def _check_circuit(self):
+        """
+        열린 서킷이면 즉시 실패, 대기 시간이 지났으면 확인 요청 한 건만 통과 (잠금 보유)
+
+        Returns:
+            bool: 이 요청이 확인 요청이면 True
+        """
+        if self.open_until == 0.0:
+            return False
+        if time.monotonic() < self.open_until or self.probing:
+            self.metrics["rejected"] += 1
+            raise CircuitOpenError(f"{self.host} 서킷 브레이커가 열려 있습니다 (연속 실패 {self.failures}회)")
+        self.probing = True
+        return True
+
+    # =========================================================================
+    # 결과 반영
+    # =========================================================================
+
+    def observe(self, response, elapsed, error=None):
+        """
+        요청 결과를 지표/서킷/동시성에 반영
+
+        Args:
+            response (requests.Response): 응답 (연결 오류면 None)
+            elapsed (float): 소요 시간(초)
+            error (Exception, optional): 요청 오류 (연결/타임아웃/응답 중단 등)
+
+        Returns:
+            float: Retry-After 대기 시간(초), 없으면 None
+        """
+        status = response.status_code if response is not None else None
+        retry_after = retry_after_seconds(response) if status in (429, 503) else None
+
+        with self._cond:
+            m = self.metrics
+            m["requests"] += 1
+            m["latency_total"] += elapsed
+            m["latency_max"] = max(m["latency_max"], elapsed)
+
+            if status == 429:
+                # 서버가 속도 제한을 요청 - 실패로 세지 않고 동시성만 줄임
+                m["throttled"] += 1
+                self._decrease(0.5)
+            elif error is not None or (status is not None and status >= 500):
+                m["errors"] += 1
+                self._decrease(0.5)
+                self.failures += 1
+                if self.probing or self.failures >= self.settings["failure_threshold"]:
+                    if self.open_until == 0.0 or self.probing:
+                        m["circuit_opened"] += 1
+                        print(f"🚧 {self.host}: 연속 실패 {self.failures}회 - "
+                              f"{self.settings['open_seconds']:.0f}초 동안 요청 차단")
+                    self.open_until = time.monotonic() + self.settings["open_seconds"]
+            else:
+                if self.open_until:
+                    print(f"✅ {self.host}: 서킷 브레이커 복구")
+                self.failures = 0
+                self.open_until = 0.0
+                self._adapt(elapsed)
+            self.probing = False
+
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+            self._cond.notify_all()
+        return retry_after
+
+    def _adapt(self, elapsed):
+        """성공한 요청의 지연으로 동시성 조절 (잠금 보유)"""
+        if self.baseline is None or elapsed < self.baseline:
+            self.baseline = elapsed
+        else:
+            # 네트워크 상태가 바뀌어도 기준이 너무 낮게 고정되지 않도록 천천히 따라감
+            self.baseline += (elapsed - self.baseline) * 0.01
+        if elapsed > max(self.baseline * self.settings["latency_tolerance"], 0.05):
+            self._decrease(0.9)
+        else:
+            self.limit = min(float(self.settings["max_concurrency"]), self.limit + 1.0 / self.limit)
+
+    def _decrease(self, factor):
+        self.limit = max(1.0, self.limit * factor)
+
+    def retry_delay(self, attempt, retry_after=None):
+        """재시도 전 대기 시간 (Retry-After 우선, 없으면 지수 백오프 + 지터)"""
+        with self._cond:
+            self.metrics["retries"] += 1
+        if retry_after:
+            return min(retry_after, self.settings["backoff_max"])
+        delay = min(self.settings["backoff_base"] * (2 ** attempt), self.settings["backoff_max"])
+        return random.uniform(delay / 2, delay)
+
+    def snapshot(self):
+        """지표 사본 (평균 지연, 현재 동시성 포함)"""
+        with self._cond:
+            m = dict(self.metrics)
+            m["latency_avg"] = m["latency_total"] / m["requests"] if m["requests"] else 0.0
+            m["concurrency"] = int(self.limit)
+            m["circuit_open"] = self.open_until > time.monotonic()
+            return m
+
+
+def retry_after_seconds(response):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 변환"""
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# =============================================================================
+# 호스트별 레지스트리
+# =============================================================================
+
+_limiters = {}
+_host_limits = {}
+_defaults = dict(DEFAULT_LIMITS)
+_lock = threading.Lock()
+
+
+def host_of(url):
+    return urlparse(url).netloc
+
+
+def for_url(url):
+    """URL의 호스트에 해당하는 제한기 (없으면 생성)"""
+    host = host_of(url)
+    with _lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            hostname = host.split(":")[0]
+            limits = dict(_defaults, **_host_limits.get(host, _host_limits.get(hostname, {})))
+            limiter = _limiters[host] = HostLimiter(host, **limits)
+        return limiter
+
+
+def configure(hosts=None, **defaults):
+    """
+    제한값 설정 (이미 만들어진 제한기는 다시 생성됨)
+
+    Args:
+        hosts (dict, optional): {호스트: {설정 이름: 값}} 호스트별 설정
+        **defaults: 모든 호스트의 기본값 (rate, burst, max_concurrency, max_retries 등)
+    """
+    unknown = set(defaults) - set(DEFAULT_LIMITS)
+    if unknown:
+        raise ValueError(f"알 수 없는 제한 설정입니다: {', '.join(sorted(unknown))}")
+    with _lock:
+        _defaults.update({k: v for k, v in defaults.items() if v is not None})
+        if hosts is not None:
+            _host_limits.clear()
+            _host_limits.update(hosts)
+        _limiters.clear()
+
+
+def configure_from_config(config):
+    """user_config.json의 http_rate_limit/http_burst/http_max_concurrency/http_max_retries/http_host_limits 적용"""
+    if not config:
+        return
+    keys = {"http_rate_limit": "rate", "http_burst": "burst",
+            "http_max_concurrency": "max_concurrency", "http_max_retries": "max_retries"}
+    defaults = {name: config[key] for key, name in keys.items() if key in config}
+    if defaults or "http_host_limits" in config:
+        configure(hosts=config.get("http_host_limits"), **defaults)
+
+
+def reset_metrics():
+    """모든 제한기를 버리고 지표 초기화 (다음 요청부터 새로 집계)"""
+    with _lock:
+        _limiters.clear()
+
+
+def metrics():
+    """호스트별 지표 {host: {...}}"""
+    with _lock:
+        limiters = list(_limiters.values())
+    return {limiter.host: limiter.snapshot() for limiter in limiters}
+
+
+def format_metrics():
+    """호스트별 지표를 로그 줄 목록으로 변환 (요청이 없었으면 빈 목록)"""
+    snapshot = metrics()
+    if not snapshot:
+        return []
+    lines = ["🚦 호스트별 HTTP 지표:"]
+    for host, m in sorted(snapshot.items()):
+        state = " | 🚧 차단 중" if m["circuit_open"] else ""
+        lines.append(f"   - {host}: 요청 {m['requests']}회 (재시도 {m['retries']}, 오류 {m['errors']}, "
+                     f"429 {m['throttled']}, 차단 {m['rejected']}) | 평균 {m['latency_avg'] * 1000:.0f}ms, "
+                     f"최대 {m['latency_max'] * 1000:.0f}ms | 동시성 {m['concurrency']} "
+                     f"(최대 {m['peak_in_flight']}){state}")
+    return lines
+
+
+def print_metrics():
+    """호스트별 지표를 실행 로그에 출력"""
+    for line in format_metrics():
+        print(line)
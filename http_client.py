@@ -0,0 +1,413 @@
+"""
+=============================================================================
+🌐 DAS-WORKLOG 공용 HTTP 요청 계층
+=============================================================================
+
+Jira, Confluence, Gerrit 호출(worklog_extractor)과 JiraUploader가 모두
+이 모듈의 request()/get()/post()를 통해 요청합니다.
+
+📼 녹화/재생 모드 (성능 회귀 테스트용):
+   1. RECORD  : 실제 응답을 JSONL 카세트 파일에 기록 (토큰/비밀번호는 "***"로 치환)
+   2. REPLAY  : 네트워크 없이 카세트의 응답을 돌려줌 (원래 지연 또는 배율 적용)
+
+   설정 방법 (셋 중 하나):
+   - 환경 변수: WORKLOG_HTTP_MODE=record|replay, WORKLOG_HTTP_CASSETTE=log/cassette.jsonl,
+               WORKLOG_HTTP_LATENCY_SCALE=1.0
+   - user_config.json: "http_mode", "http_cassette", "http_latency_scale"
+   - 코드: http_client.configure(mode="replay", cassette="...", latency_scale=0.5)
+
+   재생 시 요청은 (메서드, URL 경로, 쿼리 파라미터)로 매칭하며 호스트/포트는 무시합니다.
+   같은 키의 요청이 여러 번 기록된 경우 기록된 순서대로 돌려줍니다.
+
+🚦 실제 요청은 호스트별 제한기(host_limiter)를 거칩니다 (속도/동시성 제한, 재시도, 서킷 브레이커).
+   get(..., cache=True)로 요청하면 응답 캐시(response_cache)에서 조건부 요청/재사용을 합니다.
+   수집이 끝나면 finish_collection()으로 캐시를 저장하고 호스트 지표/캐시 적중률을 로그에 남깁니다.
+=============================================================================
+"""
+
+import base64
+import datetime as dt
+import json
+import os
+import threading
+import time
+from urllib.parse import urlparse, parse_qsl
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import host_limiter
+import response_cache
+
+MODE_OFF = "off"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+# 카세트에 보존할 응답 헤더 (나머지는 재생에 불필요)
+RECORDED_HEADERS = ["Content-Type", "ETag", "Last-Modified", "Retry-After", "Cache-Control"]
+
+# 값이 그대로 기록되면 안 되는 쿼리 파라미터 이름
+SECRET_PARAM_NAMES = {"token", "access_token", "api_key", "apikey", "password", "os_password"}
+
+SCRUBBED = "***"
+
+# timeout을 지정하지 않은 요청의 기본값 (연결, 읽기) 초
+DEFAULT_TIMEOUT = (10, 60)
+
+# 재시도해도 안전한 메서드와 재시도할 응답 상태
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                requests.exceptions.ChunkedEncodingError)
+
+_session = None
+_session_lock = threading.Lock()
+_recorder = None
+_replayer = None
+_settings = {
+    "mode": os.environ.get("WORKLOG_HTTP_MODE", MODE_OFF) or MODE_OFF,
+    "cassette": os.environ.get("WORKLOG_HTTP_CASSETTE", os.path.join("log", "cassette", "http_cassette.jsonl")),
+    "latency_scale": float(os.environ.get("WORKLOG_HTTP_LATENCY_SCALE", "1.0")),
+}
+
+
+def get_session():
+    """프로세스 공용 requests.Session (연결 재사용)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+        return _session
+
+
+def configure(mode=None, cassette=None, latency_scale=None):
+    """
+    녹화/재생 모드 설정
+
+    Args:
+        mode (str, optional): "off", "record", "replay"
+        cassette (str, optional): 카세트(JSONL) 파일 경로
+        latency_scale (float, optional): 재생 시 기록된 지연에 곱할 배율 (0이면 지연 없음)
+    """
+    global _recorder, _replayer
+    if mode is not None:
+        if mode not in (MODE_OFF, MODE_RECORD, MODE_REPLAY):
+            raise ValueError(f"알 수 없는 HTTP 모드입니다: {mode}")
+        _settings["mode"] = mode
+    if cassette is not None:
+        _settings["cassette"] = cassette
+    if latency_scale is not None:
+        _settings["latency_scale"] = float(latency_scale)
+
+    # 설정이 바뀌면 카세트를 다시 연다
+    _recorder = None
+    _replayer = None
+    if _settings["mode"] != MODE_OFF:
+        print(f"📼 HTTP {_settings['mode']} 모드: {_settings['cassette']} (지연 배율 {_settings['latency_scale']})")
+
+
+def configure_from_config(config):
+    """user_config.json의 http_mode/http_cassette/http_latency_scale 값과 호스트별 제한 설정 적용"""
+    if not config:
+        return
+    host_limiter.configure_from_config(config)
+    response_cache.configure_from_config(config)
+    if any(key in config for key in ("http_mode", "http_cassette", "http_latency_scale")):
+        configure(
+            mode=config.get("http_mode"),
+            cassette=config.get("http_cassette"),
+            latency_scale=config.get("http_latency_scale"),
+        )
+
+
+def current_mode():
+    return _settings["mode"]
+
+
+def finish_collection():
+    """
+    수집 단계 종료 처리: 응답 캐시 색인을 저장하고 호스트 지표/캐시 적중률 로그 줄 반환
+
+    Returns:
+        list: 실행 로그에 남길 줄 목록
+    """
+    response_cache.save()
+    return host_limiter.format_metrics() + response_cache.report_lines()
+
+
+# =============================================================================
+# 요청 함수
+# =============================================================================
+
+def request(method, url, **kwargs):
+    """
+    공용 HTTP 요청 (requests.request와 같은 인자)
+
+    호스트별 제한기(host_limiter)를 거쳐 보내며, 연결 오류/타임아웃/429/5xx는
+    지터가 있는 백오프(또는 Retry-After)로 재시도합니다. timeout을 지정하지 않으면
+    DEFAULT_TIMEOUT을 사용합니다.
+
+    Args:
+        method (str): HTTP 메서드
+        url (str): 요청 URL
+        cache (bool, optional): GET 응답을 response_cache에 저장/재사용 (녹화/재생 모드에서는 무시)
+        validator (str, optional): 리소스 변경 여부를 나타내는 값 (예: 검색 결과의 updated).
+            저장 당시와 같으면 요청 없이 캐시 응답을 돌려줌
+        **kwargs: params, headers, auth, json, data, files, timeout 등
+
+    Returns:
+        requests.Response: 응답 객체 (재생 모드에서는 카세트로, 캐시 적중 시에는 캐시로 만든 응답이며
+            캐시 응답은 from_cache 속성이 True)
+
+    Raises:
+        requests.exceptions.RequestException: 재시도 후에도 연결에 실패한 경우
+            (서킷 브레이커가 열려 있으면 host_limiter.CircuitOpenError)
+    """
+    use_cache = kwargs.pop("cache", False)
+    validator = kwargs.pop("validator", None)
+    mode = _settings["mode"]
+    if mode == MODE_REPLAY:
+        return _get_replayer().replay(method, url, kwargs.get("params"))
+
+    # 녹화 모드에서는 전체 응답을 기록해야 하므로 캐시를 쓰지 않음
+    store = response_cache.get_cache() if use_cache and method.upper() == "GET" and mode == MODE_OFF else None
+    entry = body = None
+    if store is not None:
+        # 재생 키는 호스트를 무시하므로 캐시 키에는 호스트를 덧붙임
+        key = store.make_key(f"{urlparse(url).netloc} {_request_key(method, url, kwargs.get('params'))}",
+                             _credential_of(kwargs))
+        entry, body = store.lookup(key)
+        if entry is not None and validator is not None and entry.get("validator") == validator:
+            store.hit(key, entry, "fresh", len(body))
+            return _build_response(entry["status"], entry.get("headers", {}), body, url, reason="Cached")
+        if entry is not None:
+            kwargs["headers"] = dict(kwargs.get("headers") or {}, **store.conditional_headers(entry))
+
+    response = _send(method, url, kwargs)
+
+    if store is not None:
+        if entry is not None and response.status_code == 304:
+            entry = dict(entry, validator=validator) if validator is not None else entry
+            store.hit(key, entry, "revalidated", len(body))
+            return _build_response(entry["status"], entry.get("headers", {}), body, url, reason="Not Modified")
+        store.miss()
+        if response.status_code == 200:
+            store.store(key, response, validator)
+
+    if mode == MODE_RECORD:
+        _get_recorder().record(method, url, kwargs, response)
+    return response
+
+
+def _send(method, url, kwargs):
+    """제한기를 거쳐 요청 (재시도 포함)"""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    limiter = host_limiter.for_url(url)
+    attempt = 0
+    while True:
+        probe = limiter.acquire()
+        started = time.monotonic()
+        response, error = None, None
+        try:
+            try:
+                response = get_session().request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                # 어떤 요청 오류든 observe()에 반영해야 반열림 상태의 확인 요청이 끝남
+                error = e
+            finally:
+                limiter.release()
+            retry_after = limiter.observe(response, time.monotonic() - started, error)
+        except BaseException:
+            # 요청 오류가 아닌 예외(잘못된 인자, KeyboardInterrupt 등)로 observe()에 이르지 못한 경우
+            limiter.end_probe(probe)
+            raise
+
+        if attempt >= limiter.max_retries or not _should_retry(method, kwargs, response, error, retry_after):
+            break
+        delay = limiter.retry_delay(attempt, retry_after)
+        reason = type(error).__name__ if error is not None else response.status_code
+        print(f"🔁 {limiter.host} {method.upper()} 재시도 {attempt + 1}/{limiter.max_retries} "
+              f"({reason}, {delay:.1f}초 후)")
+        time.sleep(delay)
+        attempt += 1
+
+    if error is not None:
+        raise error
+    return response
+
+
+def _credential_of(kwargs):
+    """캐시 키를 사용자별로 나누기 위한 인증 정보 (해시되어 저장됨)"""
+    headers = kwargs.get("headers") or {}
+    parts = [value for name, value in headers.items() if name.lower() == "authorization"]
+    auth = kwargs.get("auth")
+    if auth is not None:
+        parts.append(f"{getattr(auth, 'username', '')}:{getattr(auth, 'password', '')}")
+    return "\n".join(parts)
+
+
+def _build_response(status, headers, content, url, elapsed=0.0, reason="OK"):
+    """저장된 값으로 requests.Response 구성 (카세트 재생, 캐시 응답 공용)"""
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.encoding = "utf-8"
+    response.url = url
+    response.reason = reason
+    response.elapsed = dt.timedelta(seconds=elapsed)
+    response.from_cache = reason != "Replayed"
+    return response
+
+
+def _should_retry(method, kwargs, response, error, retry_after):
+    """
+    재시도 여부
+
+    GET 등 멱등 요청은 연결 오류/타임아웃/응답 중단/429/5xx에서 재시도합니다. POST는 본문을 다시 보낼 수
+    있고 서버가 처리하지 않았음이 확실한 경우(429, Retry-After가 있는 503)에만 재시도합니다.
+    """
+    if error is not None and not isinstance(error, RETRY_ERRORS):
+        return False  # 잘못된 URL 등 다시 보내도 같은 오류
+    if method.upper() in IDEMPOTENT_METHODS:
+        return error is not None or response.status_code in RETRY_STATUSES
+    if kwargs.get("files") or not isinstance(kwargs.get("data"), (type(None), bytes, str, dict)):
+        return False  # 스트림 본문은 이미 소비되어 다시 보낼 수 없음
+    if error is not None:
+        return False
+    return response.status_code == 429 or (response.status_code == 503 and retry_after is not None)
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+
+# =============================================================================
+# 녹화/재생
+# =============================================================================
+
+def _request_key(method, url, params=None):
+    """재생 매칭 키: (메서드, 경로, 정렬된 쿼리 파라미터) - 호스트/포트는 무시"""
+    parsed = urlparse(url)
+    items = parse_qsl(parsed.query, keep_blank_values=True)
+    if params:
+        source = params.items() if isinstance(params, dict) else params
+        for name, value in source:
+            values = value if isinstance(value, (list, tuple)) else [value]
+            items.extend((name, str(v)) for v in values)
+    items = [(name, SCRUBBED if name.lower() in SECRET_PARAM_NAMES else value) for name, value in items]
+    return f"{method.upper()} {parsed.path}?{json.dumps(sorted(items), ensure_ascii=False)}"
+
+
+def _secrets_from(kwargs):
+    """요청 인자에서 기록하면 안 되는 비밀값(토큰, 비밀번호) 추출"""
+    secrets = []
+    headers = kwargs.get("headers") or {}
+    for name, value in headers.items():
+        if name.lower() in ("authorization", "proxy-authorization", "cookie") and value:
+            secrets.append(value.split(" ", 1)[-1])
+    auth = kwargs.get("auth")
+    if auth is not None and getattr(auth, "password", None):
+        secrets.append(auth.password)
+    # 너무 짧은 값은 일반 텍스트와 겹칠 수 있으므로 치환하지 않음
+    return [s for s in secrets if s and len(s) >= 8]
+
+
+def _scrub(text, secrets):
+    for secret in secrets:
+        text = text.replace(secret, SCRUBBED)
+    return text
+
+
+class _Recorder:
+    """응답을 JSONL 카세트에 한 줄씩 추가"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def record(self, method, url, kwargs, response):
+        secrets = _secrets_from(kwargs)
+        content = response.content or b""
+        try:
+            body, encoding = _scrub(content.decode("utf-8"), secrets), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode("ascii"), "base64"
+
+        entry = {
+            "key": _request_key(method, url, kwargs.get("params")),
+            "method": method.upper(),
+            "url": _scrub(url, secrets),
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            "elapsed": response.elapsed.total_seconds() if response.elapsed else 0.0,
+            "encoding": encoding,
+            "body": body,
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class _Replayer:
+    """카세트에서 응답을 읽어 requests.Response로 재구성"""
+
+    def __init__(self, path, latency_scale):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"HTTP 카세트 파일이 없습니다: {path}")
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._cursor = {}
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries.setdefault(entry["key"], []).append(entry)
+        print(f"📼 HTTP 카세트 로드: {sum(len(v) for v in self._entries.values())}개 응답")
+
+    def replay(self, method, url, params=None):
+        key = _request_key(method, url, params)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise requests.exceptions.ConnectionError(f"카세트에 기록되지 않은 요청입니다: {key}")
+            index = self._cursor.get(key, 0)
+            # 기록된 횟수보다 많이 호출되면 마지막 응답을 반복
+            entry = entries[min(index, len(entries) - 1)]
+            self._cursor[key] = index + 1
+
+        delay = entry.get("elapsed", 0.0) * self.latency_scale
+        if delay > 0:
+            time.sleep(delay)
+
+        if entry.get("encoding") == "base64":
+            content = base64.b64decode(entry["body"])
+        else:
+            content = entry["body"].encode("utf-8")
+        return _build_response(entry["status"], entry.get("headers", {}), content, url,
+                               elapsed=entry.get("elapsed", 0.0), reason="Replayed")
+
+
+def _get_recorder():
+    global _recorder
+    with _session_lock:
+        if _recorder is None:
+            _recorder = _Recorder(_settings["cassette"])
+        return _recorder
+
+
+def _get_replayer():
+    global _replayer
+    with _session_lock:
+        if _replayer is None:
+            _replayer = _Replayer(_settings["cassette"], _settings["latency_scale"])
+        return _replayer
@@ -0,0 +1,166 @@
+"""
+=============================================================================
+🎯 DAS-WORKLOG 마스터 이슈 메타데이터 캐시
+=============================================================================
+
+주간 보고서 서브태스크가 달리는 마스터 이슈(master_jira)의 프로젝트 키와
+서브태스크 목록을 TTL 캐시로 공유합니다.
+
+   - JiraUploader.create_subtask: 프로젝트 키를 매 업로드마다 다시 조회하지 않음
+   - JiraUploader.get_master_and_subtasks: 같은 캐시에서 제외 대상(마스터 + 과거 보고서 서브태스크) 키를 가져옴
+   - worklog_extractor.collect_jira_data: 서브태스크 목록 대신 parent 조건으로 제외 (exclusion_jql)
+     - 서브태스크가 매주 늘어도 JQL 길이가 같고, 검색 전에 마스터를 조회하지 않음
+   - 새 서브태스크를 만들면 캐시에 바로 추가
+
+사용 예:
+   jql += exclusion_jql("CLUSTWORK-16153", excluded_issues)
+=============================================================================
+"""
+
+import threading
+import time
+
+import http_client
+
+# 마스터 이슈 정보 캐시 유지 시간 (초)
+DEFAULT_TTL = 600
+
+
+class TTLCache:
+    """만료 시간이 있는 스레드 안전 캐시"""
+
+    def __init__(self, ttl=DEFAULT_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def update(self, key, function):
+        """
+        만료되지 않은 값을 function(값)의 결과로 교체 (만료 시각은 유지, 없으면 아무것도 하지 않음)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() >= entry[0]:
+                return
+            self._entries[key] = (entry[0], function(entry[1]))
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+_cache = TTLCache()
+
+
+def set_ttl(seconds):
+    """캐시 유지 시간 변경 (user_config.json의 master_issue_cache_ttl)"""
+    _cache.ttl = float(seconds)
+
+
+def issue_key_from(value):
+    """이슈 URL(…/browse/KEY) 또는 키에서 이슈 키만 추출"""
+    if not value:
+        return None
+    return value.rstrip("/").split("/")[-1]
+
+
+def get_master_issue(base_url, token, issue_key, refresh=False):
+    """
+    마스터 이슈의 프로젝트 키와 서브태스크 목록 (TTL 캐시)
+
+    Args:
+        base_url (str): Jira 기본 URL
+        token (str): Jira API 토큰
+        issue_key (str): 마스터 이슈 키
+        refresh (bool): 캐시를 무시하고 다시 조회
+
+    Returns:
+        dict: {"key": str, "project_key": str, "subtasks": [서브태스크 키, ...]}
+
+    Raises:
+        requests.exceptions.RequestException: 조회 실패 시
+    """
+    cache_key = (base_url, issue_key)
+    if not refresh:
+        cached = _cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    headers = {
+        "Accept": "application/json",
+        "Authorization": f"Bearer {token}"
+    }
+    response = http_client.get(f"{base_url}/rest/api/2/issue/{issue_key}", headers=headers,
+                               params={"fields": "project,subtasks"})
+    response.raise_for_status()
+    fields = response.json().get("fields", {})
+
+    master = {
+        "key": issue_key,
+        "project_key": fields.get("project", {}).get("key", ""),
+        "subtasks": [subtask["key"] for subtask in fields.get("subtasks", []) if subtask.get("key")],
+    }
+    _cache.set(cache_key, master)
+    return master
+
+
+def excluded_issue_keys(base_url, token, issue_key):
+    """
+    분석에서 제외할 이슈 키 목록 (마스터 + 서브태스크)
+
+    조회에 실패하면 최소한 마스터 이슈만 제외합니다.
+    """
+    if not issue_key:
+        return []
+    try:
+        master = get_master_issue(base_url, token, issue_key)
+        return [issue_key] + [key for key in master["subtasks"] if key != issue_key]
+    except Exception as e:
+        print(f"⚠️ 마스터 이슈 정보 가져오기 실패: {e}")
+        return [issue_key]
+
+
+def exclusion_jql(master_key=None, excluded_issues=()):
+    """
+    분석 제외 JQL 조건 (마스터와 그 서브태스크는 parent 조건 - 서브태스크 수와 관계없이 같은 길이)
+
+    Args:
+        master_key (str, optional): 마스터 이슈 키
+        excluded_issues (iterable): 따로 지정한 제외 이슈 키 목록
+
+    Returns:
+        str: " AND ..." 형태의 조건 (제외 대상이 없으면 빈 문자열)
+    """
+    clause = ""
+    if master_key:
+        # parent가 없는 이슈는 parent != 비교에서 빠지므로 EMPTY를 함께 허용
+        clause += f" AND (parent is EMPTY OR parent != {master_key}) AND key != {master_key}"
+    others = [key for key in excluded_issues if key != master_key]
+    if others:
+        clause += f" AND key not in ({', '.join(others)})"
+    return clause
+
+
+def remember_subtask(base_url, issue_key, subtask_key):
+    """새로 만든 서브태스크를 캐시된 마스터 정보에 추가 (다른 스레드가 가진 목록은 바꾸지 않고 교체)"""
+    _cache.update((base_url, issue_key), lambda master: (
+        master if subtask_key in master["subtasks"]
+        else dict(master, subtasks=master["subtasks"] + [subtask_key])))
@@ -1,10 +1,91 @@
 import os
 import json
-import requests
+import uuid
+import shutil
+import tempfile
+import zipfile
+import http_client
+import jira_master
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import re  # 추가: Markdown 변환에 사용
 
 
+# 첨부파일 확장자별 MIME 타입
+ATTACHMENT_MIME_TYPES = {
+    '.md': 'text/markdown',
+    '.txt': 'text/plain',
+    '.json': 'application/json',
+    '.ndjson': 'application/x-ndjson',
+    '.gz': 'application/gzip',
+    '.zip': 'application/zip',
+}
+
+# log 파일 동시 업로드 기본 개수
+DEFAULT_UPLOAD_WORKERS = 4
+
+
+def guess_attachment_mime(filename):
+    """파일 확장자로 첨부 MIME 타입 결정"""
+    return ATTACHMENT_MIME_TYPES.get(os.path.splitext(filename)[1].lower(), 'application/octet-stream')
+
+
+class MultipartFileStream:
+    """
+    파일 하나를 multipart/form-data 본문으로 감싸는 읽기 전용 스트림
+
+    파일 내용을 메모리에 올리지 않고 read() 호출 시 디스크에서 조금씩 읽습니다.
+    길이를 미리 계산해 두므로 requests가 Content-Length를 설정해 한 번에 전송합니다.
+    """
+
+    def __init__(self, file_path, filename=None, mime_type=None, field_name="file"):
+        filename = filename or os.path.basename(file_path)
+        mime_type = mime_type or guess_attachment_mime(filename)
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        quoted = filename.replace('"', '%22')
+        self._head = (f'--{boundary}\r\n'
+                      f'Content-Disposition: form-data; name="{field_name}"; filename="{quoted}"\r\n'
+                      f'Content-Type: {mime_type}\r\n\r\n').encode('utf-8')
+        self._tail = f'\r\n--{boundary}--\r\n'.encode('utf-8')
+        self._file = open(file_path, 'rb')
+        self.len = len(self._head) + os.path.getsize(file_path) + len(self._tail)
+        self._stage = 0  # 0: 헤더, 1: 파일, 2: 끝 경계, 3: 완료
+        self._offset = 0
+
+    def __len__(self):
+        return self.len
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.len
+        chunks = []
+        while size > 0 and self._stage < 3:
+            if self._stage == 1:
+                data = self._file.read(size)
+                if not data:
+                    self._stage, self._offset = 2, 0
+                    continue
+            else:
+                part = self._head if self._stage == 0 else self._tail
+                data = part[self._offset:self._offset + size]
+                self._offset += len(data)
+                if self._offset >= len(part):
+                    self._stage, self._offset = self._stage + 1, 0
+            chunks.append(data)
+            size -= len(data)
+        return b"".join(chunks)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
 class JiraUploader:
     """Jira에 서브태스크 생성 및 업로드를 처리하는 클래스"""
     
@@ -20,6 +101,8 @@ class JiraUploader:
         self.username = config["username"]
         self.token = config["jira_token"]
         self.master_jira = config.get("master_jira", "")
+        if "master_issue_cache_ttl" in config:
+            jira_master.set_ttl(config["master_issue_cache_ttl"])
         
         # 마스터 Jira URL에서 이슈 키 추출
         if self.master_jira:
@@ -55,32 +138,10 @@ class JiraUploader:
         if not self.master_issue_key:
             return []
         
-        excluded_issues = [self.master_issue_key]
-        
-        try:
-            headers = {
-                "Accept": "application/json",
-                "Authorization": f"Bearer {self.token}"
-            }
-            
-            # 마스터 이슈 정보 가져오기
-            url = f"{self.base_url}/rest/api/2/issue/{self.master_issue_key}"
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            issue_data = response.json()
-            
-            # 서브태스크 목록 가져오기
-            subtasks = issue_data.get("fields", {}).get("subtasks", [])
-            for subtask in subtasks:
-                excluded_issues.append(subtask["key"])
-            
-            print(f"📋 분석 제외 이슈: {excluded_issues}")
-            return excluded_issues
-            
-        except Exception as e:
-            print(f"⚠️ 마스터 이슈 정보 가져오기 실패: {e}")
-            return [self.master_issue_key]  # 최소한 마스터는 제외
+        # 마스터 이슈 정보는 collect_jira_data와 같은 TTL 캐시를 사용 (실패 시 마스터만 제외)
+        excluded_issues = jira_master.excluded_issue_keys(self.base_url, self.token, self.master_issue_key)
+        print(f"📋 분석 제외 이슈: {excluded_issues}")
+        return excluded_issues
     
     def create_subtask(self, summary, description, attachment_content=None):
         """
@@ -109,13 +170,9 @@ class JiraUploader:
                 "Authorization": f"Bearer {self.token}"
             }
             
-            # 마스터 이슈 정보 가져오기 (프로젝트 정보 필요)
-            master_url = f"{self.base_url}/rest/api/2/issue/{self.master_issue_key}"
-            master_response = requests.get(master_url, headers=headers)
-            master_response.raise_for_status()
-            master_data = master_response.json()
-            
-            project_key = master_data["fields"]["project"]["key"]
+            # 마스터 이슈 정보 가져오기 (프로젝트 정보 필요, TTL 캐시 사용)
+            master = jira_master.get_master_issue(self.base_url, self.token, self.master_issue_key)
+            project_key = master["project_key"]
             
             # 서브태스크 생성 데이터
             subtask_data = {
@@ -139,7 +196,7 @@ class JiraUploader:
             
             # 서브태스크 생성
             create_url = f"{self.base_url}/rest/api/2/issue"
-            response = requests.post(create_url, headers=headers, json=subtask_data)
+            response = http_client.post(create_url, headers=headers, json=subtask_data)
             response.raise_for_status()
             
             result = response.json()
@@ -148,6 +205,9 @@ class JiraUploader:
             
             print(f"✅ Jira 서브태스크 생성 완료: {issue_key}")
             
+            # 다음 수집에서도 새 서브태스크가 제외되도록 캐시에 추가
+            jira_master.remember_subtask(self.base_url, self.master_issue_key, issue_key)
+            
             # 첨부파일이 있으면 추가
             if attachment_content:
                 self.add_attachment(issue_key, attachment_content)
@@ -189,17 +249,7 @@ class JiraUploader:
                 f.write(content)
             
             # Jira에 첨부파일 업로드
-            headers = {
-                "Authorization": f"Bearer {self.token}",
-                "X-Atlassian-Token": "no-check"
-            }
-            
-            url = f"{self.base_url}/rest/api/2/issue/{issue_key}/attachments"
-            
-            with open(temp_file, 'rb') as f:
-                files = {'file': (filename, f, 'text/markdown')}
-                response = requests.post(url, headers=headers, files=files)
-                response.raise_for_status()
+            self.upload_attachment_file(issue_key, temp_file, filename, 'text/markdown')
             
             print(f"📎 첨부파일 업로드 완료: {filename}")
             
@@ -209,14 +259,60 @@ class JiraUploader:
         except Exception as e:
             print(f"⚠️ 첨부파일 업로드 실패: {e}")
     
-    def upload_log_files_and_cleanup(self, issue_key, log_dir="./log"):
+    def upload_attachment_file(self, issue_key, file_path, filename=None, mime_type=None):
+        """
+        디스크의 파일을 스트리밍 방식으로 이슈에 첨부 (파일 내용을 메모리에 읽지 않음)
+        
+        Args:
+            issue_key (str): 이슈 키
+            file_path (str): 업로드할 파일 경로
+            filename (str, optional): 첨부파일 이름 (기본: 파일명)
+            mime_type (str, optional): MIME 타입 (기본: 확장자로 결정)
+        """
+        url = f"{self.base_url}/rest/api/2/issue/{issue_key}/attachments"
+        with MultipartFileStream(file_path, filename, mime_type) as body:
+            headers = {
+                "Authorization": f"Bearer {self.token}",
+                "X-Atlassian-Token": "no-check",
+                "Content-Type": body.content_type
+            }
+            response = http_client.post(url, headers=headers, data=body, timeout=300)
+            response.raise_for_status()
+        return response
+    
+    def bundle_log_files(self, log_files, bundle_path):
+        """
+        log 파일들을 zip 하나로 묶기 (이미 압축된 .gz/.zip은 그대로 저장)
+        
+        Args:
+            log_files (list): 파일 경로 목록
+            bundle_path (str): 생성할 zip 파일 경로
+        """
+        with zipfile.ZipFile(bundle_path, 'w', compression=zipfile.ZIP_DEFLATED) as bundle:
+            for file_path in log_files:
+                name = os.path.basename(file_path)
+                compress_type = zipfile.ZIP_STORED if name.endswith(('.gz', '.zip')) else zipfile.ZIP_DEFLATED
+                bundle.write(file_path, arcname=name, compress_type=compress_type)
+        return bundle_path
+    
+    def upload_log_files_and_cleanup(self, issue_key, log_dir="./log", bundle=None, max_workers=None):
         """
         지정된 디렉토리의 log 파일들을 Jira 이슈에 첨부하고 로컬에서 삭제
         
+        파일은 디스크에서 스트리밍으로 전송하며, 여러 파일은 제한된 개수의 스레드로 동시에 업로드합니다.
+        bundle 모드에서는 모든 파일을 zip 하나로 묶어 첨부 요청 1회로 업로드합니다.
+        
         Args:
             issue_key (str): 이슈 키
             log_dir (str): log 파일이 저장된 디렉토리 경로
+            bundle (bool, optional): zip 묶음 업로드 여부 (기본: user_config.json의 log_upload_bundle)
+            max_workers (int, optional): 동시 업로드 수 (기본: user_config.json의 log_upload_workers)
         """
+        if bundle is None:
+            bundle = self.config.get("log_upload_bundle", False)
+        if max_workers is None:
+            max_workers = self.config.get("log_upload_workers", DEFAULT_UPLOAD_WORKERS)
+        
         print(f"🚀 upload_log_files_and_cleanup 함수 시작")
         print(f"   이슈 키: {issue_key}")
         print(f"   log 디렉토리: {log_dir}")
@@ -239,48 +335,41 @@ class JiraUploader:
             print(f"📂 업로드할 log 파일이 없음: {log_dir}")
             return
         
-        print(f"📎 {len(log_files)}개의 log 파일을 업로드 중...")
-        
         uploaded_files = []
         failed_files = []
         
-        for file_path in log_files:
+        if bundle:
+            # 모든 파일을 zip 하나로 묶어 한 번에 업로드 (묶음 파일은 log 폴더 밖 임시 폴더에 생성)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            bundle_name = f"worklog_logs_{issue_key}_{timestamp}.zip"
+            temp_dir = tempfile.mkdtemp(prefix="worklog_upload_")
             try:
-                filename = os.path.basename(file_path)
-                
-                # 파일 내용 읽기
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Jira에 첨부파일 업로드
-                headers = {
-                    "Authorization": f"Bearer {self.token}",
-                    "X-Atlassian-Token": "no-check"
-                }
-                
-                url = f"{self.base_url}/rest/api/2/issue/{issue_key}/attachments"
-                
-                with open(file_path, 'rb') as f:
-                    # 파일 확장자에 따른 MIME 타입 설정
-                    if filename.endswith('.md'):
-                        mime_type = 'text/markdown'
-                    elif filename.endswith('.txt'):
-                        mime_type = 'text/plain'
-                    elif filename.endswith('.json'):
-                        mime_type = 'application/json'
-                    else:
-                        mime_type = 'application/octet-stream'
-                    
-                    files = {'file': (filename, f, mime_type)}
-                    response = requests.post(url, headers=headers, files=files)
-                    response.raise_for_status()
-                
-                print(f"  ✅ 업로드 완료: {filename}")
-                uploaded_files.append(file_path)
-                
+                bundle_path = self.bundle_log_files(log_files, os.path.join(temp_dir, bundle_name))
+                print(f"📦 {len(log_files)}개의 log 파일을 {bundle_name}로 묶어 업로드 중...")
+                self.upload_attachment_file(issue_key, bundle_path, bundle_name)
+                print(f"  ✅ 업로드 완료: {bundle_name}")
+                uploaded_files = list(log_files)
             except Exception as e:
-                print(f"  ❌ 업로드 실패: {filename} - {e}")
-                failed_files.append(file_path)
+                print(f"  ❌ 업로드 실패: {bundle_name} - {e}")
+                failed_files = list(log_files)
+            finally:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+        else:
+            print(f"📎 {len(log_files)}개의 log 파일을 업로드 중... (동시 {max_workers}개)")
+            
+            with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as executor:
+                futures = {executor.submit(self.upload_attachment_file, issue_key, file_path): file_path
+                           for file_path in log_files}
+                for future in as_completed(futures):
+                    file_path = futures[future]
+                    filename = os.path.basename(file_path)
+                    try:
+                        future.result()
+                        print(f"  ✅ 업로드 완료: {filename}")
+                        uploaded_files.append(file_path)
+                    except Exception as e:
+                        print(f"  ❌ 업로드 실패: {filename} - {e}")
+                        failed_files.append(file_path)
         
         # 업로드 성공한 파일들만 삭제
         for file_path in uploaded_files:
@@ -0,0 +1,119 @@
+"""
+=============================================================================
+🤖 DAS-WORKLOG Azure OpenAI 클라이언트 공유
+=============================================================================
+
+이메일 요약, Jira 이슈 요약, 주간 보고서 생성이 같은 AzureOpenAI 클라이언트
+(= 같은 keep-alive HTTP 연결 풀)를 사용하도록 프로세스 공용으로 보관합니다.
+
+   - 첫 LLM 호출 시점에 생성 (데이터 수집만 할 때는 클라이언트를 만들지 않음)
+   - 엔드포인트/API 키/API 버전이 같으면 LLMProcessor 인스턴스가 달라도 같은 클라이언트 사용
+   - 연결 풀 크기와 타임아웃은 user_config.json에서 조정
+
+설정 (user_config.json, 모두 선택):
+   "llm_pool_size": 10, "llm_timeout": 300, "llm_connect_timeout": 10, "llm_max_retries": 2
+=============================================================================
+"""
+
+import hashlib
+import threading
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 300.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_MAX_RETRIES = 2
+
+_settings = {"pool_size": DEFAULT_POOL_SIZE, "timeout": DEFAULT_TIMEOUT,
+             "connect_timeout": DEFAULT_CONNECT_TIMEOUT, "max_retries": DEFAULT_MAX_RETRIES}
+_clients = {}
+_lock = threading.Lock()
+_stats = {"created": 0, "reused": 0}
+
+
+def _client_key(config):
+    """엔드포인트 + API 버전 + API 키 해시 (키 원문은 보관하지 않음)"""
+    api_key = hashlib.sha256(config["azure_openai_api_key"].encode("utf-8")).hexdigest()
+    return (config["azure_openai_endpoint"], config["azure_openai_api_version"], api_key)
+
+
+def _create_client(config):
+    # openai/httpx 패키지는 첫 LLM 호출에서만 import (수집 전용 실행의 시작 시간 단축)
+    import httpx
+    import openai
+
+    pool_size = max(1, int(_settings["pool_size"]))
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+    timeout = openai.Timeout(float(_settings["timeout"]), connect=float(_settings["connect_timeout"]))
+    return openai.AzureOpenAI(
+        azure_endpoint=config["azure_openai_endpoint"],
+        api_key=config["azure_openai_api_key"],
+        api_version=config["azure_openai_api_version"],
+        max_retries=int(_settings["max_retries"]),
+        timeout=timeout,
+        http_client=openai.DefaultHttpxClient(limits=limits, timeout=timeout),
+    )
+
+
+def get_client(config):
+    """
+    설정에 맞는 공용 AzureOpenAI 클라이언트 (없으면 생성)
+
+    Args:
+        config (dict): azure_openai_endpoint/azure_openai_api_key/azure_openai_api_version 포함 설정
+
+    Returns:
+        AzureOpenAI: 공용 클라이언트
+    """
+    key = _client_key(config)
+    with _lock:
+        client = _clients.get(key)
+        if client is not None:
+            _stats["reused"] += 1
+            return client
+        client = _create_client(config)
+        _clients[key] = client
+        _stats["created"] += 1
+        print(f"🤖 Azure OpenAI 클라이언트 생성 (연결 풀 {_settings['pool_size']}, "
+              f"타임아웃 {_settings['timeout']}초)")
+        return client
+
+
+def close_all():
+    """공용 클라이언트의 연결 풀 정리 (프로그램 종료 시)"""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            print(f"⚠️ Azure OpenAI 클라이언트 종료 실패: {e}")
+
+
+def configure(pool_size=None, timeout=None, connect_timeout=None, max_retries=None):
+    """연결 풀/타임아웃 설정 변경 (값이 바뀌면 기존 클라이언트는 닫고 다음 호출에서 새로 생성)"""
+    changed = False
+    with _lock:
+        for name, value in (("pool_size", pool_size), ("timeout", timeout),
+                            ("connect_timeout", connect_timeout), ("max_retries", max_retries)):
+            if value is not None and _settings[name] != value:
+                _settings[name] = value
+                changed = True
+    if changed:
+        close_all()
+
+
+def configure_from_config(config):
+    """user_config.json의 llm_pool_size/llm_timeout/llm_connect_timeout/llm_max_retries 적용"""
+    if not config:
+        return
+    keys = ("llm_pool_size", "llm_timeout", "llm_connect_timeout", "llm_max_retries")
+    if any(key in config for key in keys):
+        configure(pool_size=config.get("llm_pool_size"), timeout=config.get("llm_timeout"),
+                  connect_timeout=config.get("llm_connect_timeout"), max_retries=config.get("llm_max_retries"))
+
+
+def metrics():
+    """생성/재사용 횟수 (벤치마크/로그용)"""
+    with _lock:
+        return dict(_stats, clients=len(_clients))
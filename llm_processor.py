@@ -1,7 +1,504 @@
 import os
+import datetime
+import hashlib
 import json
+import re
 import sys
-from openai import AzureOpenAI
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import activity_records
+import llm_client
+import report_state
+import report_template
+from disk_cache import JsonCache
+
+
+# =============================================================================
+# 고정 프롬프트 (Azure OpenAI 프롬프트 접두사 캐시용)
+# =============================================================================
+# 요청 앞부분의 토큰이 이전 요청과 바이트 단위로 같으면 서버 측 캐시가 재사용됩니다.
+# 그래서 아래 고정 지침은 항상 메시지 맨 앞에 그대로 두고, 이슈/이메일/사용자별
+# 데이터는 그 뒤에만 붙입니다. (지침 안에 항목별 값을 넣으면 캐시가 깨짐)
+
+SYSTEM_MESSAGE = """당신은 다양한 직군(개발, 영업, 마케팅, PM, 기획, 운영 등)의 업무 활동을 분석하여 전문적인 주간 보고서를 작성하는 전문가입니다. 
+각 직군의 업무 특성을 이해하고, 해당 분야에 적합한 관점과 용어로 보고서를 작성해주세요.
+
+## 핵심 역할
+- 사용자의 다양한 업무 활동(이슈 관리, 협업, 커뮤니케이션 등)을 체계적으로 분석
+- 각 직군별 KPI와 성과 지표를 고려한 맞춤형 보고서 작성
+- 비즈니스 임팩트와 협업 성과를 명확하게 표현
+- 상급자와 동료가 이해하기 쉬운 명확하고 구체적인 한국어로 작성
+
+## 직군별 관점
+- **개발/기술**: 기술적 해결책, 품질, 성능, 아키텍처 관점
+- **영업/세일즈**: 고객 관계, 매출 기여, 영업 기회, 파이프라인 관점  
+- **마케팅**: 브랜드, 캠페인 효과, 고객 인사이트, ROI 관점
+- **PM/기획**: 프로젝트 진행률, 리스크 관리, 이해관계자 조율 관점
+- **운영/지원**: 프로세스 개선, 효율성, 고객 만족도 관점
+
+## 작성 원칙
+1. **맥락 이해**: 사용자의 직군과 업무 특성을 파악하여 적절한 관점 적용
+2. **협업 중시**: 팀워크, 부서간 협업, 커뮤니케이션 성과 강조
+3. **성과 지향**: 정량적 지표와 정성적 성과를 균형있게 표현
+4. **전문성**: 해당 분야의 전문 용어를 적절히 사용하되 이해하기 쉽게 설명
+5. **대화형**: 사용자의 추가 요청이나 수정사항에 맥락을 유지하며 유연하게 응답"""
+
+REPORT_INSTRUCTIONS = """맨 아래에 제공되는 업무 활동 데이터를 분석하여 다양한 직군에서 활용 가능한 체계적이고 상세한 주간 보고서를 작성해주세요.
+
+## 분석 대상 업무 활동
+- **이슈/티켓 관리**: Jira 등을 통한 업무 이슈 처리 및 진행 현황
+- **협업 활동**: Confluence, 코드리뷰, 회의 등을 통한 팀 협업
+- **커뮤니케이션**: 이메일을 통한 대내외 소통 및 업무 조율
+- **문서화/지식공유**: 업무 관련 문서 작성 및 정보 공유
+
+## 작성 세부 지침
+
+### 📊 이슈/업무 분류 기준
+- **완료**: Resolve, Resolved, Close, Closed, "Inquired to Reporter", Done 상태
+- **진행 중**: In Progress, In Review, In Development, Working 등 활성 상태
+- **대기/신규**: Open, New, To Do, Backlog, Pending 상태
+- **본인 관여**: 담당자, 보고자, 워크로그 작성자, 댓글 참여자인 이슈
+
+### 🔍 직군별 맞춤 분석
+1. **개발/기술**: 기술적 해결 과정, 사용 기술스택, 품질 개선사항, 성능 최적화
+2. **영업/세일즈**: 고객 대응, 영업 기회 창출, 제안서/계약 관련 활동, 매출 기여도
+3. **마케팅**: 캠페인 기획/실행, 고객 분석, 브랜드 관리, 성과 측정
+4. **PM/기획**: 프로젝트 관리, 일정 조율, 리스크 대응, 이해관계자 커뮤니케이션
+5. **운영/지원**: 프로세스 개선, 고객 지원, 시스템 운영, 효율성 향상
+
+### 📝 상세 작성 원칙
+1. **구체성**: 추상적 표현 지양, 구체적 수치와 결과 중심 서술
+2. **맥락 제공**: 단순 나열이 아닌 업무 배경과 목적 설명
+3. **영향 분석**: 개인 성과가 팀/조직에 미치는 긍정적 영향 명시
+4. **협업 강조**: 타 부서/팀과의 협력 사항과 소통 성과 부각
+5. **학습 요소**: 새로 배운 점이나 개선한 프로세스 포함
+6. **미래 지향**: 다음 주 계획과 연결되는 연속성 있는 서술
+
+### 📋 품질 기준
+- **완성도**: 각 섹션이 유기적으로 연결되는 일관성 있는 보고서
+- **가독성**: 상급자와 동료가 빠르게 이해할 수 있는 명확한 구조
+- **실용성**: 의사결정에 도움이 되는 실질적이고 유용한 정보 제공
+- **전문성**: 해당 업무 분야의 특성을 반영한 전문적 관점
+
+## 🚀 다양한 직군을 위한 포괄적 주간 보고서 작성
+
+제공되는 모든 업무 활동 데이터를 종합 분석하여 다양한 직군에서 활용할 수 있는 완성도 높은 주간 보고서를 작성해주세요.
+
+### 📊 데이터 활용 우선순위 및 전략
+1. **1차 핵심**: "JIRA 이슈 개별 요약" - LLM이 미리 분석한 상세 내용을 주요 업무 성과로 활용
+2. **2차 중요**: "이메일 요약 데이터" - 대내외 커뮤니케이션 활동과 협업 성과 반영  
+3. **3차 보완**: Gerrit, Confluence 활동 - 기술 검토, 지식 공유, 문서화 기여도 추가
+4. **구조 준수**: 제공된 MD 템플릿을 기반으로 하되 사용자의 직군 특성에 맞게 유연하게 적용
+
+### 🎯 직군별 맞춤 작성 전략
+- **개발/기술**: 코드품질, 아키텍처 개선, 기술 도입, 성능 최적화 관점 강조
+- **영업/세일즈**: 고객 관계 구축, 매출 기여도, 영업 기회 발굴, 시장 피드백 중심
+- **마케팅**: 브랜드 인지도, 캠페인 성과, 고객 인사이트, 시장 반응 분석 관점
+- **PM/기획**: 프로젝트 진행률, 이해관계자 관리, 리스크 대응, 일정 관리 중심
+- **운영/지원**: 프로세스 효율화, 고객 만족도, 시스템 안정성, 업무 개선 관점
+
+### 📝 고품질 보고서 작성 기준
+- **사실 기반**: 제공된 데이터에서만 추출된 사실을 기반으로 작성하며, 추측이나 가정은 절대 포함하지 않음
+- **데이터 중심**: 수집된 Jira 이슈, 이메일, Gerrit, Confluence 데이터만을 활용하여 객관적으로 작성
+- **포괄성**: 모든 직군이 이해할 수 있는 명확하고 전문적인 업무용 한국어 사용
+- **구체성**: 정량적 지표와 구체적 성과를 우선하되 정성적 가치도 명확히 표현
+- **협업성**: 팀워크, 부서간 협력, 외부 이해관계자와의 소통 성과 적극 부각
+- **전략성**: 단순 업무 나열이 아닌 조직 목표와 연결된 전략적 기여도 강조
+- **연속성**: 이전 주 계획 대비 달성도와 다음 주 계획의 논리적 연결성 확보
+
+### 🔗 필수 포함 요소  
+- 주요 Jira 이슈에는 클릭 가능한 링크 포함: [이슈키](http://jira.lge.com/issue/browse/이슈키)
+- 정확한 통계와 진행률 (완료/진행중/신규 건수 등)
+- 협업 파트너와 커뮤니케이션 범위 (사내외 이해관계자)
+- 구체적인 비즈니스 임팩트와 조직 기여도
+- 실현 가능한 다음 주 목표와 예상 리스크
+
+### 📋 품질 검증 체크리스트
+- [ ] **사실 기반 검증**: 작성된 모든 내용이 제공된 데이터에서 확인 가능한 사실인가?
+- [ ] **추측/가정 제거**: 데이터에 없는 내용을 추측하거나 가정하여 작성하지 않았는가?
+- [ ] 해당 직군의 상급자가 읽고 성과를 명확히 인식할 수 있는가?
+- [ ] 동료들이 협업 요청이나 지원이 필요한 부분을 파악할 수 있는가?
+- [ ] 조직의 전략 목표와 개인 업무의 연결고리가 명확한가?
+- [ ] 다음 주 업무 계획이 구체적이고 실행 가능한가?
+
+**중요**: 반드시 수집된 데이터에서 확인 가능한 사실만을 기반으로 작성하고, 추측이나 가정은 절대 포함하지 마세요.
+"""
+
+EMAIL_SUMMARY_INSTRUCTIONS = """맨 아래의 발신 이메일을 비즈니스 커뮤니케이션 관점에서 종합 분석하여 상세한 요약을 작성해주세요.
+
+## 🎯 상세 분석 및 요약 작성
+
+다음 구조로 업무 맥락을 충분히 이해할 수 있는 종합적인 요약을 작성해주세요:
+
+### 📌 [이메일 제목 (70자 이내)]
+
+**🎯 커뮤니케이션 목적 및 배경**
+- [이메일을 보내게 된 배경과 주요 목적]
+- [이전 논의나 히스토리가 있다면 맥락 설명]
+
+**👥 관련 이해관계자**
+- **주 수신자**: [수신자]
+- **참조자**: [참조자, 없으면 "없음"]
+- **관련 부서/팀**: [내용에서 파악 가능한 관련 조직]
+
+**📋 핵심 내용 및 메시지**
+- [주요 메시지 1 - 가장 중요한 전달사항]
+- [주요 메시지 2 - 구체적 요청이나 제안사항]
+- [주요 메시지 3 - 중요한 결정사항이나 업데이트]
+- [추가 세부사항이나 첨부 정보]
+
+**💼 업무 영향 및 가치**
+- **직군별 관점**: [개발/영업/마케팅/PM/운영 등 해당 업무 특성 반영]
+- **비즈니스 임팩트**: [조직이나 프로젝트에 미치는 영향]
+- **우선순위**: 높음/보통/낮음 [내용의 긴급성과 중요도 판단]
+
+**⏰ 후속 조치 및 기대사항**
+- [요청된 액션이나 피드백 사항]
+- [마감일이나 중요 일정]
+- [기대하는 결과나 후속 커뮤니케이션]
+
+### 작성 지침
+- **히스토리 분석**: 이메일 본문 내 이전 대화 내역도 함께 분석하여 전체 맥락 파악
+- **상세 수준**: 6-8줄 정도로 충실하게 작성하여 업무 맥락을 완전히 이해할 수 있도록
+- **실용성**: 상급자나 동료가 해당 커뮤니케이션의 중요도와 후속 조치를 명확히 파악할 수 있도록
+"""
+
+JIRA_ISSUE_INSTRUCTIONS = """맨 아래의 업무 이슈를 다양한 직군 관점에서 분석하여 상세하고 유용한 요약을 작성해주세요.
+
+## 🎯 상세 요약 작성 요구사항
+
+**중요**: 댓글과 워크로그의 모든 내용을 꼼꼼히 분석하여 실제 수행한 활동을 구체적으로 기록해주세요.
+
+다음 구조로 업무 관점에서 상세하고 실용적인 요약을 작성해주세요:
+
+### 📌 [이슈 ID] 이슈 제목 (80자 이내)
+
+**📊 현황 및 진행률**
+- **현재 상태**: [현재 상태] (이전 상태에서 변경사항 포함)
+- **담당 현황**: [담당자] / 우선순위: [우선순위]
+- **진행률**: [댓글과 워크로그 기반으로 예상 진행률 제시]
+
+**🔧 주요 수행 활동 (상세 기록 필수)**
+- [구체적 작업 내용 1 - 댓글이나 워크로그에서 추출한 실제 수행 업무]
+  * 세부 작업: [구체적인 기술적/업무적 세부사항]
+  * 수행 방법: [어떤 방식으로 진행했는지]
+  * 결과물: [산출물이나 성과]
+- [구체적 작업 내용 2 - 해결 과정이나 의사결정 사항]
+  * 문제 분석: [어떤 문제를 어떻게 분석했는지]
+  * 해결 방안: [구체적인 해결 방법이나 대안]
+  * 의사결정: [내린 결정과 그 근거]
+- [구체적 작업 내용 3 - 협업이나 커뮤니케이션 내용]
+  * 협업 대상: [누구와 어떤 목적으로 협업했는지]
+  * 논의 내용: [구체적인 논의 사항과 결론]
+  * 합의 사항: [도출된 합의나 액션 아이템]
+
+**👥 협업 및 소통**
+- [다른 팀원이나 부서와의 협력 사항]
+- [중요한 의사결정이나 합의 사항]
+- [외부 이해관계자와의 커뮤니케이션]
+
+**⚠️ 이슈 및 리스크**
+- [발견된 문제점이나 장애 요소]
+- [해결이 필요한 의존성이나 차단 요인]
+- [예상되는 지연이나 리스크 요소]
+
+**📋 다음 단계 및 계획**
+- [향후 진행 예정인 작업]
+- [필요한 후속 조치나 의사결정]
+- [예상 완료 일정이나 마일스톤]
+
+### 작성 지침
+- **사실 기반**: 댓글과 워크로그에서 확인 가능한 사실만 작성하며, 추측이나 해석은 피함
+- **데이터 충실**: 실제 Jira 이슈에 기록된 내용만을 바탕으로 객관적으로 요약
+- **활동 내역 상세화**: 단순히 "작업했다"가 아닌 구체적으로 "무엇을, 어떻게, 왜" 수행했는지 명시
+  * 기술적 세부사항: 사용한 도구, 방법론, 기술 스택 등
+  * 업무 프로세스: 진행 단계, 검토 과정, 승인 절차 등
+  * 소요 시간/노력: 워크로그 기반 실제 투입 시간과 노력 수준
+- **직군별 관점**: 개발(기술적 세부사항), 영업(고객 영향), 마케팅(브랜드 임팩트), PM(일정/리소스), 운영(프로세스 개선) 등
+- **비즈니스 가치**: 단순 작업 나열이 아닌 조직에 미치는 영향과 가치 중심
+- **상세 수준**: 주요 수행 활동은 10-15줄 정도로 충분히 상세하게 작성 (간략한 요약 지양)
+- **실용성**: 상급자나 동료가 읽었을 때 실제 업무 상황과 기여도를 명확히 이해할 수 있는 수준
+- **맥락 제공**: 각 활동이 전체 프로젝트나 목표에서 차지하는 위치와 중요도 설명
+"""
+
+# =============================================================================
+# 작업별 모델 라우팅
+# =============================================================================
+# 이슈/이메일 개별 요약은 작고 빠른 배포(azure_openai_fast_deployment)로 짧게,
+# 주간 보고서와 후속 대화는 기본 배포(azure_openai_chat_deployment)로 처리합니다.
+#
+# user_config.json (모두 선택):
+#   "azure_openai_fast_deployment": "gpt-4o-mini",
+#   "llm_routes": {"issue": {"deployment": "gpt-4o-mini", "max_completion_tokens": 1500}, ...}
+
+TASK_LABELS = {"issue": "이슈 요약", "email": "이메일 요약", "report": "주간 보고서", "chat": "후속 대화"}
+
+# 개별 요약 작업 (빠른 배포가 설정되어 있으면 그 배포와 아래 출력 상한 사용)
+ITEM_TASK_MAX_TOKENS = {"issue": 1500, "email": 800}
+
+# 기본 배포의 출력 상한 (추론 모델은 추론 토큰도 이 상한에 포함되므로 넉넉하게 둠)
+DEFAULT_MAX_TOKENS = 10000
+
+# =============================================================================
+# 섹션별 보고서 생성
+# =============================================================================
+# 템플릿이 있으면 "## " 섹션마다 필요한 데이터만 넣은 요청을 동시에 보내고 결과를 순서대로 이어 붙입니다.
+#
+# user_config.json (모두 선택):
+#   "llm_section_parallel": true, "llm_section_workers": 4
+# 섹션마다 지침/양식이 반복되므로 입력 토큰 합계는 한 번에 작성할 때보다 늘어남 (대기 시간과 교환)
+
+SECTION_WORKERS = 4
+
+
+def collection_period():
+    """보고 대상 수집 기간 (worklog_extractor의 SINCE ~ NOW_UTC)"""
+    import worklog_extractor  # 수집 모듈의 기간 설정을 그대로 사용 (보고서 작성 시점에만 필요)
+    return f"{worklog_extractor.SINCE:%Y-%m-%d} ~ {worklog_extractor.NOW_UTC:%Y-%m-%d}"
+
+# 이슈 목록/요약된 이슈에 남길 식별 정보 (원본 description/댓글/워크로그 제외)
+JIRA_OVERVIEW_FIELDS = ('issue_key', 'summary', 'status', 'type', 'created', 'updated', 'resolutiondate',
+                        'url', 'comment_count', 'worklog_count')
+
+SECTION_INSTRUCTIONS = """
+## 🧩 섹션 단위 작성
+이 요청에서는 주간 보고서 전체가 아니라 맨 아래의 "이번에 작성할 섹션" 하나만 작성합니다.
+다른 섹션은 별도 요청으로 작성되어 순서대로 이어 붙여지므로 다음을 지켜주세요.
+- 섹션 양식의 제목 줄부터 시작해 그 섹션의 내용만 작성 (다른 섹션, 머리말, 맺음말 없이)
+- 양식의 제목, 표, 항목 구조를 그대로 유지하고 자리표시자([숫자], YYYY 등)는 데이터로 채움
+- 제공된 데이터에 해당 내용이 없으면 "해당 없음"으로 표시
+"""
+
+# =============================================================================
+# 묶음 요약 (패킹)
+# =============================================================================
+# 짧은 이메일/활동이 적은 이슈는 여러 개를 한 요청으로 묶어 지침 블록과 왕복 시간을 한 번만 씁니다.
+# 응답은 "=== ITEM 번호 ===" 구분 줄로 나누어 항목별 결과로 되돌리고, 찾지 못한 항목은 개별 요약합니다.
+#
+# user_config.json (모두 선택):
+#   "llm_pack_budget": 3000      # 한 묶음에 넣을 항목 데이터의 토큰 상한 (0이면 패킹 끔)
+#   "llm_pack_max_items": 6      # 한 묶음의 최대 항목 수
+
+PACK_TOKEN_BUDGET = 3000
+PACK_MAX_ITEMS = 6
+# 이보다 큰 항목은 묶지 않고 개별 요약
+PACK_ITEM_MAX_TOKENS = 800
+# 묶음 요청의 출력 상한 (항목별 상한 × 항목 수를 넘지 않도록)
+PACK_MAX_COMPLETION_TOKENS = 16000
+# 토큰 수 추정용 (한글 위주 텍스트 기준)
+CHARS_PER_TOKEN = 2
+
+PACK_ITEM_MARKER = "=== ITEM {number} ==="
+PACK_ITEM_PATTERN = re.compile(r"^\s*=+\s*ITEM\s+(\d+)\s*=+\s*$", re.MULTILINE)
+
+PACKED_OUTPUT_INSTRUCTIONS = """
+## 📦 묶음 요약 형식
+맨 아래에는 여러 항목이 `=== ITEM 번호 ===` 줄로 구분되어 있습니다. 각 항목을 위 지침에 따라 서로 섞지 말고
+따로 요약하세요. 응답도 같은 구분 줄로 각 항목을 시작하고 항목 순서대로 작성하며, 구분 줄 밖에는
+머리말이나 맺음말을 쓰지 마세요.
+
+=== ITEM 1 ===
+(1번 항목 요약)
+=== ITEM 2 ===
+(2번 항목 요약)
+"""
+
+
+# =============================================================================
+# 구조화 요약 (선택)
+# =============================================================================
+# "llm_structured_summaries": true이면 이슈/이메일 요약을 고정 스키마의 짧은 JSON으로 받고,
+# 주간 보고서 프롬프트에는 원본 대신 이 필드들로 만든 압축 요약만 넣습니다.
+
+# (JSON 키, 보고서 프롬프트에 표시할 이름)
+STRUCTURED_FIELDS = (("status", "상태"), ("actions", "수행"), ("collaborators", "협업"),
+                     ("risks", "리스크"), ("next_steps", "다음 단계"))
+STRUCTURED_TEXT_LIMIT = 150   # 문자열 하나의 최대 길이 (문자)
+STRUCTURED_LIST_LIMIT = 3     # 목록 필드의 최대 항목 수
+
+STRUCTURED_SUMMARY_INSTRUCTIONS = """맨 아래의 업무 항목(Jira 이슈 또는 발신 이메일)을 주간 보고서 작성용으로 짧게 구조화해 요약해주세요.
+
+## 출력 형식
+아래 키를 가진 JSON 객체 하나만 출력하세요 (코드 블록이나 설명 문장 없이).
+{"status": "현재 상태와 진행 상황 한 문장",
+ "actions": ["이번 기간에 실제로 수행한 활동"],
+ "collaborators": ["협업한 사람/팀과 목적"],
+ "risks": ["문제점, 차단 요인, 지연 위험"],
+ "next_steps": ["후속 작업이나 필요한 의사결정"]}
+
+## 작성 지침
+- 각 문자열은 150자 이내, 목록은 최대 3개 (중요한 것부터)
+- 댓글, 워크로그, 본문에서 확인되는 사실만 작성하고 해당 내용이 없으면 빈 목록
+- 담당자, 날짜, 수치 등 구체적인 정보는 가능한 한 유지
+"""
+
+
+def parse_structured_summary(text):
+    """
+    구조화 요약 응답(JSON)을 스키마에 맞게 정리
+    
+    코드 블록이나 앞뒤 문장이 섞여 있어도 첫 "{"부터 마지막 "}"까지를 JSON으로 읽고,
+    문자열 길이와 목록 항목 수를 상한에 맞춰 자릅니다.
+    
+    Returns:
+        dict: {"status": str, "actions": list, ...} - JSON이 아니면 None
+    """
+    text = text or ""
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end <= start:
+        return None
+    try:
+        data = json.loads(text[start:end + 1])
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    
+    def clip(value):
+        value = " ".join(str(value).split())
+        return value if len(value) <= STRUCTURED_TEXT_LIMIT else value[:STRUCTURED_TEXT_LIMIT - 1] + "…"
+    
+    summary = {}
+    for key, _ in STRUCTURED_FIELDS:
+        value = data.get(key)
+        if key == "status":
+            summary[key] = clip(value) if value else ""
+        else:
+            values = value if isinstance(value, list) else [value] if value else []
+            summary[key] = [clip(item) for item in values if item][:STRUCTURED_LIST_LIMIT]
+    return summary
+
+
+def format_structured_summary(summary):
+    """구조화 요약을 보고서 프롬프트용 몇 줄의 텍스트로 변환 (빈 필드는 생략)"""
+    lines = []
+    for key, label in STRUCTURED_FIELDS:
+        value = summary.get(key)
+        if value:
+            lines.append(f"- {label}: {value if isinstance(value, str) else '; '.join(value)}")
+    return "\n".join(lines)
+
+
+def estimate_tokens(text):
+    """문자 수 기반 토큰 수 추정"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def parse_packed_response(response):
+    """
+    묶음 응답을 항목별 요약으로 분리
+    
+    Args:
+        response (str): "=== ITEM 번호 ===" 구분 줄이 포함된 응답
+        
+    Returns:
+        dict: {번호(int): 요약} - 내용이 비어 있는 항목은 제외
+    """
+    sections = {}
+    matches = list(PACK_ITEM_PATTERN.finditer(response or ""))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(response)
+        body = response[match.end():end].strip()
+        if body:
+            sections[int(match.group(1))] = body
+    return sections
+
+# =============================================================================
+# 배치 작업 모드 (선택)
+# =============================================================================
+# 대량/팀 실행에서는 이슈/이메일 요약을 JSONL 배치 작업 하나로 제출하고 완료될 때까지 기다립니다.
+# 제출한 작업은 log/cache/llm_batch_jobs.json에 기록되므로 중간에 창을 닫아도 같은 요청으로
+# 다시 실행하면 새로 제출하지 않고 기존 작업의 결과를 이어서 받습니다.
+# 창을 닫으면(LLMProcessor.stop_requested) 대기만 멈추고 작업과 기록은 그대로 둡니다.
+#
+# user_config.json (모두 선택):
+#   "llm_batch_mode": true,
+#   "azure_openai_batch_deployment": "gpt-4o-mini-batch",   # 없으면 작업별 라우팅 배포 사용
+#   "llm_batch_poll_interval": 30, "llm_batch_timeout": 86400
+
+BATCH_JOBS_FILE = "llm_batch_jobs.json"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL = 30          # 상태 확인 간격 (초)
+BATCH_TIMEOUT = 24 * 60 * 60      # 제출 후 최대 대기 시간 (초)
+BATCH_JOB_TTL = 3 * 24 * 60 * 60  # 이보다 오래된 작업 기록은 정리
+BATCH_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+BATCH_STOP_CHECK_INTERVAL = 0.5   # 대기 중 중단 요청 확인 간격 (초)
+
+# =============================================================================
+# 세션 대화 기록 (후속 대화용)
+# =============================================================================
+# 보고서 생성 후 "2번 섹션을 짧게" 같은 후속 요청이 원본 데이터 프롬프트와 이전 대화를
+# 매번 다시 보내지 않도록, API로 보내는 메시지 수와 길이를 제한합니다.
+#
+# user_config.json (모두 선택):
+#   "llm_memory_recent_turns": 4, "llm_memory_max_compressed": 6
+
+MEMORY_RECENT_TURNS = 4       # 원문 그대로 보낼 최근 메시지 수
+MEMORY_MAX_COMPRESSED = 6     # 앞부분만 남겨 보낼 그 이전 메시지 수 (초과분은 버림)
+MEMORY_CLIP_CHARS = 300       # 압축한 메시지에 남길 문자 수
+
+DATA_PROMPT_NOTE = ("(이전 요청: 워크로그 원본 데이터로 주간 보고서 작성 - 원본 데이터 {chars:,}자는 "
+                    "전송량을 줄이기 위해 생략되었습니다. 가장 최근 보고서 초안을 기준으로 답변해주세요.)")
+
+
+class ConversationMemory:
+    """
+    세션 대화 기록
+    
+    API로 보내는 메시지(messages())는 다음으로 제한되어 세션이 길어져도 요청 크기가 일정합니다.
+       - 시스템 메시지
+       - 원본 데이터 프롬프트: 응답(보고서)을 받은 뒤에는 짧은 안내 문구로 대체
+       - 최근 recent_turns개 메시지 (최신 보고서 초안 포함): 원문 그대로
+       - 그 이전 메시지: 앞부분만 남겨 최대 max_compressed개
+    """
+    
+    def __init__(self, system_message, recent_turns=MEMORY_RECENT_TURNS,
+                 max_compressed=MEMORY_MAX_COMPRESSED, clip_chars=MEMORY_CLIP_CHARS):
+        self.system_message = system_message
+        self.recent_turns = max(2, recent_turns)
+        self.max_compressed = max(0, max_compressed)
+        self.clip_chars = clip_chars
+        self.turns = []  # {"role", "content", "data": 원본 데이터 프롬프트 여부}
+        self.note = None  # 원본 데이터 프롬프트를 대신하는 안내 문구
+    
+    def add(self, role, content, data=False):
+        """
+        메시지 추가
+        
+        Args:
+            role (str): "user" 또는 "assistant"
+            content (str): 메시지 내용
+            data (bool): 원본 데이터 프롬프트 여부 (응답을 받은 뒤 안내 문구로 대체됨)
+        """
+        if role == "assistant":
+            # 응답을 받은 원본 데이터 프롬프트는 더 이상 보내지 않음
+            for turn in self.turns:
+                if turn["data"]:
+                    self.note = DATA_PROMPT_NOTE.format(chars=len(turn["content"]))
+            self.turns = [turn for turn in self.turns if not turn["data"]]
+        self.turns.append({"role": role, "content": content, "data": data})
+        
+        # 보낼 일이 없는 오래된 메시지는 보관하지 않음
+        keep = self.recent_turns + self.max_compressed
+        if len(self.turns) > keep:
+            self.turns = self.turns[-keep:]
+    
+    def _clip(self, content):
+        if len(content) <= self.clip_chars:
+            return content
+        return content[:self.clip_chars] + f"\n...(이전 메시지 {len(content) - self.clip_chars:,}자 생략)"
+    
+    def messages(self):
+        """API로 보낼 메시지 목록"""
+        messages = [{"role": "system", "content": self.system_message}]
+        if self.note:
+            messages.append({"role": "user", "content": self.note})
+        recent_start = len(self.turns) - self.recent_turns
+        for index, turn in enumerate(self.turns):
+            content = turn["content"] if index >= recent_start or turn["data"] else self._clip(turn["content"])
+            messages.append({"role": turn["role"], "content": content})
+        return messages
 
 
 class LLMProcessor:
@@ -15,35 +512,217 @@ class LLMProcessor:
             config (dict): Azure OpenAI 설정 정보
         """
         self.config = config
-        self.client = AzureOpenAI(
-            azure_endpoint=config["azure_openai_endpoint"],
-            api_key=config["azure_openai_api_key"],
-            api_version=config["azure_openai_api_version"],
-        )
         # 대화 히스토리 관리
-        self.conversation_history = []
+        self.memory = None
         self.session_started = False
+        # 누적 토큰 사용량 (cached_tokens: 프롬프트 접두사 캐시에서 처리된 입력 토큰)
+        self.usage = {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0}
+        # 작업별 호출 수/소요 시간/토큰 (라우팅 조정용)
+        self.task_stats = {}
+        # 이슈/이메일 요약을 구조화 JSON으로 받을지 여부
+        self.structured = bool(config.get("llm_structured_summaries"))
+        # 섹션별 동시 생성 시 사용량 누적 보호
+        self._usage_lock = threading.Lock()
+        # 묶음 요약 통계 (requests: 묶음 요청 수, items: 묶음으로 요약된 항목 수, retried: 개별 재시도 항목 수)
+        self.pack_stats = {"requests": 0, "items": 0, "retried": 0}
+        # 증분 모드의 직전 보고서 기록 (load_report_state 호출 전에는 None)
+        self.report_state = None
+        # 실행 체크포인트 (run_checkpoint.RunCheckpoint - 설정하면 항목 요약을 바로 저장하고 재개 시 재사용)
+        self.checkpoint = None
+        # 중단 요청 확인 함수 (예: QThread.isInterruptionRequested) - 배치 작업 대기 중에 확인
+        self.stop_requested = None
+    
+    @property
+    def conversation_history(self):
+        """API로 보낼 현재 세션 메시지 목록 (세션 시작 전에는 빈 목록)"""
+        return self.memory.messages() if self.memory is not None else []
+    
+    @property
+    def client(self):
+        """공용 AzureOpenAI 클라이언트 (첫 LLM 호출 시 생성, 연결 풀을 다른 인스턴스와 공유)"""
+        return llm_client.get_client(self.config)
     
     def start_new_session(self):
         """
         새로운 대화 세션 시작 (이전 대화 히스토리 초기화)
         """
-        self.conversation_history = []
+        # 고정 시스템 메시지를 항상 첫 메시지로 두어 세션의 모든 요청이 같은 접두사로 시작
+        self.memory = ConversationMemory(
+            SYSTEM_MESSAGE,
+            recent_turns=int(self.config.get("llm_memory_recent_turns", MEMORY_RECENT_TURNS)),
+            max_compressed=int(self.config.get("llm_memory_max_compressed", MEMORY_MAX_COMPRESSED)),
+        )
         self.session_started = True
         print("🔄 새로운 LLM 세션이 시작되었습니다. 이전 대화 기록이 초기화되었습니다.")
     
-    def add_to_conversation(self, role, content):
+    def route(self, task):
+        """
+        작업에 사용할 배포와 출력 토큰 상한
+        
+        Args:
+            task (str): "issue", "email", "report", "chat"
+            
+        Returns:
+            tuple: (배포 이름, max_completion_tokens)
+        """
+        deployment = self.config["azure_openai_chat_deployment"]
+        max_tokens = DEFAULT_MAX_TOKENS
+        fast = self.config.get("azure_openai_fast_deployment")
+        if fast and task in ITEM_TASK_MAX_TOKENS:
+            deployment, max_tokens = fast, ITEM_TASK_MAX_TOKENS[task]
+        
+        override = (self.config.get("llm_routes") or {}).get(task) or {}
+        return (override.get("deployment") or deployment,
+                int(override.get("max_completion_tokens") or max_tokens))
+    
+    def complete(self, task, messages, max_tokens=None):
+        """
+        작업에 맞는 배포로 한 번 호출하고 사용량을 기록
+        
+        Args:
+            task (str): "issue", "email", "report", "chat"
+            messages (list): 요청 메시지 목록
+            max_tokens (int, optional): 출력 상한 (없으면 작업별 기본값)
+            
+        Returns:
+            str: 응답 내용
+        """
+        deployment, route_max_tokens = self.route(task)
+        max_tokens = max_tokens or route_max_tokens
+        started = time.perf_counter()
+        completion = self.client.chat.completions.create(
+            model=deployment,
+            messages=messages,
+            max_completion_tokens=max_tokens,
+        )
+        self.record_usage(completion, task, time.perf_counter() - started, deployment)
+        return completion.choices[0].message.content
+    
+    def record_usage(self, completion, task="", elapsed=None, deployment=None):
+        """
+        응답의 토큰 사용량을 누적하고 로그 출력
+        
+        Args:
+            completion: chat.completions.create 응답
+            task (str, optional): 작업 이름 (작업별 통계 키)
+            elapsed (float, optional): 호출 소요 시간(초)
+            deployment (str, optional): 사용한 배포 이름
+        """
+        usage = getattr(completion, "usage", None)
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = (getattr(details, "cached_tokens", 0) or 0) if details is not None else 0
+        prompt_tokens = usage.prompt_tokens or 0
+        completion_tokens = usage.completion_tokens or 0
+        with self._usage_lock:
+            self.usage["calls"] += 1
+            self.usage["prompt_tokens"] += prompt_tokens
+            self.usage["cached_tokens"] += cached
+            self.usage["completion_tokens"] += completion_tokens
+            
+            if task:
+                stats = self.task_stats.setdefault(task, {"calls": 0, "seconds": 0.0, "prompt_tokens": 0,
+                                                          "cached_tokens": 0, "completion_tokens": 0,
+                                                          "deployment": deployment})
+                stats["calls"] += 1
+                stats["seconds"] += elapsed or 0.0
+                stats["prompt_tokens"] += prompt_tokens
+                stats["cached_tokens"] += cached
+                stats["completion_tokens"] += completion_tokens
+                stats["deployment"] = deployment or stats["deployment"]
+        
+        tags = [tag for tag in (TASK_LABELS.get(task, task), deployment) if tag]
+        tags = f" ({', '.join(tags)})" if tags else ""
+        timing = f", {elapsed:.1f}초" if elapsed is not None else ""
+        print(f"🧮 LLM 토큰{tags}: 입력 {prompt_tokens:,} (캐시 {cached:,}), 출력 {completion_tokens:,}{timing}")
+    
+    def usage_lines(self):
+        """누적/작업별 토큰 사용량 요약 로그 줄 목록 (호출이 없었으면 빈 목록)"""
+        u = self.usage
+        state_lines = self.report_state.report_lines() if self.report_state is not None else []
+        if not u["calls"]:
+            return state_lines
+        rate = u["cached_tokens"] / u["prompt_tokens"] * 100 if u["prompt_tokens"] else 0
+        lines = [f"🧮 LLM 사용량: {u['calls']}회 호출, 입력 {u['prompt_tokens']:,} 토큰 "
+                 f"(캐시 적중 {u['cached_tokens']:,} 토큰, {rate:.0f}%), 출력 {u['completion_tokens']:,} 토큰"]
+        for task, t in self.task_stats.items():
+            lines.append(f"   - {TASK_LABELS.get(task, task)} [{t['deployment']}]: {t['calls']}회, "
+                         f"평균 {t['seconds'] / t['calls']:.1f}초, 입력 {t['prompt_tokens']:,} "
+                         f"(캐시 {t['cached_tokens']:,}), 출력 {t['completion_tokens']:,}")
+        p = self.pack_stats
+        if p["requests"]:
+            lines.append(f"   - 묶음 요약: {p['requests']}회 요청으로 {p['items']}개 항목 처리 "
+                         f"(개별 재시도 {p['retried']}개)")
+        return lines + state_lines
+    
+    def load_report_state(self, username, worklog_data, cache_dir=None):
+        """
+        증분 모드 시작: 직전 보고서 기록을 읽고 새 활동 데이터와 비교
+        
+        이후 이슈/이메일 요약과 섹션 작성은 입력이 직전과 같으면 직전 결과를 쓰고,
+        보고서 생성이 끝나면 이번 실행 기록을 저장합니다.
+        
+        Args:
+            username (str): 사용자명
+            worklog_data (dict): 수집된 워크로그 데이터 (요약 전)
+            cache_dir (str, optional): 기록 파일 폴더 (기본 log/cache)
+            
+        Returns:
+            dict: 바뀐 데이터 종류 -> (추가된 항목 수, 빠진 항목 수)
+        """
+        # 배포/지침/구조화 모드가 바뀌면 직전 결과를 재사용하지 않음
+        settings = report_state.fingerprint([
+            self.structured, self.route("issue"), self.route("email"), self.route("report"),
+            SYSTEM_MESSAGE, REPORT_INSTRUCTIONS, SECTION_INSTRUCTIONS,
+            self._item_instructions("issue"), self._item_instructions("email"),
+        ])
+        self.report_state = report_state.ReportState(username, settings, cache_dir=cache_dir)
+        changes = self.report_state.compare(worklog_data)
+        if not self.report_state.previous:
+            print("♻️ 직전 보고서 기록이 없어 전체를 작성합니다.")
+        elif not changes:
+            print("♻️ 직전 보고서 이후 바뀐 활동이 없습니다.")
+        else:
+            for dataset, (added, removed) in changes.items():
+                print(f"♻️ 바뀐 데이터: {dataset} (추가 {added}개, 빠짐 {removed}개)")
+        return changes
+    
+    def _saved_summary(self, task, text):
+        """
+        이미 요약한 같은 내용 항목의 요약 (없으면 None)
+        
+        이번 실행의 체크포인트(재개한 경우)를 먼저 보고, 증분 모드이면 직전 보고서 기록을 봅니다.
+        한쪽에서 찾은 요약은 다른 쪽에도 기록합니다.
+        """
+        if self.checkpoint is not None:
+            saved = self.checkpoint.saved_summary(task, text)
+            if saved is not None:
+                if self.report_state is not None:
+                    self.report_state.remember_summary(task, text, *saved)
+                return saved
+        if self.report_state is not None:
+            saved = self.report_state.saved_summary(task, text)
+            if saved is not None and self.checkpoint is not None:
+                self.checkpoint.remember_summary(task, text, *saved)
+            return saved
+        return None
+    
+    def _remember_summary(self, task, text, summary, structured=None):
+        for store in (self.checkpoint, self.report_state):
+            if store is not None:
+                store.remember_summary(task, text, summary, structured)
+    
+    def add_to_conversation(self, role, content, data=False):
         """
         대화 히스토리에 메시지 추가
         
         Args:
-            role (str): "system", "user", "assistant"
+            role (str): "user", "assistant"
             content (str): 메시지 내용
+            data (bool): 원본 데이터 프롬프트 여부 (보고서 생성 후에는 다시 보내지 않음)
         """
-        self.conversation_history.append({
-            "role": role,
-            "content": content
-        })
+        self.memory.add(role, content, data)
     
     def find_md_file(self, directory_path):
         """
@@ -70,12 +749,18 @@ class LLMProcessor:
             if os.path.exists(templates_dir):
                 search_dirs.append(templates_dir)
             
+            # 검색 디렉토리가 바뀌지 않았으면 이전 검색 결과 사용 (디렉토리를 다시 훑지 않음)
+            cached_path = report_template.cached_lookup(search_dirs)
+            if cached_path:
+                return cached_path
+            
             # 우선순위 파일부터 검색
             for search_dir in search_dirs:
                 for priority_file in priority_files:
                     file_path = os.path.join(search_dir, priority_file)
                     if os.path.exists(file_path):
                         print(f"✅ 주간 보고 템플릿 발견: {file_path}")
+                        report_template.remember_lookup(search_dirs, file_path)
                         return file_path
             
             # 우선순위 파일이 없으면 일반 .md 파일 검색 (readme.md 제외)
@@ -86,6 +771,7 @@ class LLMProcessor:
                             file.lower() not in ['readme.md', 'changelog.md', 'license.md']):
                             file_path = os.path.join(search_dir, file)
                             print(f"📄 MD 파일 발견: {file_path}")
+                            report_template.remember_lookup(search_dirs, file_path)
                             return file_path
             
             print("⚠️ 주간 보고 템플릿 MD 파일을 찾을 수 없습니다.")
@@ -110,6 +796,11 @@ class LLMProcessor:
             if not os.path.exists(md_file_path):
                 raise Exception(f"파일이 존재하지 않습니다: {md_file_path}")
             
+            # 수정 시각이 같으면 이전에 읽은 내용 사용
+            cached_content = report_template.cached_file(md_file_path)
+            if cached_content is not None:
+                return cached_content
+            
             with open(md_file_path, 'r', encoding='utf-8') as file:
                 content = file.read()
                 
@@ -118,6 +809,7 @@ class LLMProcessor:
                 return ""
             
             print(f"✅ MD 파일 읽기 완료 ({len(content)} 문자)")
+            report_template.remember_file(md_file_path, content)
             return content
             
         except UnicodeDecodeError:
@@ -126,6 +818,7 @@ class LLMProcessor:
                 with open(md_file_path, 'r', encoding='cp949') as file:
                     content = file.read()
                 print(f"✅ MD 파일 읽기 완료 (CP949 인코딩, {len(content)} 문자)")
+                report_template.remember_file(md_file_path, content)
                 return content
             except Exception as e:
                 raise Exception(f"파일 읽기 중 인코딩 오류: {e}")
@@ -145,54 +838,42 @@ class LLMProcessor:
             str: LLM이 생성한 요약 내용
         """
         try:
-            # 새 세션이 시작되지 않았다면 자동으로 시작
+            # 새 세션이 시작되지 않았다면 자동으로 시작 (시스템 메시지 포함)
             if not self.session_started:
                 self.start_new_session()
-                
-                # 시스템 메시지 추가 (세션 시작 시 한 번만)
-                system_message = """당신은 다양한 직군(개발, 영업, 마케팅, PM, 기획, 운영 등)의 업무 활동을 분석하여 전문적인 주간 보고서를 작성하는 전문가입니다. 
-                각 직군의 업무 특성을 이해하고, 해당 분야에 적합한 관점과 용어로 보고서를 작성해주세요.
-                
-                ## 핵심 역할
-                - 사용자의 다양한 업무 활동(이슈 관리, 협업, 커뮤니케이션 등)을 체계적으로 분석
-                - 각 직군별 KPI와 성과 지표를 고려한 맞춤형 보고서 작성
-                - 비즈니스 임팩트와 협업 성과를 명확하게 표현
-                - 상급자와 동료가 이해하기 쉬운 명확하고 구체적인 한국어로 작성
-                
-                ## 직군별 관점
-                - **개발/기술**: 기술적 해결책, 품질, 성능, 아키텍처 관점
-                - **영업/세일즈**: 고객 관계, 매출 기여, 영업 기회, 파이프라인 관점  
-                - **마케팅**: 브랜드, 캠페인 효과, 고객 인사이트, ROI 관점
-                - **PM/기획**: 프로젝트 진행률, 리스크 관리, 이해관계자 조율 관점
-                - **운영/지원**: 프로세스 개선, 효율성, 고객 만족도 관점
-                
-                ## 작성 원칙
-                1. **맥락 이해**: 사용자의 직군과 업무 특성을 파악하여 적절한 관점 적용
-                2. **협업 중시**: 팀워크, 부서간 협업, 커뮤니케이션 성과 강조
-                3. **성과 지향**: 정량적 지표와 정성적 성과를 균형있게 표현
-                4. **전문성**: 해당 분야의 전문 용어를 적절히 사용하되 이해하기 쉽게 설명
-                5. **대화형**: 사용자의 추가 요청이나 수정사항에 맥락을 유지하며 유연하게 응답"""
-                
-                self.add_to_conversation("system", system_message)
+            
+            # 템플릿 섹션이 여러 개면 섹션별로 동시에 작성 (실패하면 아래 한 번에 작성하는 방식으로 진행)
+            sections = report_template.parse_template(md_content) if md_content else ()
+            if len(sections) > 1 and self.config.get("llm_section_parallel", True):
+                try:
+                    response = self._generate_by_sections(username, worklog_data, sections)
+                    # 후속 대화는 합쳐진 보고서를 기준으로 진행
+                    self.add_to_conversation("user", f"주간 보고서 작성 요청 (템플릿 섹션 {len(sections)}개를 나누어 작성)")
+                    self.add_to_conversation("assistant", response)
+                    if self.report_state is not None:
+                        self.report_state.save()
+                    return response
+                except Exception as e:
+                    print(f"⚠️ 섹션별 보고서 작성 실패 - 전체를 한 번에 작성합니다: {e}")
+                    if self.report_state is not None:
+                        self.report_state.forget_sections()
             
             # 프롬프트 구성
             prompt_content = self._build_prompt(username, worklog_data, md_content)
             
-            # 사용자 메시지를 히스토리에 추가
-            self.add_to_conversation("user", prompt_content)
+            # 사용자 메시지를 히스토리에 추가 (원본 데이터 프롬프트 - 보고서를 받은 뒤에는 안내 문구로 대체)
+            self.add_to_conversation("user", prompt_content, data=True)
             
-            # Azure OpenAI API 호출 (전체 대화 히스토리 포함)
-            completion = self.client.chat.completions.create(
-                model=self.config["azure_openai_chat_deployment"],
-                messages=self.conversation_history,
-                max_completion_tokens=10000,
-            )
-            
-            response = completion.choices[0].message.content
+            # Azure OpenAI API 호출 (전체 대화 히스토리 포함, 기본 배포)
+            response = self.complete("report", self.conversation_history)
             
             # 어시스턴트 응답을 히스토리에 추가
             self.add_to_conversation("assistant", response)
             
+            # 증분 모드: 이번 요약 기록 저장 (섹션 결과는 섹션별로 작성한 경우에만 남음)
+            if self.report_state is not None:
+                self.report_state.save()
+            
             return response
             
         except Exception as e:
@@ -216,13 +897,7 @@ class LLMProcessor:
             self.add_to_conversation("user", user_message)
             
             # Azure OpenAI API 호출
-            completion = self.client.chat.completions.create(
-                model=self.config["azure_openai_chat_deployment"],
-                messages=self.conversation_history,
-                max_completion_tokens=10000,
-            )
-            
-            response = completion.choices[0].message.content
+            response = self.complete("chat", self.conversation_history)
             
             # 어시스턴트 응답을 히스토리에 추가
             self.add_to_conversation("assistant", response)
@@ -244,151 +919,106 @@ class LLMProcessor:
         Returns:
             str: 구성된 프롬프트
         """
-        # 기본 시스템 프롬프트
-        system_prompt = """아래 수집된 업무 활동 데이터를 분석하여 다양한 직군에서 활용 가능한 체계적이고 상세한 주간 보고서를 작성해주세요.
-
-        ## 분석 대상 업무 활동
-        - **이슈/티켓 관리**: Jira 등을 통한 업무 이슈 처리 및 진행 현황
-        - **협업 활동**: Confluence, 코드리뷰, 회의 등을 통한 팀 협업
-        - **커뮤니케이션**: 이메일을 통한 대내외 소통 및 업무 조율
-        - **문서화/지식공유**: 업무 관련 문서 작성 및 정보 공유
-
-        ## 작성 세부 지침
-
-        ### 📊 이슈/업무 분류 기준
-        - **완료**: Resolve, Resolved, Close, Closed, "Inquired to Reporter", Done 상태
-        - **진행 중**: In Progress, In Review, In Development, Working 등 활성 상태
-        - **대기/신규**: Open, New, To Do, Backlog, Pending 상태
-        - **본인 관여**: 담당자, 보고자, 워크로그 작성자, 댓글 참여자인 이슈
-
-        ### 🔍 직군별 맞춤 분석
-        1. **개발/기술**: 기술적 해결 과정, 사용 기술스택, 품질 개선사항, 성능 최적화
-        2. **영업/세일즈**: 고객 대응, 영업 기회 창출, 제안서/계약 관련 활동, 매출 기여도
-        3. **마케팅**: 캠페인 기획/실행, 고객 분석, 브랜드 관리, 성과 측정
-        4. **PM/기획**: 프로젝트 관리, 일정 조율, 리스크 대응, 이해관계자 커뮤니케이션
-        5. **운영/지원**: 프로세스 개선, 고객 지원, 시스템 운영, 효율성 향상
-
-        ### 📝 상세 작성 원칙
-        1. **구체성**: 추상적 표현 지양, 구체적 수치와 결과 중심 서술
-        2. **맥락 제공**: 단순 나열이 아닌 업무 배경과 목적 설명
-        3. **영향 분석**: 개인 성과가 팀/조직에 미치는 긍정적 영향 명시
-        4. **협업 강조**: 타 부서/팀과의 협력 사항과 소통 성과 부각
-        5. **학습 요소**: 새로 배운 점이나 개선한 프로세스 포함
-        6. **미래 지향**: 다음 주 계획과 연결되는 연속성 있는 서술
-
-        ### 📋 품질 기준
-        - **완성도**: 각 섹션이 유기적으로 연결되는 일관성 있는 보고서
-        - **가독성**: 상급자와 동료가 빠르게 이해할 수 있는 명확한 구조
-        - **실용성**: 의사결정에 도움이 되는 실질적이고 유용한 정보 제공
-        - **전문성**: 해당 업무 분야의 특성을 반영한 전문적 관점
-
-        """
+        # 고정 지침이 맨 앞 (접두사 캐시), 템플릿 → 사용자별 데이터 순으로 뒤에 붙임
+        prompt_parts = [REPORT_INSTRUCTIONS]
         
-        # MD 파일 양식이 있으면 추가
+        # MD 파일 양식이 있으면 추가 (같은 템플릿이면 실행 간에도 접두사가 유지됨)
         if md_content:
-            system_prompt += f"""
-            === 주간 보고 양식 (다음 양식에 맞게 작성해주세요) ===
-            {md_content}
+            prompt_parts.append(f"""
+=== 주간 보고 양식 (다음 양식에 맞게 작성해주세요) ===
+{md_content}
 
-            === 양식 끝 ===
+=== 양식 끝 ===
 
-            위 양식에 맞춰서 아래 워크로그 데이터를 정리해서 주간 보고서를 작성해주세요.
-            """
+위 양식에 맞춰서 아래 워크로그 데이터를 정리해서 주간 보고서를 작성해주세요.
+""")
         
         # 워크로그 데이터 추가
-        prompt_parts = [
-            system_prompt,
+        prompt_parts.extend([
             f"\n=== 워크로그 데이터 ===\n",
-            f"사용자: {username}\n\n"
-        ]
+            f"사용자: {username}\n",
+            f"기간: {collection_period()}\n\n"
+        ])
+        prompt_parts.extend(self._build_data_parts(worklog_data))
+        
+        prompt_parts.append("\n지금 위 데이터를 바탕으로 전문적이고 실용적인 주간 보고서를 작성해주세요.\n")
+        
+        return "".join(prompt_parts)
+    
+    def _build_data_parts(self, worklog_data, sources=report_template.ALL_SOURCES):
+        """
+        보고서 프롬프트의 활동 데이터 부분
+        
+        Args:
+            worklog_data (dict): 워크로그 데이터
+            sources (tuple): 넣을 데이터 종류 (report_template.ALL_SOURCES 중 일부 또는 "jira_overview")
+            
+        Returns:
+            list: 프롬프트 조각 목록
+        """
+        prompt_parts = []
         
         # 개별 Jira 이슈 요약 추가 (최우선)
-        if 'jira_issue_summaries' in worklog_data and worklog_data['jira_issue_summaries']:
+        if 'jira_issue_summaries' in sources and worklog_data.get('jira_issue_summaries'):
             prompt_parts.extend([
                 f"🔍 JIRA 이슈 개별 요약 ({len(worklog_data['jira_issue_summaries'])}개 항목):\n",
                 "=== 각 이슈별 LLM 요약 결과 ===\n"
-            ])
-            
-            for summary_item in worklog_data['jira_issue_summaries']:
-                prompt_parts.append(f"\n{summary_item['summary']}\n")
-            
-            prompt_parts.append("\n=== 개별 요약 끝 ===\n\n")
-        
-        prompt_parts.extend([
-            f"📋 JIRA 활동 데이터 ({len(worklog_data['jira_data'])}개 항목):\n",
-            f"{json.dumps(worklog_data['jira_data'], ensure_ascii=False, indent=2)}\n\n",
-            f"📝 CONFLUENCE 활동 데이터 ({len(worklog_data['confluence_data'])}개 항목):\n",
-            f"{json.dumps(worklog_data['confluence_data'], ensure_ascii=False, indent=2)}\n\n",
-            f"🔍 GERRIT 리뷰 데이터 ({len(worklog_data['gerrit_reviews'])}개 항목):\n",
-            f"{json.dumps(worklog_data['gerrit_reviews'], ensure_ascii=False, indent=2)}\n\n",
-            f"💬 GERRIT 댓글 데이터 ({len(worklog_data['gerrit_comments'])}개 항목):\n",
-            f"{json.dumps(worklog_data['gerrit_comments'], ensure_ascii=False, indent=2)}\n\n"
-        ])
-        
-        # 이메일 요약 데이터 추가 (LLM으로 요약된 경우)
-        if 'email_summaries' in worklog_data and worklog_data['email_summaries']:
-            prompt_parts.extend([
-                f"📧 발송 이메일 요약 데이터 ({len(worklog_data['email_summaries'])}개 항목):\n",
-                f"{json.dumps(worklog_data['email_summaries'], ensure_ascii=False, indent=2)}\n\n"
-            ])
-        # 원시 이메일 데이터 추가 (아직 요약되지 않은 경우)
-        elif 'email_data' in worklog_data and worklog_data['email_data']:
-            prompt_parts.extend([
-                f"📧 원시 이메일 데이터 ({len(worklog_data['email_data'])}개 항목):\n",
-                f"{json.dumps(worklog_data['email_data'], ensure_ascii=False, indent=2)}\n\n"
-            ])
-        
-        prompt_parts.append("""
-## 🚀 다양한 직군을 위한 포괄적 주간 보고서 작성
-
-위에 제공된 모든 업무 활동 데이터를 종합 분석하여 다양한 직군에서 활용할 수 있는 완성도 높은 주간 보고서를 작성해주세요.
-
-### 📊 데이터 활용 우선순위 및 전략
-1. **1차 핵심**: "JIRA 이슈 개별 요약" - LLM이 미리 분석한 상세 내용을 주요 업무 성과로 활용
-2. **2차 중요**: "이메일 요약 데이터" - 대내외 커뮤니케이션 활동과 협업 성과 반영  
-3. **3차 보완**: Gerrit, Confluence 활동 - 기술 검토, 지식 공유, 문서화 기여도 추가
-4. **구조 준수**: 제공된 MD 템플릿을 기반으로 하되 사용자의 직군 특성에 맞게 유연하게 적용
-
-### 🎯 직군별 맞춤 작성 전략
-- **개발/기술**: 코드품질, 아키텍처 개선, 기술 도입, 성능 최적화 관점 강조
-- **영업/세일즈**: 고객 관계 구축, 매출 기여도, 영업 기회 발굴, 시장 피드백 중심
-- **마케팅**: 브랜드 인지도, 캠페인 성과, 고객 인사이트, 시장 반응 분석 관점
-- **PM/기획**: 프로젝트 진행률, 이해관계자 관리, 리스크 대응, 일정 관리 중심
-- **운영/지원**: 프로세스 효율화, 고객 만족도, 시스템 안정성, 업무 개선 관점
-
-### 📝 고품질 보고서 작성 기준
-- **사실 기반**: 제공된 데이터에서만 추출된 사실을 기반으로 작성하며, 추측이나 가정은 절대 포함하지 않음
-- **데이터 중심**: 수집된 Jira 이슈, 이메일, Gerrit, Confluence 데이터만을 활용하여 객관적으로 작성
-- **포괄성**: 모든 직군이 이해할 수 있는 명확하고 전문적인 업무용 한국어 사용
-- **구체성**: 정량적 지표와 구체적 성과를 우선하되 정성적 가치도 명확히 표현
-- **협업성**: 팀워크, 부서간 협력, 외부 이해관계자와의 소통 성과 적극 부각
-- **전략성**: 단순 업무 나열이 아닌 조직 목표와 연결된 전략적 기여도 강조
-- **연속성**: 이전 주 계획 대비 달성도와 다음 주 계획의 논리적 연결성 확보
-
-### 🔗 필수 포함 요소  
-- 주요 Jira 이슈에는 클릭 가능한 링크 포함: [이슈키](http://jira.lge.com/issue/browse/이슈키)
-- 정확한 통계와 진행률 (완료/진행중/신규 건수 등)
-- 협업 파트너와 커뮤니케이션 범위 (사내외 이해관계자)
-- 구체적인 비즈니스 임팩트와 조직 기여도
-- 실현 가능한 다음 주 목표와 예상 리스크
-
-### 📋 품질 검증 체크리스트
-- [ ] **사실 기반 검증**: 작성된 모든 내용이 제공된 데이터에서 확인 가능한 사실인가?
-- [ ] **추측/가정 제거**: 데이터에 없는 내용을 추측하거나 가정하여 작성하지 않았는가?
-- [ ] 해당 직군의 상급자가 읽고 성과를 명확히 인식할 수 있는가?
-- [ ] 동료들이 협업 요청이나 지원이 필요한 부분을 파악할 수 있는가?
-- [ ] 조직의 전략 목표와 개인 업무의 연결고리가 명확한가?
-- [ ] 다음 주 업무 계획이 구체적이고 실행 가능한가?
-
-**중요**: 반드시 수집된 데이터에서 확인 가능한 사실만을 기반으로 작성하고, 추측이나 가정은 절대 포함하지 마세요.
-
-지금 전문적이고 실용적인 주간 보고서를 작성해주세요.
-        """)
+            ])
+            
+            for summary_item in worklog_data['jira_issue_summaries']:
+                if summary_item.get('structured'):
+                    # 구조화 요약에는 이슈 식별 정보가 없으므로 키/제목을 앞에 붙임
+                    original_data = summary_item.get('original_data', {})
+                    prompt_parts.append(f"\n[{summary_item.get('issue_key', '')}] {original_data.get('summary', '')}\n")
+                prompt_parts.append(f"\n{summary_item['summary']}\n")
+            
+            prompt_parts.append("\n=== 개별 요약 끝 ===\n\n")
+        
+        # 구조화 요약 모드: 요약된 이슈/이메일은 원본 대신 식별 정보만 넣음 (요약 필드가 내용을 대신함)
+        jira_data = worklog_data.get('jira_data', [])
+        email_summaries = worklog_data.get('email_summaries')
+        if self.structured:
+            jira_data = self._compact_summarized_issues(jira_data, worklog_data.get('jira_issue_summaries') or [])
+            if email_summaries:
+                email_summaries = [{key: item.get(key) for key in ('subject', 'to', 'date', 'ai_summary')}
+                                   for item in email_summaries]
+        
+        if 'jira_overview' in sources:
+            overview = [{key: issue.get(key) for key in JIRA_OVERVIEW_FIELDS}
+                        for issue in worklog_data.get('jira_data', [])]
+            prompt_parts.extend([
+                f"📋 JIRA 이슈 목록 ({len(overview)}개 항목):\n",
+                f"{activity_records.dumps(overview, internal=False)}\n\n"
+            ])
+        
+        for source, label, records in (
+            ("jira_data", "📋 JIRA 활동 데이터", jira_data),
+            ("confluence_data", "📝 CONFLUENCE 활동 데이터", worklog_data.get('confluence_data', [])),
+            ("gerrit_reviews", "🔍 GERRIT 리뷰 데이터", worklog_data.get('gerrit_reviews', [])),
+            ("gerrit_comments", "💬 GERRIT 댓글 데이터", worklog_data.get('gerrit_comments', [])),
+        ):
+            if source in sources:
+                prompt_parts.extend([
+                    f"{label} ({len(records)}개 항목):\n",
+                    f"{activity_records.dumps(records, internal=False)}\n\n"
+                ])
+        
+        # 이메일 요약 데이터 추가 (LLM으로 요약된 경우)
+        if 'email' in sources and email_summaries:
+            prompt_parts.extend([
+                f"📧 발송 이메일 요약 데이터 ({len(email_summaries)}개 항목):\n",
+                f"{activity_records.dumps(email_summaries, internal=False)}\n\n"
+            ])
+        # 원시 이메일 데이터 추가 (아직 요약되지 않은 경우)
+        elif 'email' in sources and worklog_data.get('email_data'):
+            prompt_parts.extend([
+                f"📧 원시 이메일 데이터 ({len(worklog_data['email_data'])}개 항목):\n",
+                f"{activity_records.dumps(worklog_data['email_data'], internal=False)}\n\n"
+            ])
         
         # Jira 이슈 링크 정보 추가
-        if 'jira_issue_summaries' in worklog_data and worklog_data['jira_issue_summaries']:
+        if 'jira_issue_summaries' in sources and worklog_data.get('jira_issue_summaries'):
             prompt_parts.append("""
-
 **참고용 Jira 이슈 링크들**:
 """)
             for summary_item in worklog_data['jira_issue_summaries']:
@@ -398,8 +1028,91 @@ class LLMProcessor:
                 issue_summary = original_data.get('summary', 'No Summary')
                 prompt_parts.append(f"- [{issue_key}]({issue_url}): {issue_summary}\n")
         
+        return prompt_parts
+    
+    def _build_section_prompt(self, username, worklog_data, section):
+        """
+        템플릿 섹션 하나를 작성하는 프롬프트 (섹션에 필요한 데이터만 포함)
+        
+        Args:
+            username (str): 사용자명
+            worklog_data (dict): 워크로그 데이터
+            section (dict): report_template.parse_template의 섹션
+            
+        Returns:
+            str: 구성된 프롬프트
+        """
+        # 고정 지침 두 개가 맨 앞 (모든 섹션 요청이 같은 접두사), 섹션 양식 → 데이터 순
+        prompt_parts = [REPORT_INSTRUCTIONS, SECTION_INSTRUCTIONS, f"""
+=== 이번에 작성할 섹션 (다음 양식에 맞게 작성해주세요) ===
+{section['text']}
+=== 섹션 끝 ===
+""", f"\n=== 워크로그 데이터 ===\n사용자: {username}\n기간: {collection_period()}\n"
+           f"작성일: {datetime.date.today().isoformat()}\n\n"]
+        sources = section['sources']
+        if 'jira_issue_summaries' in sources and not worklog_data.get('jira_issue_summaries'):
+            # 이슈별 요약이 없으면 Jira 원본 데이터로 대신함
+            sources = sources + ('jira_data',)
+        prompt_parts.extend(self._build_data_parts(worklog_data, sources))
+        prompt_parts.append("\n지금 위 데이터를 바탕으로 이 섹션만 작성해주세요.\n")
         return "".join(prompt_parts)
     
+    def _generate_by_sections(self, username, worklog_data, sections):
+        """
+        템플릿 섹션별 요청을 동시에 보내고 결과를 템플릿 순서대로 이어 붙임
+        
+        Args:
+            username (str): 사용자명
+            worklog_data (dict): 워크로그 데이터
+            sections (tuple): report_template.parse_template 결과
+            
+        Returns:
+            str: 전체 보고서
+        """
+        state = self.report_state
+        
+        def write(section):
+            prompt = self._build_section_prompt(username, worklog_data, section)
+            return self.complete("report", [{"role": "system", "content": SYSTEM_MESSAGE},
+                                            {"role": "user", "content": prompt}])
+        
+        # 증분 모드: 쓰는 데이터가 바뀌지 않은 섹션은 직전 결과를 그대로 사용
+        saved = [state.saved_section(section) if state is not None else None for section in sections]
+        pending = [section for section, text in zip(sections, saved) if text is None]
+        
+        workers = max(1, int(self.config.get("llm_section_workers", SECTION_WORKERS)))
+        reused = f", 직전 결과 재사용 {len(sections) - len(pending)}개" if len(pending) < len(sections) else ""
+        print(f"🧩 템플릿 섹션 {len(pending)}개를 동시에 작성합니다 (동시 요청 {workers}개{reused})...")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            written = list(executor.map(write, pending))
+        # 모든 섹션이 성공한 경우에만 기록 (일부만 기록되면 한 번에 작성한 보고서와 섞임)
+        if state is not None:
+            for section, text in zip(pending, written):
+                state.remember_section(section, text)
+        written = iter(written)
+        parts = [text if text is not None else next(written) for text in saved]
+        return "\n\n".join(part.strip() for part in parts if part) + "\n"
+    
+    def _compact_summarized_issues(self, jira_data, issue_summaries):
+        """
+        구조화 요약이 있는 이슈는 식별 정보만 남긴 목록 (요약이 없는 이슈는 원본 유지)
+        
+        Args:
+            jira_data (list): Jira 활동 데이터
+            issue_summaries (list): jira_issue_summaries
+            
+        Returns:
+            list: 보고서 프롬프트에 넣을 Jira 데이터
+        """
+        summarized = {item.get('issue_key') for item in issue_summaries if item.get('structured')}
+        compact = []
+        for issue in jira_data:
+            if issue.get('issue_key') in summarized:
+                compact.append({key: issue.get(key) for key in JIRA_OVERVIEW_FIELDS})
+            else:
+                compact.append(issue)
+        return compact
+    
     def process_worklog_with_md_file(self, username, worklog_data, directory_path):
         """
         워크로그 데이터와 MD 파일을 함께 처리하여 요약 생성
@@ -457,6 +1170,127 @@ class LLMProcessor:
             
         return result
 
+    def summarize_item(self, task, prompt, system_message=SYSTEM_MESSAGE):
+        """
+        개별 항목 요약 (세션 히스토리를 쓰지 않는 단독 호출)
+        
+        항목마다 [고정 시스템 메시지, 항목 프롬프트]만 보내므로 요청 크기가 항목 수에 따라
+        늘어나지 않고, 앞부분은 모든 항목에서 같아 프롬프트 캐시가 적용됩니다.
+        
+        Args:
+            task (str): "issue" 또는 "email"
+            prompt (str): 항목 프롬프트
+            system_message (str, optional): 시스템 메시지
+            
+        Returns:
+            str: 요약 내용
+        """
+        return self.complete(task, [{"role": "system", "content": system_message},
+                                    {"role": "user", "content": prompt}])
+    
+    def _item_instructions(self, task):
+        """항목 요약 지침 (구조화 모드이면 이슈/이메일 공용 JSON 지침)"""
+        if self.structured:
+            return STRUCTURED_SUMMARY_INSTRUCTIONS
+        return JIRA_ISSUE_INSTRUCTIONS if task == "issue" else EMAIL_SUMMARY_INSTRUCTIONS
+    
+    def _finish_item_summary(self, text):
+        """
+        응답을 요약 결과로 정리
+        
+        Returns:
+            tuple: (보고서에 넣을 요약 텍스트, 구조화 요약 dict 또는 None)
+                   구조화 모드에서 JSON을 읽지 못하면 (None, None)
+        """
+        if not self.structured:
+            return text, None
+        structured = parse_structured_summary(text)
+        if structured is None:
+            return None, None
+        return format_structured_summary(structured), structured
+    
+    def _pack_groups(self, texts):
+        """
+        묶을 수 있는 항목의 인덱스 묶음 목록 (입력 순서 유지, 2개 이상인 묶음만)
+        
+        Args:
+            texts (list): 항목별 데이터 텍스트
+            
+        Returns:
+            list: 인덱스 리스트의 리스트
+        """
+        budget = int(self.config.get("llm_pack_budget", PACK_TOKEN_BUDGET) or 0)
+        max_items = int(self.config.get("llm_pack_max_items", PACK_MAX_ITEMS) or 0)
+        if budget <= 0 or max_items < 2:
+            return []
+        
+        groups, current, used = [], [], 0
+        for index, text in enumerate(texts):
+            tokens = estimate_tokens(text)
+            if tokens > min(PACK_ITEM_MAX_TOKENS, budget):
+                continue
+            if current and (used + tokens > budget or len(current) >= max_items):
+                groups.append(current)
+                current, used = [], 0
+            current.append(index)
+            used += tokens
+        if current:
+            groups.append(current)
+        return [group for group in groups if len(group) > 1]
+    
+    def summarize_packed(self, task, texts, instructions, system_message=SYSTEM_MESSAGE, on_item=None):
+        """
+        작은 항목 여러 개를 한 요청으로 묶어 요약
+        
+        Args:
+            task (str): "issue" 또는 "email"
+            texts (list): 항목별 데이터 텍스트 (지침 제외)
+            instructions (str): 항목 요약 지침
+            system_message (str, optional): 시스템 메시지
+            on_item (callable, optional): 항목 요약을 얻을 때마다 (항목 번호, (요약, 구조화 요약))로 호출
+            
+        Returns:
+            list: 항목별 (요약 텍스트, 구조화 요약 또는 None)
+                  - 이미 요약한 같은 내용 항목(체크포인트, 증분 모드의 직전 기록)은 저장된 요약
+                  - 묶지 않았거나 응답에서 찾지 못한 항목은 None (호출 측에서 개별 요약)
+        """
+        results = [self._saved_summary(task, text) for text in texts]
+        pending = [index for index, result in enumerate(results) if result is None]
+        if on_item is not None:
+            for index, result in enumerate(results):
+                if result is not None:
+                    on_item(index, result)
+        _, item_max_tokens = self.route(task)
+        for group in self._pack_groups([texts[index] for index in pending]):
+            group = [pending[position] for position in group]
+            parts = [instructions, PACKED_OUTPUT_INSTRUCTIONS]
+            for number, index in enumerate(group, 1):
+                parts.append(f"\n{PACK_ITEM_MARKER.format(number=number)}\n{texts[index]}\n")
+            messages = [{"role": "system", "content": system_message},
+                        {"role": "user", "content": "".join(parts)}]
+            max_tokens = min(item_max_tokens * len(group), PACK_MAX_COMPLETION_TOKENS)
+            
+            print(f"📦 {TASK_LABELS.get(task, task)} {len(group)}개 묶음 요청...")
+            try:
+                sections = parse_packed_response(self.complete(task, messages, max_tokens))
+            except Exception as e:
+                print(f"⚠️ 묶음 요약 실패 - 개별 요약으로 재시도합니다: {e}")
+                sections = {}
+            
+            self.pack_stats["requests"] += 1
+            for number, index in enumerate(group, 1):
+                if number in sections:
+                    summary, structured = self._finish_item_summary(sections[number])
+                    results[index] = (summary, structured) if summary is not None else None
+                if results[index] is None:
+                    self.pack_stats["retried"] += 1
+                else:
+                    self.pack_stats["items"] += 1
+                    self._remember_summary(task, texts[index], *results[index])
+                    if on_item is not None:
+                        on_item(index, results[index])
+        return results
+    
     def summarize_jira_issue(self, issue_data):
         """
         개별 Jira 이슈를 LLM으로 요약
@@ -468,16 +1302,27 @@ class LLMProcessor:
             dict: 요약 결과
         """
         try:
+            # 이미 요약한 이슈(재개한 실행의 체크포인트, 증분 모드의 직전 기록)는 저장된 요약 사용
+            text = self._jira_issue_text(issue_data)
+            saved = self._saved_summary("issue", text)
+            if saved is not None:
+                return {"success": True, "issue_key": issue_data.get("issue_key", ""),
+                        "summary": saved[0], "structured": saved[1], "error": None}
+            
             # Jira 이슈 요약용 프롬프트 생성
             prompt = self._build_jira_issue_prompt(issue_data)
             
-            # LLM 요약 요청
-            summary = self.continue_conversation(prompt)
+            # LLM 요약 요청 (대화 히스토리 없이 단독 호출 - 요약 결과는 보고서 프롬프트에 포함됨)
+            response = self.summarize_item("issue", prompt)
+            summary, structured = self._finish_item_summary(response)
+            if summary is not None:
+                self._remember_summary("issue", text, summary, structured)
             
             return {
                 "success": True,
                 "issue_key": issue_data.get("issue_key", ""),
-                "summary": summary,
+                "summary": summary if summary is not None else response,
+                "structured": structured,
                 "error": None
             }
             
@@ -489,93 +1334,199 @@ class LLMProcessor:
                 "error": str(e)
             }
     
-    def summarize_email_batch(self, email_data_list):
+    def summarize_jira_issues(self, issues, on_result=None):
         """
-        이메일 데이터 배열을 배치로 LLM 요약
+        Jira 이슈 여러 개를 요약 (작은 이슈는 묶어서 요청, 묶음에서 빠진 이슈는 개별 요약)
         
         Args:
-            email_data_list (list): 이메일 데이터 배열
+            issues (list): Jira 이슈 상세 정보 목록
+            on_result (callable, optional): 이슈 하나의 요약이 끝날 때마다 (이슈, 결과)로 호출
+                                            (진행 로그용 - 호출 순서는 끝난 순서)
             
         Returns:
-            list: 요약된 이메일 데이터 배열
+            list: 이슈 순서대로 summarize_jira_issue와 같은 형식의 결과
         """
-        summarized_emails = []
+        def packed_result(issue, item):
+            return {"success": True, "issue_key": issue.get("issue_key", ""),
+                    "summary": item[0], "structured": item[1], "error": None}
         
-        try:
-            if not email_data_list:
-                print("📧 요약할 이메일이 없습니다.")
-                return summarized_emails
-            
-            print(f"📧 총 {len(email_data_list)}개의 이메일을 순차적으로 요약합니다...")
-            
-            for i, email_data in enumerate(email_data_list, 1):
-                try:
-                    print(f"[{i}/{len(email_data_list)}] 이메일 요약 중: {email_data.get('subject', 'Unknown')[:50]}...")
-                    
-                    # 개별 이메일 요약
-                    summary_result = self.summarize_single_email(email_data)
-                    
-                    if summary_result['success']:
-                        summarized_emails.append({
-                            'subject': email_data.get('subject', ''),
-                            'to': email_data.get('to', ''),
-                            'date': email_data.get('date', ''),
-                            'ai_summary': summary_result['summary'],
-                            'original_data': email_data
-                        })
-                        print(f"✅ 이메일 요약 완료")
-                    else:
-                        print(f"❌ 이메일 요약 실패: {summary_result['error']}")
-                        # 실패한 경우에도 기본 정보는 포함
-                        summarized_emails.append({
-                            'subject': email_data.get('subject', ''),
-                            'to': email_data.get('to', ''),
-                            'date': email_data.get('date', ''),
-                            'ai_summary': f"요약 실패: {summary_result['error']}",
-                            'original_data': email_data
-                        })
-                        
-                except Exception as e:
-                    print(f"❌ 이메일 요약 중 오류: {e}")
-                    # 오류가 있어도 다른 이메일 계속 처리
-                    continue
-            
-            print(f"🎉 이메일 배치 요약 완료: {len(summarized_emails)}개 성공")
-            return summarized_emails
-            
-        except Exception as e:
-            raise Exception(f"이메일 배치 요약 중 오류: {e}")
+        def on_item(index, item):
+            if on_result is not None:
+                on_result(issues[index], packed_result(issues[index], item))
+        
+        packed = self.summarize_packed("issue", [self._jira_issue_text(issue) for issue in issues],
+                                       self._item_instructions("issue"), on_item=on_item)
+        results = []
+        for issue, item in zip(issues, packed):
+            if item is None:
+                result = self.summarize_jira_issue(issue)
+                if on_result is not None:
+                    on_result(issue, result)
+            else:
+                result = packed_result(issue, item)
+            results.append(result)
+        return results
     
-    def summarize_single_email(self, email_data):
+    def summarize_in_batch(self, issues, emails, progress=None):
         """
-        개별 이메일을 LLM으로 요약
+        이슈/이메일 요약을 배치 작업 하나로 제출하고 결과를 받아 병합
+        
+        배치 결과에 없거나 실패한 항목은 개별 요청으로 다시 요약합니다.
+        이미 요약한 같은 내용 항목(체크포인트, 증분 모드의 직전 기록)은 배치에 넣지 않고 저장된 요약을 사용합니다.
         
         Args:
-            email_data (dict): 이메일 데이터
+            issues (list): Jira 이슈 상세 정보 목록
+            emails (list): 이메일 데이터 목록
+            progress (callable, optional): 진행 상황 로그 함수 (없으면 print)
             
         Returns:
-            dict: 요약 결과
+            tuple: (이슈별 요약 결과 - summarize_jira_issues와 같은 형식,
+                    이메일 요약 목록 - summarize_email_batch와 같은 형식)
         """
-        try:
-            # 이메일 요약용 프롬프트 생성
-            prompt = self._build_email_summary_prompt(email_data)
-            
-            # LLM 요약 요청
-            summary = self.continue_conversation(prompt)
-            
-            return {
-                "success": True,
-                "summary": summary,
-                "error": None
-            }
+        log = progress or print
+        issue_texts = [self._jira_issue_text(issue) for issue in issues]
+        email_texts = [self._email_item_text(email) for email in emails]
+        requests = [(f"issue-{i}", "issue", self._build_jira_issue_prompt(issue)) for i, issue in enumerate(issues)
+                    if self._saved_summary("issue", issue_texts[i]) is None]
+        requests += [(f"email-{i}", "email", self._build_email_summary_prompt(email)) for i, email in enumerate(emails)
+                     if self._saved_summary("email", email_texts[i]) is None]
+        
+        lines = []
+        for custom_id, task, prompt in requests:
+            deployment, max_tokens = self.route(task)
+            body = {"model": self.config.get("azure_openai_batch_deployment") or deployment,
+                    "messages": [{"role": "system", "content": SYSTEM_MESSAGE},
+                                 {"role": "user", "content": prompt}],
+                    "max_completion_tokens": max_tokens}
+            lines.append(json.dumps({"custom_id": custom_id, "method": "POST", "url": "/chat/completions",
+                                     "body": body}, ensure_ascii=False))
+        outputs = self._run_batch_job("\n".join(lines) + "\n", len(lines), log) if lines else {}
+        
+        # 배치 결과가 없는 항목(저장된 요약 재사용 포함)은 summarize_jira_issue/summarize_single_email이 처리
+        issue_results = []
+        for i, issue in enumerate(issues):
+            summary, structured = self._finish_item_summary(outputs.get(f"issue-{i}"))
+            if summary is None:
+                issue_results.append(self.summarize_jira_issue(issue))
+            else:
+                self._remember_summary("issue", issue_texts[i], summary, structured)
+                issue_results.append({"success": True, "issue_key": issue.get("issue_key", ""),
+                                      "summary": summary, "structured": structured, "error": None})
+        
+        email_summaries = []
+        for i, email in enumerate(emails):
+            summary, structured = self._finish_item_summary(outputs.get(f"email-{i}"))
+            if summary is None:
+                result = self.summarize_single_email(email)
+            else:
+                self._remember_summary("email", email_texts[i], summary, structured)
+                result = {"success": True, "summary": summary, "structured": structured, "error": None}
+            email_summaries.append(self._email_summary_entry(email, result))
+        
+        retried = len(requests) - len(outputs)
+        log(f"📦 배치 요약 병합 완료: {len(outputs)}개" + (f" (개별 재요청 {retried}개)" if retried else ""))
+        return issue_results, email_summaries
+    
+    def _run_batch_job(self, jsonl, count, log):
+        """
+        JSONL 배치 작업 제출(또는 이전 작업 재개) 후 완료까지 대기
+        
+        Args:
+            jsonl (str): 요청 JSONL
+            count (int): 요청 수
+            log (callable): 진행 상황 로그 함수
             
-        except Exception as e:
-            return {
-                "success": False,
-                "issue_key": issue_data.get("issue_key", ""),
-                "summary": "",
-                "error": str(e)
-            }
+        Returns:
+            dict: {custom_id: 응답 내용} - 성공한 요청만
+        """
+        jobs = JsonCache(BATCH_JOBS_FILE)
+        for key in jobs.keys():
+            if time.time() - (jobs.get(key) or {}).get("submitted", 0) > BATCH_JOB_TTL:
+                jobs.pop(key)
+        
+        # 같은 엔드포인트 + 같은 요청 내용이면 같은 작업 (창을 닫았다가 다시 실행한 경우 재개)
+        key = hashlib.sha256((self.config["azure_openai_endpoint"] + "\n" + jsonl).encode("utf-8")).hexdigest()
+        job = jobs.get(key)
+        client = self.client
+        if job is None:
+            uploaded = client.files.create(file=("worklog_batch.jsonl", jsonl.encode("utf-8")), purpose="batch")
+            batch = client.batches.create(input_file_id=uploaded.id, endpoint="/chat/completions",
+                                          completion_window=BATCH_COMPLETION_WINDOW)
+            job = {"batch_id": batch.id, "input_file_id": uploaded.id, "status": batch.status,
+                   "submitted": time.time(), "requests": count}
+            jobs.set(key, job)
+            jobs.save()
+            log(f"📤 배치 작업 제출: {batch.id} ({count}개 요청)")
+        else:
+            log(f"🔁 이전에 제출한 배치 작업을 이어서 확인합니다: {job['batch_id']} ({job['status']})")
+        
+        poll_interval = float(self.config.get("llm_batch_poll_interval", BATCH_POLL_INTERVAL))
+        deadline = job["submitted"] + float(self.config.get("llm_batch_timeout", BATCH_TIMEOUT))
+        while True:
+            batch = client.batches.retrieve(job["batch_id"])
+            if batch.status != job["status"]:
+                job["status"] = batch.status
+                jobs.set(key, job)
+                jobs.save()
+                log(f"⏳ 배치 작업 상태: {batch.status}")
+            if batch.status in BATCH_FINAL_STATUSES:
+                break
+            if time.time() > deadline:
+                # 작업 기록은 남겨 다음 실행에서 이어서 확인
+                raise Exception(f"배치 작업이 제한 시간 안에 끝나지 않았습니다: {job['batch_id']} ({batch.status})")
+            if self._wait_unless_stopped(poll_interval):
+                # 작업은 서버에서 계속 진행 - 기록을 남겨 다음 실행에서 같은 작업의 결과를 이어서 받음
+                log(f"⏸️ 배치 작업 대기를 멈춥니다. 다시 실행하면 이어서 확인합니다: {job['batch_id']}")
+                raise Exception(f"배치 작업 대기가 중단되었습니다: {job['batch_id']}")
+        
+        outputs = {}
+        if batch.output_file_id:
+            # 응답 형식 검증/속성 접근용 (openai는 첫 LLM 호출 시점에만 import)
+            from openai.types.chat import ChatCompletion
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                response = item.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                completion = ChatCompletion.model_validate(response["body"])
+                self.record_usage(completion, item["custom_id"].split("-")[0], deployment=completion.model)
+                outputs[item["custom_id"]] = completion.choices[0].message.content
+        if batch.status != "completed":
+            log(f"⚠️ 배치 작업이 {batch.status} 상태로 끝났습니다. 결과가 없는 항목은 개별 요청으로 요약합니다.")
+        
+        jobs.pop(key)
+        jobs.save()
+        return outputs
+    
+    def _wait_unless_stopped(self, seconds):
+        """
+        seconds초 동안 대기 (stop_requested가 설정되어 있으면 짧은 간격으로 중단 요청 확인)
+        
+        Returns:
+            bool: 중단이 요청되었으면 True
+        """
+        deadline = time.monotonic() + seconds
+        while True:
+            if self.stop_requested is not None and self.stop_requested():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, BATCH_STOP_CHECK_INTERVAL))
+    
+    def _email_summary_entry(self, email_data, summary_result):
+        """이메일 요약 목록(email_summaries)의 한 항목 (실패한 경우에도 기본 정보는 포함)"""
+        return {
+            'subject': email_data.get('subject', ''),
+            'to': email_data.get('to', ''),
+            'date': email_data.get('date', ''),
+            'ai_summary': (summary_result['summary'] if summary_result['success']
+                           else f"요약 실패: {summary_result['error']}"),
+            'structured': summary_result.get('structured'),
+            'original_data': email_data
+        }
     
     def summarize_email_batch(self, email_data_list):
         """
@@ -594,34 +1545,29 @@ class LLMProcessor:
                 print("📧 요약할 이메일이 없습니다.")
                 return summarized_emails
             
-            print(f"📧 총 {len(email_data_list)}개의 이메일을 순차적으로 요약합니다...")
+            print(f"📧 총 {len(email_data_list)}개의 이메일을 요약합니다...")
+            
+            # 짧은 이메일은 묶어서 먼저 요약 (묶음에서 빠진 이메일은 아래에서 개별 요약)
+            packed = self.summarize_packed("email", [self._email_item_text(e) for e in email_data_list],
+                                           self._item_instructions("email"))
             
             for i, email_data in enumerate(email_data_list, 1):
                 try:
                     print(f"[{i}/{len(email_data_list)}] 이메일 요약 중: {email_data.get('subject', 'Unknown')[:50]}...")
                     
-                    # 개별 이메일 요약
-                    summary_result = self.summarize_single_email(email_data)
+                    if packed[i - 1] is not None:
+                        summary, structured = packed[i - 1]
+                        summary_result = {"success": True, "summary": summary, "structured": structured,
+                                          "error": None}
+                    else:
+                        # 개별 이메일 요약
+                        summary_result = self.summarize_single_email(email_data)
                     
+                    summarized_emails.append(self._email_summary_entry(email_data, summary_result))
                     if summary_result['success']:
-                        summarized_emails.append({
-                            'subject': email_data.get('subject', ''),
-                            'to': email_data.get('to', ''),
-                            'date': email_data.get('date', ''),
-                            'ai_summary': summary_result['summary'],
-                            'original_data': email_data
-                        })
                         print(f"✅ 이메일 요약 완료")
                     else:
                         print(f"❌ 이메일 요약 실패: {summary_result['error']}")
-                        # 실패한 경우에도 기본 정보는 포함
-                        summarized_emails.append({
-                            'subject': email_data.get('subject', ''),
-                            'to': email_data.get('to', ''),
-                            'date': email_data.get('date', ''),
-                            'ai_summary': f"요약 실패: {summary_result['error']}",
-                            'original_data': email_data
-                        })
                         
                 except Exception as e:
                     print(f"❌ 이메일 요약 중 오류: {e}")
@@ -645,15 +1591,25 @@ class LLMProcessor:
             dict: 요약 결과
         """
         try:
+            # 이미 요약한 이메일(재개한 실행의 체크포인트, 증분 모드의 직전 기록)은 저장된 요약 사용
+            text = self._email_item_text(email_data)
+            saved = self._saved_summary("email", text)
+            if saved is not None:
+                return {"success": True, "summary": saved[0], "structured": saved[1], "error": None}
+            
             # 이메일 요약용 프롬프트 생성
             prompt = self._build_email_summary_prompt(email_data)
             
-            # LLM 요약 요청
-            summary = self.continue_conversation(prompt)
+            # LLM 요약 요청 (대화 히스토리 없이 단독 호출)
+            response = self.summarize_item("email", prompt)
+            summary, structured = self._finish_item_summary(response)
+            if summary is not None:
+                self._remember_summary("email", text, summary, structured)
             
             return {
                 "success": True,
-                "summary": summary,
+                "summary": summary if summary is not None else response,
+                "structured": structured,
                 "error": None
             }
             
@@ -674,55 +1630,23 @@ class LLMProcessor:
         Returns:
             str: 프롬프트 문자열
         """
-        prompt = f"""다음 발신 이메일을 비즈니스 커뮤니케이션 관점에서 종합 분석하여 상세한 요약을 작성해주세요.
+        # 고정 지침이 맨 앞, 이메일별 데이터는 맨 뒤 (접두사 캐시)
+        return self._item_instructions("email") + self._email_item_text(email_data)
+    
+    def _email_item_text(self, email_data):
+        """이메일 요약 프롬프트의 이메일별 데이터 부분 (단독/묶음 요청 공용)"""
+        return f"""
+## 📧 분석할 이메일
 
-## 📧 이메일 기본 정보
+### 이메일 기본 정보
 - **제목**: {email_data.get('subject', 'N/A')}
 - **수신자**: {email_data.get('to', 'N/A')}
 - **참조 (CC)**: {email_data.get('cc', 'N/A') if email_data.get('cc') else '없음'}
 - **발송 일시**: {email_data.get('date', 'N/A')}
 - **첨부파일**: {len(email_data.get('attachments', []))}개
 
-## 📄 이메일 전체 내용 (히스토리 포함)
-{email_data.get('body_clean', '본문 없음')[:3000]}
-
-## 🎯 상세 분석 및 요약 작성
-
-다음 구조로 업무 맥락을 충분히 이해할 수 있는 종합적인 요약을 작성해주세요:
-
-### 📌 [{email_data.get('subject', 'N/A')[:70]}...]
-
-**🎯 커뮤니케이션 목적 및 배경**
-- [이메일을 보내게 된 배경과 주요 목적]
-- [이전 논의나 히스토리가 있다면 맥락 설명]
-
-**👥 관련 이해관계자**
-- **주 수신자**: {email_data.get('to', 'N/A')[:120]}
-- **참조자**: {email_data.get('cc', 'N/A')[:120] if email_data.get('cc') else '없음'}
-- **관련 부서/팀**: [내용에서 파악 가능한 관련 조직]
-
-**📋 핵심 내용 및 메시지**
-- [주요 메시지 1 - 가장 중요한 전달사항]
-- [주요 메시지 2 - 구체적 요청이나 제안사항]
-- [주요 메시지 3 - 중요한 결정사항이나 업데이트]
-- [추가 세부사항이나 첨부 정보]
-
-**💼 업무 영향 및 가치**
-- **직군별 관점**: [개발/영업/마케팅/PM/운영 등 해당 업무 특성 반영]
-- **비즈니스 임팩트**: [조직이나 프로젝트에 미치는 영향]
-- **우선순위**: 높음/보통/낮음 [내용의 긴급성과 중요도 판단]
-
-**⏰ 후속 조치 및 기대사항**
-- [요청된 액션이나 피드백 사항]
-- [마감일이나 중요 일정]
-- [기대하는 결과나 후속 커뮤니케이션]
-
-### 작성 지침
-- **히스토리 분석**: 이메일 본문 내 이전 대화 내역도 함께 분석하여 전체 맥락 파악
-- **상세 수준**: 6-8줄 정도로 충실하게 작성하여 업무 맥락을 완전히 이해할 수 있도록
-- **실용성**: 상급자나 동료가 해당 커뮤니케이션의 중요도와 후속 조치를 명확히 파악할 수 있도록"""
-        
-        return prompt
+### 이메일 전체 내용 (히스토리 포함)
+{email_data.get('body_clean', '본문 없음')[:3000]}"""
 
     def _build_jira_issue_prompt(self, issue_data):
         """
@@ -734,8 +1658,12 @@ class LLMProcessor:
         Returns:
             str: 프롬프트 문자열
         """
-        prompt = f"""다음 업무 이슈를 다양한 직군 관점에서 분석하여 상세하고 유용한 요약을 작성해주세요.
-
+        # 고정 지침이 맨 앞, 이슈별 데이터는 맨 뒤 (접두사 캐시)
+        return self._item_instructions("issue") + self._jira_issue_text(issue_data)
+    
+    def _jira_issue_text(self, issue_data):
+        """Jira 이슈 요약 프롬프트의 이슈별 데이터 부분 (단독/묶음 요청 공용)"""
+        prompt = f"""
 ## 📋 이슈 기본 정보
 - **이슈 ID**: {issue_data.get('issue_key', 'N/A')}
 - **제목**: {issue_data.get('summary', 'N/A')}
@@ -779,63 +1707,6 @@ class LLMProcessor:
                 prompt += f"""
 - {attachment.get('filename', 'N/A')} (작성자: {attachment.get('author', 'Unknown')}, 날짜: {attachment.get('created', 'N/A')})"""
         
-        prompt += """
-
-## 🎯 상세 요약 작성 요구사항
-
-**중요**: 댓글과 워크로그의 모든 내용을 꼼꼼히 분석하여 실제 수행한 활동을 구체적으로 기록해주세요.
-
-다음 구조로 업무 관점에서 상세하고 실용적인 요약을 작성해주세요:
-
-### 📌 [{issue_data.get('issue_key', 'N/A')}] {issue_data.get('summary', 'N/A')[:80]}
-
-**📊 현황 및 진행률**
-- **현재 상태**: {issue_data.get('status', 'N/A')} (이전 상태에서 변경사항 포함)
-- **담당 현황**: {issue_data.get('assignee', 'N/A')} / 우선순위: {issue_data.get('priority', 'N/A')}
-- **진행률**: [댓글과 워크로그 기반으로 예상 진행률 제시]
-
-**🔧 주요 수행 활동 (상세 기록 필수)**
-- [구체적 작업 내용 1 - 댓글이나 워크로그에서 추출한 실제 수행 업무]
-  * 세부 작업: [구체적인 기술적/업무적 세부사항]
-  * 수행 방법: [어떤 방식으로 진행했는지]
-  * 결과물: [산출물이나 성과]
-- [구체적 작업 내용 2 - 해결 과정이나 의사결정 사항]
-  * 문제 분석: [어떤 문제를 어떻게 분석했는지]
-  * 해결 방안: [구체적인 해결 방법이나 대안]
-  * 의사결정: [내린 결정과 그 근거]
-- [구체적 작업 내용 3 - 협업이나 커뮤니케이션 내용]
-  * 협업 대상: [누구와 어떤 목적으로 협업했는지]
-  * 논의 내용: [구체적인 논의 사항과 결론]
-  * 합의 사항: [도출된 합의나 액션 아이템]
-
-**👥 협업 및 소통**
-- [다른 팀원이나 부서와의 협력 사항]
-- [중요한 의사결정이나 합의 사항]
-- [외부 이해관계자와의 커뮤니케이션]
-
-**⚠️ 이슈 및 리스크**
-- [발견된 문제점이나 장애 요소]
-- [해결이 필요한 의존성이나 차단 요인]
-- [예상되는 지연이나 리스크 요소]
-
-**📋 다음 단계 및 계획**
-- [향후 진행 예정인 작업]
-- [필요한 후속 조치나 의사결정]
-- [예상 완료 일정이나 마일스톤]
-
-### 작성 지침
-- **사실 기반**: 댓글과 워크로그에서 확인 가능한 사실만 작성하며, 추측이나 해석은 피함
-- **데이터 충실**: 실제 Jira 이슈에 기록된 내용만을 바탕으로 객관적으로 요약
-- **활동 내역 상세화**: 단순히 "작업했다"가 아닌 구체적으로 "무엇을, 어떻게, 왜" 수행했는지 명시
-  * 기술적 세부사항: 사용한 도구, 방법론, 기술 스택 등
-  * 업무 프로세스: 진행 단계, 검토 과정, 승인 절차 등
-  * 소요 시간/노력: 워크로그 기반 실제 투입 시간과 노력 수준
-- **직군별 관점**: 개발(기술적 세부사항), 영업(고객 영향), 마케팅(브랜드 임팩트), PM(일정/리소스), 운영(프로세스 개선) 등
-- **비즈니스 가치**: 단순 작업 나열이 아닌 조직에 미치는 영향과 가치 중심
-- **상세 수준**: 주요 수행 활동은 10-15줄 정도로 충분히 상세하게 작성 (간략한 요약 지양)
-- **실용성**: 상급자나 동료가 읽었을 때 실제 업무 상황과 기여도를 명확히 이해할 수 있는 수준
-- **맥락 제공**: 각 활동이 전체 프로젝트나 목표에서 차지하는 위치와 중요도 설명"""
-        
         return prompt
 
 
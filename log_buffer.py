@@ -0,0 +1,95 @@
+"""
+=============================================================================
+📜 DAS-WORKLOG GUI 로그 버퍼
+=============================================================================
+
+작업 스레드가 보내는 로그 메시지를 바로 화면에 붙이지 않고 모아 두었다가
+MyApp의 타이머가 주기적으로 한 번에 꺼내 로그 창에 붙이도록 합니다.
+
+   - 메시지마다 위젯을 갱신하지 않으므로 이슈/댓글 단위 로그가 수천 줄이어도 화면이 멈추지 않음
+   - 화면에는 최근 max_lines줄만 유지 (대기 중인 메시지도 같은 상한)
+   - 전체 로그는 log/gui/worklog_YYYYMMDD_HHMMSS.log에 그대로 기록 (최근 keep개 파일만 보관)
+     (log/ 바로 아래 파일은 Jira 첨부 후 삭제되므로 하위 폴더에 기록)
+
+설정 (user_config.json, 모두 선택):
+   "gui_log_flush_ms": 100, "gui_log_max_lines": 5000
+=============================================================================
+"""
+
+import collections
+import glob
+import os
+from datetime import datetime
+
+LOG_FLUSH_INTERVAL_MS = 100
+LOG_VIEW_MAX_LINES = 5000
+LOG_SPOOL_DIR = os.path.join("log", "gui")
+LOG_SPOOL_PREFIX = "worklog_"
+LOG_SPOOL_KEEP = 10
+
+
+class LogBuffer:
+    """화면에 붙일 대기 메시지(최근 max_lines줄)와 전체 로그 파일 (GUI 스레드에서만 사용)"""
+
+    def __init__(self, max_lines=LOG_VIEW_MAX_LINES, spool_dir=LOG_SPOOL_DIR, keep=LOG_SPOOL_KEEP):
+        self.max_lines = max_lines
+        self.spool_dir = spool_dir
+        self.keep = keep
+        self._pending = collections.deque(maxlen=max_lines)
+        self._spool = None
+        self.spool_path = None
+
+    def add(self, message):
+        """메시지 추가 (여러 줄 메시지는 줄 단위로 보관)"""
+        lines = str(message).split("\n")
+        self._pending.extend(lines)
+        if self._spool is not None:
+            try:
+                self._spool.write("\n".join(lines) + "\n")
+            except (OSError, ValueError) as e:
+                self._close_spool()
+                self._pending.append(f"⚠️ 로그 파일 기록 중단: {e}")
+
+    def drain(self):
+        """대기 중인 메시지를 모두 꺼냄 (로그 파일도 이 시점에 디스크로 내보냄)"""
+        lines = list(self._pending)
+        self._pending.clear()
+        if self._spool is not None:
+            try:
+                self._spool.flush()
+            except (OSError, ValueError):
+                self._close_spool()
+        return lines
+
+    def start_spool(self):
+        """새 실행의 로그 파일 시작 (이전 파일은 닫고 오래된 파일 정리)"""
+        self._close_spool()
+        self._pending.clear()
+        try:
+            os.makedirs(self.spool_dir, exist_ok=True)
+            self._prune()
+            self.spool_path = os.path.join(
+                self.spool_dir, f"{LOG_SPOOL_PREFIX}{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+            self._spool = open(self.spool_path, "a", encoding="utf-8")
+        except OSError as e:
+            self.spool_path = None
+            print(f"⚠️ GUI 로그 파일 생성 실패: {e}")
+
+    def _prune(self):
+        paths = sorted(glob.glob(os.path.join(self.spool_dir, f"{LOG_SPOOL_PREFIX}*.log")))
+        for path in paths[:max(0, len(paths) - self.keep + 1)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _close_spool(self):
+        spool, self._spool = self._spool, None
+        if spool is not None:
+            try:
+                spool.close()
+            except OSError:
+                pass
+
+    def close(self):
+        self._close_spool()
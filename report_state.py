@@ -0,0 +1,164 @@
+"""
+=============================================================================
+🧾 DAS-WORKLOG 증분 보고서 상태
+=============================================================================
+
+직전 보고서를 만들 때 사용한 입력과 결과를 사용자별로 log/cache/report_state.json에 보관하고,
+다음 실행에서는 바뀐 부분만 다시 요청합니다 ("llm_incremental_report": true일 때).
+
+   1. 데이터 종류(jira_data, gerrit_reviews 등)별 항목 지문을 직전 기록과 비교해 바뀐 종류를 찾음
+   2. 내용이 같은 이슈/이메일은 직전 요약을 그대로 사용 (요약 요청 생략)
+   3. 바뀐 데이터 종류를 쓰는 섹션, 양식이 바뀐 섹션만 다시 작성하고 나머지 섹션은 직전 결과를 그대로 사용
+      (데이터가 없는 머리말 섹션은 작성일이 바뀌었을 때만 다시 작성)
+
+   - 배포/요약 지침/구조화 모드 등 결과에 영향을 주는 설정이 바뀌면 직전 기록을 쓰지 않음
+   - 이번 실행에서 사용한 항목만 다시 저장하므로 기록 크기는 한 번의 보고서 분량으로 유지됨
+=============================================================================
+"""
+
+import datetime
+import hashlib
+import threading
+
+import activity_records
+from disk_cache import JsonCache
+
+REPORT_STATE_FILE = "report_state.json"
+
+# 비교할 활동 데이터 종류 (worklog_data 키)
+DATASETS = ("jira_data", "confluence_data", "gerrit_reviews", "gerrit_comments", "email_data")
+
+# 섹션 데이터 종류(report_template 기준) -> 그 내용을 만든 활동 데이터 종류
+SOURCE_DATASETS = {
+    "jira_issue_summaries": "jira_data",
+    "jira_overview": "jira_data",
+    "jira_data": "jira_data",
+    "confluence_data": "confluence_data",
+    "gerrit_reviews": "gerrit_reviews",
+    "gerrit_comments": "gerrit_comments",
+    "email": "email_data",
+}
+
+
+def fingerprint(value):
+    """내용 지문 (LLM 프롬프트와 같은 직렬화 - 내부 *_ts 필드 제외)"""
+    text = value if isinstance(value, str) else activity_records.dumps(value, indent=None, internal=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ReportState:
+    """한 사용자의 직전 보고서 기록(previous)과 이번 실행 기록(current)"""
+
+    def __init__(self, username, settings, cache_dir=None):
+        """
+        Args:
+            username (str): 사용자명 (기록 키)
+            settings (str): 결과에 영향을 주는 설정의 지문 (직전 기록과 다르면 직전 기록 무시)
+            cache_dir (str, optional): 기록 파일 폴더 (기본 log/cache)
+        """
+        self.username = username
+        self.cache = JsonCache(REPORT_STATE_FILE, cache_dir=cache_dir)
+        previous = self.cache.get(username) or {}
+        self.previous = previous if previous.get("settings") == settings else {}
+        self.current = {"settings": settings, "date": datetime.date.today().isoformat(),
+                        "datasets": {}, "summaries": {}, "sections": {}}
+        self.changed = set(DATASETS)
+        self.stats = {"summaries_reused": 0, "sections_reused": 0, "sections_written": 0}
+        self._lock = threading.Lock()
+
+    def compare(self, worklog_data):
+        """
+        새 활동 데이터를 직전 기록과 비교
+
+        Args:
+            worklog_data (dict): 워크로그 데이터
+
+        Returns:
+            dict: 바뀐 데이터 종류 -> (추가된 항목 수, 빠진 항목 수) - 직전 기록이 없으면 모든 종류
+        """
+        changes = {}
+        for dataset in DATASETS:
+            items = sorted(fingerprint(record) for record in worklog_data.get(dataset) or [])
+            self.current["datasets"][dataset] = items
+            before = self.previous.get("datasets", {}).get(dataset)
+            if before is None:
+                changes[dataset] = (len(items), 0)
+            elif before != items:
+                changes[dataset] = (len(set(items) - set(before)), len(set(before) - set(items)))
+        self.changed = set(changes)
+        return changes
+
+    def saved_summary(self, task, text):
+        """
+        내용이 같은 항목의 직전 요약
+
+        Args:
+            task (str): "issue" 또는 "email"
+            text (str): 항목 데이터 텍스트 (요약 요청에 넣는 내용)
+
+        Returns:
+            tuple: (요약 텍스트, 구조화 요약 또는 None) - 없으면 None
+        """
+        key = fingerprint(f"{task}\n{text}")
+        entry = self.previous.get("summaries", {}).get(key)
+        if entry is None:
+            return None
+        with self._lock:
+            if key not in self.current["summaries"]:
+                self.current["summaries"][key] = entry
+                self.stats["summaries_reused"] += 1
+        return entry["summary"], entry.get("structured")
+
+    def remember_summary(self, task, text, summary, structured=None):
+        with self._lock:
+            self.current["summaries"][fingerprint(f"{task}\n{text}")] = {"summary": summary, "structured": structured}
+
+    def saved_section(self, section):
+        """
+        다시 작성하지 않아도 되는 섹션의 직전 결과
+
+        Args:
+            section (dict): report_template.parse_template의 섹션
+
+        Returns:
+            str: 직전 결과 - 양식이 바뀌었거나 섹션이 쓰는 데이터가 바뀌었으면 None
+        """
+        key = fingerprint(section["text"])
+        entry = self.previous.get("sections", {}).get(key)
+        if entry is None:
+            return None
+        if section["sources"]:
+            affected = any(SOURCE_DATASETS.get(source) in self.changed for source in section["sources"])
+        else:
+            affected = self.previous.get("date") != self.current["date"]
+        if affected:
+            return None
+        with self._lock:
+            self.current["sections"][key] = entry
+            self.stats["sections_reused"] += 1
+        return entry["text"]
+
+    def remember_section(self, section, text):
+        with self._lock:
+            self.current["sections"][fingerprint(section["text"])] = {"title": section["title"], "text": text}
+            self.stats["sections_written"] += 1
+
+    def forget_sections(self):
+        """이번 실행의 섹션 기록 삭제 (섹션별 작성이 실패해 보고서를 한 번에 작성한 경우)"""
+        with self._lock:
+            self.current["sections"] = {}
+            self.stats["sections_reused"] = self.stats["sections_written"] = 0
+
+    def save(self):
+        """이번 실행 기록을 직전 기록으로 저장"""
+        self.cache.set(self.username, self.current)
+        try:
+            self.cache.save()
+        except OSError as e:
+            print(f"⚠️ 증분 보고서 기록 저장 실패: {e}")
+
+    def report_lines(self):
+        s = self.stats
+        sections = s["sections_reused"] + s["sections_written"]
+        return [f"♻️ 증분 작성: 요약 재사용 {s['summaries_reused']}개, "
+                f"섹션 재사용 {s['sections_reused']}/{sections}개"]
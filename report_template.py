@@ -0,0 +1,141 @@
+"""
+=============================================================================
+🧩 DAS-WORKLOG 주간 보고 템플릿 섹션
+=============================================================================
+
+주간 보고 템플릿(.md)을 "## " 제목 단위 섹션으로 나누고 섹션마다 필요한 활동 데이터 종류를 정합니다.
+llm_processor는 섹션별로 필요한 데이터만 넣은 요청을 동시에 보내고 결과를 순서대로 이어 붙입니다.
+
+   - 섹션 제목의 키워드로 데이터 종류 결정 (원본 JSON이 큰 Jira/Gerrit 데이터는 필요한 섹션에만)
+   - 같은 템플릿 내용은 한 번만 파싱
+   - 템플릿 파일 내용과 템플릿 검색 결과는 경로 + 수정 시각 기준으로 캐시
+     (파일/디렉토리가 바뀌지 않았으면 다시 읽거나 디렉토리를 다시 훑지 않음)
+=============================================================================
+"""
+
+import functools
+import os
+import re
+import threading
+
+SECTION_HEADING = re.compile(r"^##\s+\S")
+CODE_FENCE = "```"
+
+# 데이터 종류 (llm_processor._build_data_parts의 sources 이름)
+# jira_overview는 이슈별 키/제목/상태/날짜/건수만 담은 목록 (통계 섹션용)
+ALL_SOURCES = ("jira_issue_summaries", "jira_data", "confluence_data", "gerrit_reviews", "gerrit_comments", "email")
+
+# (섹션 제목 키워드, 데이터 종류) - 위에서부터 처음 맞는 규칙 사용
+# 일정/계획 섹션은 이슈별 요약(다음 단계 포함)만으로 작성 (요약이 없으면 Jira 원본 사용)
+SECTION_SOURCES = (
+    (("통계", "현황", "stat"), ("jira_overview",)),
+    (("plan", "schedule", "계획", "일정", "목표"), ("jira_issue_summaries",)),
+    (("review", "gerrit", "code", "리뷰", "코드", "검토 내용"), ("gerrit_reviews", "gerrit_comments")),
+    (("mail", "메일"), ("email",)),
+    (("collab", "confluence", "협업", "문서", "지식"), ("confluence_data", "email")),
+    (("jira", "issue", "ticket", "이슈", "티켓"), ("jira_issue_summaries", "jira_data")),
+)
+
+# 맞는 규칙이 없는 섹션 (기타 등) - 원본 Jira/Gerrit JSON 없이 요약 위주
+FALLBACK_SOURCES = ("jira_issue_summaries", "confluence_data", "gerrit_reviews", "email")
+
+
+def section_sources(title):
+    """
+    섹션 제목에 맞는 데이터 종류
+
+    Returns:
+        tuple: 데이터 종류 목록 - 맞는 키워드가 없으면 FALLBACK_SOURCES
+    """
+    lowered = title.lower()
+    for keywords, names in SECTION_SOURCES:
+        if any(keyword in lowered for keyword in keywords):
+            return names
+    return FALLBACK_SOURCES
+
+
+@functools.lru_cache(maxsize=8)
+def parse_template(md_content):
+    """
+    템플릿을 "## " 제목 단위 섹션으로 분리 (같은 내용이면 캐시된 결과 반환)
+
+    첫 "## " 제목 앞부분(문서 제목, 보고 기간/작성자 등)은 title이 빈 머리말 섹션이 되며
+    활동 데이터 없이 작성합니다. 코드 블록 안의 "## "는 제목으로 보지 않습니다.
+
+    Args:
+        md_content (str): 템플릿 내용
+
+    Returns:
+        tuple: ({"title": str, "text": str, "sources": tuple}, ...) - 템플릿 순서
+    """
+    sections = []
+    title, lines, in_code = "", [], False
+    for line in md_content.splitlines(keepends=True):
+        if line.lstrip().startswith(CODE_FENCE):
+            in_code = not in_code
+        if not in_code and SECTION_HEADING.match(line):
+            if "".join(lines).strip():
+                sections.append((title, "".join(lines)))
+            title, lines = line.lstrip("#").strip(), []
+        lines.append(line)
+    if "".join(lines).strip():
+        sections.append((title, "".join(lines)))
+
+    return tuple({"title": title, "text": text, "sources": section_sources(title) if title else ()}
+                 for title, text in sections)
+
+
+# =============================================================================
+# 템플릿 파일 캐시 (경로 + 수정 시각)
+# =============================================================================
+
+_files = {}    # 경로 -> (수정 시각, 내용)
+_lookups = {}  # 검색 디렉토리 목록 -> (찾은 경로, {디렉토리: 수정 시각})
+_lock = threading.Lock()
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def cached_file(path):
+    """수정 시각이 같으면 이전에 읽은 템플릿 내용 (없거나 바뀌었으면 None)"""
+    with _lock:
+        entry = _files.get(path)
+    if entry is None or entry[0] != _mtime(path):
+        return None
+    return entry[1]
+
+
+def remember_file(path, content):
+    mtime = _mtime(path)
+    if mtime is not None:
+        with _lock:
+            _files[path] = (mtime, content)
+
+
+def cached_lookup(search_dirs):
+    """
+    검색 디렉토리들이 바뀌지 않았으면 이전 템플릿 검색 결과
+
+    디렉토리의 수정 시각은 파일이 추가/삭제/이름 변경될 때 바뀌므로, 모두 같으면 다시 훑어도 결과가 같습니다.
+
+    Returns:
+        str: 이전에 찾은 경로 - 캐시가 없거나 디렉토리가 바뀌었으면 None
+    """
+    with _lock:
+        entry = _lookups.get(tuple(search_dirs))
+    if entry is None:
+        return None
+    path, mtimes = entry
+    if any(_mtime(directory) != mtime for directory, mtime in mtimes.items()) or not os.path.exists(path):
+        return None
+    return path
+
+
+def remember_lookup(search_dirs, path):
+    with _lock:
+        _lookups[tuple(search_dirs)] = (path, {directory: _mtime(directory) for directory in search_dirs})
@@ -0,0 +1,211 @@
+"""
+=============================================================================
+🗃️ DAS-WORKLOG HTTP 응답 캐시
+=============================================================================
+
+이슈 상세, Gerrit 변경사항 댓글, Confluence 페이지 메타데이터처럼 실행 사이에 거의 바뀌지 않는
+GET 응답을 log/cache/http/에 보관합니다. http_client.get(..., cache=True)로 요청한 경우에만 사용합니다.
+
+   1. validator(예: 검색 결과의 updated 값)가 저장 당시와 같으면 요청 없이 캐시 응답 사용
+   2. 저장된 ETag/Last-Modified가 있으면 If-None-Match/If-Modified-Since 조건부 요청
+      → 304 Not Modified이면 본문을 다시 받지 않고 캐시 응답 사용
+   3. 그 외에는 정상 요청 후 200 응답을 저장
+
+   - 서버가 ETag/Last-Modified를 주지 않아도 validator가 있으면 1번으로 재사용
+   - 항목 수/전체 크기 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+   - 인증 정보별로 키를 분리 (다른 사용자의 응답을 재사용하지 않음)
+
+설정 (user_config.json, 모두 선택):
+   "http_cache": true, "http_cache_max_mb": 100, "http_cache_max_entries": 5000
+=============================================================================
+"""
+
+import hashlib
+import os
+import threading
+import time
+
+from disk_cache import CACHE_DIR, JsonCache
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 5000
+
+# 캐시 응답에 보존할 헤더
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class ResponseCache:
+    """본문은 파일로, 색인(검증자/헤더/크기/최근 사용 시각)은 JsonCache로 보관"""
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES, max_entries=DEFAULT_MAX_ENTRIES):
+        self.cache_dir = cache_dir or os.path.join(CACHE_DIR, "http")
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.index = JsonCache("index.json", cache_dir=self.cache_dir)
+        self._lock = threading.Lock()
+        self.stats = {"lookups": 0, "fresh": 0, "revalidated": 0, "misses": 0,
+                      "stored": 0, "evicted": 0, "bytes_saved": 0}
+
+    @staticmethod
+    def make_key(request_key, credential=None):
+        """요청 키 + 인증 정보 해시 (인증 정보 원문은 저장하지 않음)"""
+        raw = f"{request_key}\n{credential or ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _body_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.body")
+
+    def lookup(self, key):
+        """
+        저장된 항목
+
+        Returns:
+            tuple: (항목 dict, 본문 bytes) - 없거나 본문 파일이 사라졌으면 (None, None)
+        """
+        with self._lock:
+            self.stats["lookups"] += 1
+        entry = self.index.get(key)
+        if entry is None:
+            return None, None
+        try:
+            with open(self._body_path(key), "rb") as f:
+                body = f.read()
+        except OSError:
+            self.index.pop(key)
+            return None, None
+        return entry, body
+
+    def conditional_headers(self, entry):
+        """저장된 ETag/Last-Modified로 만든 조건부 요청 헤더"""
+        headers = {}
+        if entry.get("headers", {}).get("ETag"):
+            headers["If-None-Match"] = entry["headers"]["ETag"]
+        if entry.get("headers", {}).get("Last-Modified"):
+            headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        return headers
+
+    def hit(self, key, entry, kind, size):
+        """캐시 응답 사용 기록 (kind: "fresh" 또는 "revalidated")"""
+        entry = dict(entry, used=time.time())
+        self.index.set(key, entry)
+        with self._lock:
+            self.stats[kind] += 1
+            self.stats["bytes_saved"] += size
+
+    def miss(self):
+        with self._lock:
+            self.stats["misses"] += 1
+
+    def store(self, key, response, validator=None):
+        """200 응답 저장 (검증 수단이 전혀 없으면 저장하지 않음)"""
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        if validator is None and "ETag" not in headers and "Last-Modified" not in headers:
+            return
+        content = response.content or b""
+        if len(content) > self.max_bytes:
+            return
+        directory = self.cache_dir
+        if not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self._body_path(key) + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, self._body_path(key))
+        self.index.set(key, {"status": response.status_code, "headers": headers, "validator": validator,
+                             "size": len(content), "used": time.time()})
+        with self._lock:
+            self.stats["stored"] += 1
+
+    def evict(self):
+        """항목 수/전체 크기 상한을 넘은 만큼 오래 사용하지 않은 항목부터 삭제"""
+        entries = [(key, self.index.get(key)) for key in self.index.keys()]
+        entries = [(key, entry) for key, entry in entries if entry is not None]
+        total = sum(entry.get("size", 0) for _, entry in entries)
+        count = len(entries)
+        if total <= self.max_bytes and count <= self.max_entries:
+            return
+        for key, entry in sorted(entries, key=lambda item: item[1].get("used", 0)):
+            if total <= self.max_bytes and count <= self.max_entries:
+                break
+            self.index.pop(key)
+            try:
+                os.remove(self._body_path(key))
+            except OSError:
+                pass
+            total -= entry.get("size", 0)
+            count -= 1
+            with self._lock:
+                self.stats["evicted"] += 1
+
+    def save(self):
+        """크기 정리 후 색인 저장"""
+        self.evict()
+        self.index.save()
+
+    def hit_rate(self):
+        hits = self.stats["fresh"] + self.stats["revalidated"]
+        return hits / self.stats["lookups"] if self.stats["lookups"] else 0.0
+
+    def report_lines(self):
+        """적중률 요약 로그 줄 목록 (조회가 없었으면 빈 목록)"""
+        s = self.stats
+        if not s["lookups"]:
+            return []
+        return [f"🗃️ HTTP 캐시: 조회 {s['lookups']}회, 적중 {s['fresh'] + s['revalidated']}회 "
+                f"({self.hit_rate() * 100:.0f}% - 갱신 확인 생략 {s['fresh']}, 304 {s['revalidated']}), "
+                f"미적중 {s['misses']}회 | 절약 {s['bytes_saved'] / 1024:.1f} KB, "
+                f"저장 {len(self.index)}개 (삭제 {s['evicted']})"]
+
+
+_cache = None
+_settings = {"enabled": True, "max_bytes": DEFAULT_MAX_BYTES, "max_entries": DEFAULT_MAX_ENTRIES,
+             "cache_dir": None}
+_lock = threading.Lock()
+
+
+def get_cache():
+    """프로세스 공용 캐시 (비활성화된 경우 None)"""
+    global _cache
+    with _lock:
+        if not _settings["enabled"]:
+            return None
+        if _cache is None:
+            _cache = ResponseCache(_settings["cache_dir"], _settings["max_bytes"], _settings["max_entries"])
+        return _cache
+
+
+def configure(enabled=None, max_bytes=None, max_entries=None, cache_dir=None):
+    """캐시 설정 변경 (다음 get_cache()부터 새 설정으로 생성)"""
+    global _cache
+    with _lock:
+        for name, value in (("enabled", enabled), ("max_bytes", max_bytes),
+                            ("max_entries", max_entries), ("cache_dir", cache_dir)):
+            if value is not None:
+                _settings[name] = value
+        _cache = None
+
+
+def configure_from_config(config):
+    """user_config.json의 http_cache/http_cache_max_mb/http_cache_max_entries 적용"""
+    if not config:
+        return
+    if any(key in config for key in ("http_cache", "http_cache_max_mb", "http_cache_max_entries")):
+        max_mb = config.get("http_cache_max_mb")
+        configure(enabled=config.get("http_cache"),
+                  max_bytes=int(max_mb * 1024 * 1024) if max_mb is not None else None,
+                  max_entries=config.get("http_cache_max_entries"))
+
+
+def save():
+    """색인 저장 (수집이 끝난 뒤 호출)"""
+    cache = _cache
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"⚠️ HTTP 캐시 저장 실패: {e}")
+
+
+def report_lines():
+    cache = _cache
+    return cache.report_lines() if cache is not None else []
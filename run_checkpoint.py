@@ -0,0 +1,175 @@
+"""
+=============================================================================
+💾 DAS-WORKLOG 실행 체크포인트
+=============================================================================
+
+실행(수집 → 이슈/이메일 요약 → 보고서 → 업로드)마다 중간 결과를 log/runs/<run_id>/에 저장해
+LLM 단계가 중간에 실패하거나 창을 닫아도 "이어서 실행"으로 끝난 단계와 항목을 건너뜁니다.
+
+   - 수집 데이터: 데이터 종류별로 수집이 끝나는 즉시 <종류>.ndjson.gz에 저장 (debug_dump 형식)
+   - 이슈/이메일 요약: 항목 하나가 요약될 때마다 summaries.json에 저장 (항목 내용 지문 기준)
+   - 보고서: report.md에 저장 - 업로드가 성공하면 실행을 완료로 표시
+   - log/ 바로 아래 파일은 Jira 첨부 후 삭제되므로 하위 폴더에 보관하고, 최근 RUN_KEEP개 실행만 유지
+
+사용 예:
+   run = RunCheckpoint.create(username)                   # 새 실행
+   run = RunCheckpoint.latest_unfinished(username)        # 이어서 실행 (없으면 None)
+=============================================================================
+"""
+
+import os
+import shutil
+from datetime import datetime
+
+import debug_dump
+from disk_cache import JsonCache
+from report_state import fingerprint
+
+RUNS_DIR = os.path.join("log", "runs")
+RUN_KEEP = 5
+
+STATE_FILE = "state.json"
+SUMMARIES_FILE = "summaries.json"
+REPORT_FILE = "report.md"
+DATASET_SUFFIX = ".ndjson.gz"
+
+
+class RunCheckpoint:
+    """실행 하나의 체크포인트 폴더"""
+
+    def __init__(self, run_dir):
+        self.run_dir = run_dir
+        self.run_id = os.path.basename(run_dir)
+        self.state = JsonCache(STATE_FILE, cache_dir=run_dir)
+        self.summaries = JsonCache(SUMMARIES_FILE, cache_dir=run_dir)
+
+    @classmethod
+    def create(cls, username, runs_dir=RUNS_DIR):
+        """새 실행 폴더 생성 (오래된 실행 폴더 정리)"""
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        run_dir = os.path.join(runs_dir, run_id)
+        suffix = 1
+        while os.path.exists(run_dir):
+            suffix += 1
+            run_dir = os.path.join(runs_dir, f"{run_id}_{suffix}")
+        os.makedirs(run_dir)
+        _prune(runs_dir, keep=RUN_KEEP)
+
+        run = cls(run_dir)
+        run.state.set("username", username)
+        run.state.set("created", datetime.now().isoformat(timespec="seconds"))
+        run.state.set("datasets", {})
+        run.state.set("finished", False)
+        run.state.save()
+        return run
+
+    @classmethod
+    def latest_unfinished(cls, username, runs_dir=RUNS_DIR):
+        """
+        사용자의 가장 최근 실행이 끝나지 않았으면 그 실행 (완료됐거나 기록이 없으면 None)
+        """
+        for run_dir in reversed(_run_dirs(runs_dir)):
+            run = cls(run_dir)
+            if run.state.get("username") != username:
+                continue
+            return None if run.state.get("finished") else run
+        return None
+
+    # -------------------------------------------------------------------------
+    # 수집 데이터
+    # -------------------------------------------------------------------------
+
+    def _dataset_path(self, name):
+        return os.path.join(self.run_dir, name + DATASET_SUFFIX)
+
+    def has_dataset(self, name):
+        return name in (self.state.get("datasets") or {}) and os.path.exists(self._dataset_path(name))
+
+    def save_dataset(self, name, records):
+        """수집이 끝난 데이터 종류 저장 (임시 파일에 쓴 뒤 교체 - 중간에 종료돼도 불완전한 파일이 남지 않음)"""
+        path = self._dataset_path(name)
+        temp_path = path + ".tmp.gz"
+        with debug_dump.DebugDumpWriter(path=temp_path) as writer:
+            count = writer.write_many(name, records)
+        os.replace(temp_path, path)
+        datasets = dict(self.state.get("datasets") or {}, **{name: count})
+        self.state.set("datasets", datasets)
+        self.state.save()
+
+    def load_dataset(self, name):
+        return debug_dump.load_worklog_data(self._dataset_path(name), sections=(name,))[name]
+
+    # -------------------------------------------------------------------------
+    # 이슈/이메일 요약 (LLMProcessor.checkpoint)
+    # -------------------------------------------------------------------------
+
+    def saved_summary(self, task, text):
+        """
+        이 실행에서 이미 요약한 항목의 요약
+
+        Returns:
+            tuple: (요약 텍스트, 구조화 요약 또는 None) - 없으면 None
+        """
+        entry = self.summaries.get(fingerprint(f"{task}\n{text}"))
+        if entry is None:
+            return None
+        return entry["summary"], entry.get("structured")
+
+    def remember_summary(self, task, text, summary, structured=None):
+        """요약 한 건 저장 (바로 디스크에 기록)"""
+        self.summaries.set(fingerprint(f"{task}\n{text}"), {"summary": summary, "structured": structured})
+        try:
+            self.summaries.save()
+        except OSError as e:
+            print(f"⚠️ 요약 체크포인트 저장 실패: {e}")
+
+    # -------------------------------------------------------------------------
+    # 보고서 / 완료
+    # -------------------------------------------------------------------------
+
+    def save_report(self, result):
+        """process_worklog_with_md_file 결과 중 보고서와 템플릿 경로 저장"""
+        with open(os.path.join(self.run_dir, REPORT_FILE), "w", encoding="utf-8") as f:
+            f.write(result.get("summary") or "")
+        self.state.set("report", {"md_file": result.get("md_file")})
+        self.state.save()
+
+    def load_report(self):
+        """
+        저장된 보고서
+
+        Returns:
+            dict: process_worklog_with_md_file과 같은 형식의 결과 - 없으면 None
+        """
+        report = self.state.get("report")
+        path = os.path.join(self.run_dir, REPORT_FILE)
+        if report is None or not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            summary = f.read()
+        return {"success": True, "summary": summary, "md_file": report.get("md_file"),
+                "md_content": None, "error": None}
+
+    def finish(self):
+        self.state.set("finished", True)
+        self.state.save()
+
+    def describe(self):
+        """이어서 실행할 때 보여 줄 진행 상황 한 줄"""
+        datasets = self.state.get("datasets") or {}
+        return (f"실행 {self.run_id}: 수집 {len(datasets)}/{len(debug_dump.SECTIONS)}종, "
+                f"요약 {len(self.summaries)}개, 보고서 {'있음' if self.state.get('report') else '없음'}")
+
+
+def _run_dirs(runs_dir):
+    """실행 폴더 목록 (오래된 순)"""
+    if not os.path.isdir(runs_dir):
+        return []
+    return sorted(os.path.join(runs_dir, name) for name in os.listdir(runs_dir)
+                  if os.path.isdir(os.path.join(runs_dir, name)))
+
+
+def _prune(runs_dir, keep):
+    """최근 keep개 실행 폴더만 남김"""
+    for run_dir in _run_dirs(runs_dir)[:-keep]:
+        shutil.rmtree(run_dir, ignore_errors=True)
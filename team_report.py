@@ -0,0 +1,154 @@
+"""
+=============================================================================
+👥 DAS-WORKLOG 팀 주간 보고서
+=============================================================================
+
+팀 구성원 여러 명의 주간 보고서를 한 번에 만듭니다.
+
+   1. worklog_extractor.collect_team_data로 팀 단위 검색 한 번, 이슈/변경사항/페이지는 한 번씩만 조회
+   2. 댓글/워크로그/메시지/페이지 버전 작성자로 구성원별 활동을 로컬에서 분리
+   3. 구성원별 보고서를 동시에 생성해 log/team/<구성원>_report.md로 저장
+      (수집이 실패했거나 일부가 누락됐으면 빈 보고서를 저장하지 않고 중단)
+
+설정 (user_config.json):
+   "team_members": ["kim.dev", "lee.qa", ...]    # 필수
+   "team_report_workers": 4                       # 선택 - 동시에 생성할 보고서 수
+
+사용 예:
+   python team_report.py
+=============================================================================
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import http_client
+import llm_client
+import llm_processor
+import worklog_extractor
+
+TEAM_REPORT_DIR = os.path.join("log", "team")
+TEAM_REPORT_WORKERS = 4
+
+
+def collection_failures():
+    """
+    마지막 팀 수집에서 실패했거나 누락된 데이터 (worklog_extractor 실패 기록 기준)
+
+    Returns:
+        list: 실패 내용 줄 목록 (모두 성공했으면 빈 목록)
+    """
+    failures = [f"{source}: {error}" for source, error in worklog_extractor.COLLECTION_ERRORS.items()]
+    failures += [f"gerrit {server}: {error}" for server, error in worklog_extractor.GERRIT_FAILED_SERVERS.items()]
+    return failures
+
+
+def generate_member_report(config, member, worklog_data, md_content=None, output_dir=TEAM_REPORT_DIR):
+    """
+    구성원 한 명의 보고서 생성 및 저장 (구성원마다 별도 LLMProcessor/대화 세션 사용)
+
+    Returns:
+        str: 저장한 보고서 파일 경로
+    """
+    processor = llm_processor.LLMProcessor(config)
+    processor.start_new_session()
+    summary = processor.generate_worklog_summary(member, worklog_data, md_content)
+
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"{member}_report.md")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(summary or "")
+    return path
+
+
+def generate_team_reports(config, team_data, directory_path="./templates", output_dir=TEAM_REPORT_DIR,
+                          max_workers=TEAM_REPORT_WORKERS, md_content=None):
+    """
+    구성원별 보고서 동시 생성
+
+    Args:
+        config (dict): Azure OpenAI 설정 정보
+        team_data (dict): collect_team_data 결과 {구성원: 워크로그 데이터}
+        directory_path (str): 보고서 템플릿 MD 파일을 찾을 디렉토리
+        output_dir (str): 보고서 저장 디렉토리
+        max_workers (int): 동시에 생성할 보고서 수
+        md_content (str, optional): 템플릿 내용 (주어지면 directory_path에서 찾지 않음)
+
+    Returns:
+        dict: {구성원: {"success": bool, "path": str, "error": str}}
+    """
+    # 템플릿은 한 번만 찾아 모든 구성원이 공유
+    if md_content is None:
+        try:
+            finder = llm_processor.LLMProcessor(config)
+            md_file = finder.find_md_file(directory_path)
+            if md_file:
+                md_content = finder.read_md_file(md_file)
+        except Exception as e:
+            print(f"⚠️ 보고서 템플릿 읽기 실패 (기본 형식으로 생성): {e}")
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(generate_member_report, config, member, data, md_content, output_dir): member
+            for member, data in team_data.items()
+        }
+        for future in as_completed(futures):
+            member = futures[future]
+            try:
+                path = future.result()
+                results[member] = {"success": True, "path": path, "error": None}
+                print(f"✅ {member} 보고서 저장: {path}")
+            except Exception as e:
+                results[member] = {"success": False, "path": None, "error": str(e)}
+                print(f"❌ {member} 보고서 생성 실패: {e}")
+    return results
+
+
+def main():
+    """user_config.json의 team_members로 팀 수집 후 구성원별 보고서 생성"""
+    try:
+        with open("user_config.json", "r", encoding="utf-8") as f:
+            config = json.load(f)
+    except Exception as e:
+        print(f"❌ user_config.json 읽기 실패: {e}")
+        return
+
+    members = config.get("team_members", [])
+    if not members:
+        print("⚠️ user_config.json에 team_members가 설정되지 않았습니다.")
+        return
+    http_client.configure_from_config(config)
+    llm_client.configure_from_config(config)
+
+    gerrit_tokens = {server: config.get(f"gerrit_token_{server.lower()}", "")
+                     for server in worklog_extractor.GERRIT_URLS}
+    team_data = worklog_extractor.collect_team_data(
+        members,
+        jira_token=config.get("jira_token"),
+        confluence_token=config.get("confluence_token"),
+        gerrit_username=config.get("username"),
+        gerrit_tokens={server: token for server, token in gerrit_tokens.items() if token},
+        master_issue=config.get("master_jira", ""),
+    )
+    for line in http_client.finish_collection():
+        print(line)
+
+    # 수집 실패를 활동 없음으로 보고하지 않도록 보고서 생성 전에 중단
+    failures = collection_failures()
+    if failures:
+        print("❌ 팀 데이터 수집이 실패해 보고서를 생성하지 않습니다:")
+        for failure in failures:
+            print(f"   - {failure}")
+        return
+
+    results = generate_team_reports(config, team_data,
+                                    max_workers=config.get("team_report_workers", TEAM_REPORT_WORKERS))
+    succeeded = sum(1 for result in results.values() if result["success"])
+    print(f"👥 팀 보고서 생성 완료: {succeeded}/{len(results)}명")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""컬럼형 활동 요약 테스트 (NumPy / 표준 라이브러리 경로)"""
+
+import pytest
+
+import activity_table
+import worklog_extractor
+from worklog_extractor import parse_timestamp, ts_to_str
+
+ACTIVITIES = [
+    {"timestamp": "2025-10-02T10:11:12.000+0900", "source": "JIRA", "type": "comment",
+     "raw_data": {"source": "jira", "issue_key": "DAS-1"}},
+    {"timestamp": "2025-09-30 23:50:00.000000000", "timestamp_epoch": parse_timestamp("2025-09-30 23:50:00.000000000"),
+     "source": "GERRIT_NA", "type": "change", "raw_data": {"project": "das/app"}},
+    {"timestamp": "2025-10-01T00:10:00Z", "source": "GERRIT_NA", "type": "change", "raw_data": {"project": "das/app"}},
+    {"timestamp": "2025-10-03T09:00:00+09:00", "source": "CONFLUENCE", "type": "page",
+     "raw_data": {"source": "confluence", "space_key": "DAS"}},
+    {"timestamp": "", "source": "JIRA", "type": "worklog", "raw_data": {"source": "jira", "issue_key": "DAS-2"}},
+]
+
+
+def dict_summary(activities):
+    """컬럼형 테이블 도입 전의 dict 기반 요약"""
+    summary = {"total_activities": len(activities), "by_source": {}, "by_type": {},
+               "date_range": {"start": None, "end": None}}
+    timestamps = []
+    for activity in activities:
+        summary["by_source"][activity["source"]] = summary["by_source"].get(activity["source"], 0) + 1
+        summary["by_type"][activity["type"]] = summary["by_type"].get(activity["type"], 0) + 1
+        ts = activity.get("timestamp_epoch")
+        if ts is None:
+            ts = parse_timestamp(activity.get("timestamp"))
+        if ts is not None:
+            timestamps.append(ts)
+    if timestamps:
+        summary["date_range"]["start"] = ts_to_str(min(timestamps), "%Y-%m-%d")
+        summary["date_range"]["end"] = ts_to_str(max(timestamps), "%Y-%m-%d")
+    return summary
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        monkeypatch.setattr(activity_table, "np", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(activity_table, "np", None)
+    return request.param
+
+
+def test_summary_matches_dict_based_summary(backend):
+    summary = worklog_extractor.generate_activity_summary(ACTIVITIES)
+
+    assert {key: summary[key] for key in ("total_activities", "by_source", "by_type", "date_range")} == \
+        dict_summary(ACTIVITIES)
+    assert summary["by_day"] == {"2025-09-30": 1, "2025-10-01": 1, "2025-10-02": 1, "2025-10-03": 1}
+    assert summary["by_project"] == {"DAS": 3, "das/app": 2}
+
+
+def test_date_range_and_empty_table(backend):
+    table = worklog_extractor.build_activity_table(ACTIVITIES)
+
+    assert table.date_range() == (parse_timestamp("2025-09-30 23:50:00.000000000"),
+                                  parse_timestamp("2025-10-03T09:00:00+09:00"))
+    assert all(type(value) is float for value in table.date_range())
+    assert activity_table.ActivityTable().date_range() == (None, None)
+    assert worklog_extractor.generate_activity_summary([]) == dict(
+        dict_summary([]), by_day={}, by_project={})
@@ -0,0 +1,43 @@
+"""Confluence 버전 이력 조회 테스트"""
+
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+import http_client
+import worklog_extractor
+from disk_cache import JsonCache
+
+
+def _version(number, ts):
+    return {"number": number, "when": worklog_extractor.ts_to_str(ts, "%Y-%m-%dT%H:%M:%S.000Z"),
+            "by": {"username": "gildong"}, "message": ""}
+
+
+def test_version_paging_stops_before_collection_period(monkeypatch, tmp_path):
+    since = worklog_extractor.SINCE_TS
+    # 최신 버전부터 50개씩: 첫 페이지 중간부터 수집 기간 이전
+    history = [_version(n, since + (n - 120) * 3600) for n in range(150, 0, -1)]
+    calls = []
+
+    def fake_get(url, params=None, **kwargs):
+        calls.append(url)
+        start = params["start"] if params else int(parse_qs(urlparse(url).query)["start"][0])
+        response = requests.Response()
+        response.status_code = 200
+        response._content = worklog_extractor.json.dumps({
+            "results": history[start:start + 50],
+            "_links": {"next": f"/rest/api/content/1/version?start={start + 50}"},
+        }).encode()
+        return response
+
+    cache = JsonCache("confluence_versions.json", cache_dir=str(tmp_path))
+    cache.set("stale", {"latest": 1, "versions": {}})
+    monkeypatch.setattr(http_client, "get", fake_get)
+    monkeypatch.setattr(worklog_extractor, "_confluence_version_cache", cache)
+
+    history_by_page = worklog_extractor.fetch_confluence_histories({}, [{"id": "1", "version": {"number": 150}}])
+
+    assert len(calls) == 1
+    assert sorted(int(n) for n in history_by_page["1"]) == list(range(120, 151))
+    assert cache.keys() == ["1"]
@@ -0,0 +1,44 @@
+"""Gerrit 검색 쿼리/페이지 조회 테스트"""
+
+import worklog_extractor
+
+
+def test_build_gerrit_query_covers_each_member():
+    assert worklog_extractor.build_gerrit_query("kim", "2025-10-01", "2025-10-08") == \
+        "(owner:kim OR reviewer:kim OR commentby:kim) after:2025-10-01 before:2025-10-08"
+    assert worklog_extractor.build_gerrit_query(["kim", "lee"], "2025-10-01", "2025-10-08") == \
+        ("(owner:kim OR reviewer:kim OR commentby:kim OR owner:lee OR reviewer:lee OR commentby:lee) "
+         "after:2025-10-01 before:2025-10-08")
+
+
+def test_search_follows_more_changes_with_start_offset(monkeypatch):
+    pages = [
+        [{"id": "c1"}, {"id": "c2"}, {"id": "c3", "_more_changes": True}],
+        [{"id": "c4"}, {"id": "c5", "_more_changes": False}],
+    ]
+    requests_made = []
+
+    def fake_gerrit_request(url, auth, params=None, kind=None, cache=False, validator=None):
+        requests_made.append((url, dict(params), kind))
+        return pages[len(requests_made) - 1]
+
+    monkeypatch.setattr(worklog_extractor, "gerrit_request", fake_gerrit_request)
+    monkeypatch.setattr(worklog_extractor, "GERRIT_PAYLOAD_STATS", dict(worklog_extractor.GERRIT_PAYLOAD_STATS, changes=0))
+    query = worklog_extractor.build_gerrit_query("kim", "2025-10-01", "2025-10-08")
+
+    changes = worklog_extractor.search_gerrit_changes(("kim", "pw"), "http://gerrit", query, limit=3)
+
+    ids = [change["id"] for change in changes]
+    assert ids == ["c1", "c2", "c3", "c4", "c5"]
+    assert len(set(ids)) == len(ids)
+    assert len(requests_made) == 2
+    assert [params["S"] for _, params, _ in requests_made] == [0, len(pages[0])]
+    assert all(url == "http://gerrit/a/changes/" and params["q"] == query and params["n"] == 3 and kind == "search"
+               for url, params, kind in requests_made)
+    assert worklog_extractor.GERRIT_PAYLOAD_STATS["changes"] == 5
+
+
+def test_search_stops_on_empty_page(monkeypatch):
+    monkeypatch.setattr(worklog_extractor, "gerrit_request", lambda *args, **kwargs: [])
+
+    assert worklog_extractor.search_gerrit_changes(("kim", "pw"), "http://gerrit", "owner:kim") == []
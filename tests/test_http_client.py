@@ -0,0 +1,102 @@
+"""http_client 재시도/서킷 브레이커 테스트"""
+
+import time
+
+import pytest
+import requests
+
+import host_limiter
+import http_client
+
+URL = "http://probe.test/rest/api/2/search"
+
+
+class FakeSession:
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    def request(self, method, url, **kwargs):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+def _ok_response():
+    response = requests.Response()
+    response.status_code = 200
+    return response
+
+
+@pytest.fixture
+def half_open(monkeypatch):
+    """연속 실패로 열렸다가 대기 시간이 지나 확인 요청 한 건을 기다리는 제한기"""
+    host_limiter.reset_metrics()
+    limiter = host_limiter.for_url(URL)
+    limiter.failures = limiter.settings["failure_threshold"]
+    limiter.open_until = time.monotonic() - 1
+    yield limiter
+    host_limiter.reset_metrics()
+
+
+def test_probe_failing_with_chunked_encoding_error_reopens_circuit(monkeypatch, half_open):
+    monkeypatch.setattr(http_client, "get_session",
+                        lambda: FakeSession(requests.exceptions.ChunkedEncodingError("응답 중단")))
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        http_client._send("POST", URL, {})
+
+    assert half_open.probing is False
+    assert half_open.open_until > time.monotonic()
+    assert half_open.in_flight == 0
+
+    # 다시 대기 시간이 지나면 확인 요청이 통과하고 성공하면 서킷이 닫힘
+    half_open.open_until = time.monotonic() - 1
+    monkeypatch.setattr(http_client, "get_session", lambda: FakeSession(_ok_response()))
+    assert http_client._send("POST", URL, {}).status_code == 200
+    assert half_open.open_until == 0.0 and half_open.failures == 0
+
+
+def test_non_transient_request_error_is_not_retried(monkeypatch, half_open):
+    half_open.failures = 0
+    half_open.open_until = 0.0
+    calls = []
+
+    class Session(FakeSession):
+        def request(self, method, url, **kwargs):
+            calls.append(url)
+            return super().request(method, url, **kwargs)
+
+    monkeypatch.setattr(http_client, "get_session", lambda: Session(requests.exceptions.InvalidURL("bad")))
+    with pytest.raises(requests.exceptions.InvalidURL):
+        http_client._send("GET", URL, {})
+    assert len(calls) == 1
+    assert half_open.probing is False
+
+
+def test_probe_ending_without_observe_does_not_leave_circuit_stuck(monkeypatch, half_open):
+    monkeypatch.setattr(http_client, "get_session", lambda: FakeSession(TypeError("잘못된 인자")))
+
+    with pytest.raises(TypeError):
+        http_client._send("GET", URL, {})
+
+    assert half_open.probing is False
+    assert half_open.in_flight == 0
+
+    # 확인 요청 표시가 남아 있지 않으므로 다음 요청이 확인 요청으로 통과해 서킷을 닫음
+    monkeypatch.setattr(http_client, "get_session", lambda: FakeSession(_ok_response()))
+    assert http_client._send("GET", URL, {}).status_code == 200
+    assert half_open.open_until == 0.0
+
+
+def test_probe_interrupted_while_waiting_for_slot_is_released(monkeypatch, half_open):
+    def interrupted(seconds):
+        raise KeyboardInterrupt
+
+    half_open.bucket.tokens = 0
+    monkeypatch.setattr(host_limiter.time, "sleep", interrupted)
+
+    with pytest.raises(KeyboardInterrupt):
+        half_open.acquire()
+
+    assert half_open.probing is False
+    assert half_open.in_flight == 0
@@ -0,0 +1,23 @@
+"""jira_master 제외 조건/캐시 테스트"""
+
+import jira_master
+
+
+def test_exclusion_jql_has_fixed_size_for_master():
+    assert jira_master.exclusion_jql("DAS-1") == " AND (parent is EMPTY OR parent != DAS-1) AND key != DAS-1"
+    assert jira_master.exclusion_jql("DAS-1", ["DAS-1", "DAS-9"]) == \
+        " AND (parent is EMPTY OR parent != DAS-1) AND key != DAS-1 AND key not in (DAS-9)"
+    assert jira_master.exclusion_jql(None, []) == ""
+
+
+def test_remember_subtask_replaces_cached_entry(monkeypatch):
+    cache = jira_master.TTLCache()
+    monkeypatch.setattr(jira_master, "_cache", cache)
+    master = {"key": "DAS-1", "project_key": "DAS", "subtasks": ["DAS-2"]}
+    cache.set(("http://jira", "DAS-1"), master)
+
+    jira_master.remember_subtask("http://jira", "DAS-1", "DAS-3")
+    jira_master.remember_subtask("http://jira", "DAS-1", "DAS-3")
+
+    assert master["subtasks"] == ["DAS-2"]  # 다른 스레드가 받은 목록은 그대로
+    assert cache.get(("http://jira", "DAS-1"))["subtasks"] == ["DAS-2", "DAS-3"]
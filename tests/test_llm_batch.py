@@ -0,0 +1,60 @@
+"""배치 작업 대기 중단/재개 테스트"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import disk_cache
+import llm_client
+import llm_processor
+
+CONFIG = {"azure_openai_endpoint": "http://azure.test", "azure_openai_api_key": "key",
+          "azure_openai_api_version": "2024-05-01-preview", "azure_openai_chat_deployment": "gpt",
+          "llm_batch_poll_interval": 60}
+
+JSONL = '{"custom_id": "issue-0"}\n'
+
+
+class FakeBatchClient:
+    def __init__(self):
+        self.status = "in_progress"
+        self.submitted = []
+        self.retrieved = []
+        self.cancelled = []
+        self.files = SimpleNamespace(create=lambda file, purpose: SimpleNamespace(id="file-1"))
+        self.batches = SimpleNamespace(create=self._create, retrieve=self._retrieve, cancel=self.cancelled.append)
+
+    def _create(self, **kwargs):
+        self.submitted.append(kwargs)
+        return SimpleNamespace(id="batch-1", status="validating")
+
+    def _retrieve(self, batch_id):
+        self.retrieved.append(batch_id)
+        return SimpleNamespace(id=batch_id, status=self.status, output_file_id=None)
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(disk_cache, "CACHE_DIR", str(tmp_path))
+    client = FakeBatchClient()
+    monkeypatch.setattr(llm_client, "get_client", lambda config: client)
+    return client
+
+
+def test_stop_request_keeps_batch_job_for_next_run(client):
+    processor = llm_processor.LLMProcessor(CONFIG)
+    processor.stop_requested = lambda: True
+
+    with pytest.raises(Exception, match="중단"):
+        processor._run_batch_job(JSONL, 1, print)
+
+    assert client.cancelled == []
+    jobs = disk_cache.JsonCache(llm_processor.BATCH_JOBS_FILE)
+    assert [job["batch_id"] for job in (jobs.get(key) for key in jobs.keys())] == ["batch-1"]
+
+    # 다음 실행: 같은 요청이면 새로 제출하지 않고 같은 작업을 이어서 확인
+    client.status = "completed"
+    assert llm_processor.LLMProcessor(CONFIG)._run_batch_job(JSONL, 1, print) == {}
+    assert len(client.submitted) == 1
+    assert client.retrieved == ["batch-1", "batch-1"]
+    assert disk_cache.JsonCache(llm_processor.BATCH_JOBS_FILE).keys() == []
@@ -0,0 +1,54 @@
+"""묶음 요약 분리/묶음 구성 테스트"""
+
+import llm_processor
+from llm_processor import parse_packed_response
+
+CONFIG = {"azure_openai_endpoint": "http://azure.test", "azure_openai_api_key": "key",
+          "azure_openai_api_version": "2024-05-01-preview", "azure_openai_chat_deployment": "gpt"}
+
+
+def test_parse_packed_response_handles_reordered_items_and_leading_text():
+    response = ("다음은 요약입니다.\n"
+                "=== ITEM 2 ===\n둘째 요약\n"
+                "  === ITEM 1 ===  \n첫째 요약\n줄 두 개\n"
+                "== ITEM 3 ==\n\n"
+                "=== ITEM 4 ===\n넷째 요약")
+
+    assert parse_packed_response(response) == {2: "둘째 요약", 1: "첫째 요약\n줄 두 개", 4: "넷째 요약"}
+    assert parse_packed_response("마커 없는 응답") == {}
+    assert parse_packed_response(None) == {}
+
+
+def test_pack_groups_respects_budget_item_limit_and_large_items():
+    processor = llm_processor.LLMProcessor(dict(CONFIG, llm_pack_budget=100, llm_pack_max_items=3))
+    small, medium, large = "a" * 20, "b" * 160, "c" * 400  # 추정 11 / 81 / 201 토큰
+
+    # 큰 항목(4)은 건너뛰고, 예산을 넘거나 3개가 차면 새 묶음, 남은 1개짜리 묶음(8)은 제외
+    assert processor._pack_groups([small, small, medium, small, large, small, small, small, small]) == \
+        [[0, 1], [2, 3], [5, 6, 7]]
+    assert llm_processor.LLMProcessor(dict(CONFIG, llm_pack_max_items=1))._pack_groups([small, small]) == []
+
+
+def test_missing_packed_item_falls_back_to_individual_summary(monkeypatch):
+    processor = llm_processor.LLMProcessor(CONFIG)
+    calls = []
+
+    def fake_complete(task, messages, max_tokens=None):
+        prompt = messages[-1]["content"]
+        calls.append(prompt)
+        if llm_processor.PACK_ITEM_MARKER.format(number=1) in prompt:
+            # 순서가 바뀌고 2번 항목이 빠진 응답
+            return "요약 결과:\n=== ITEM 3 ===\nDAS-3 요약\n=== ITEM 1 ===\nDAS-1 요약"
+        return "DAS-2 개별 요약"
+
+    monkeypatch.setattr(processor, "complete", fake_complete)
+    issues = [{"issue_key": f"DAS-{number}", "summary": f"이슈 {number}"} for number in (1, 2, 3)]
+    finished = []
+
+    results = processor.summarize_jira_issues(issues, on_result=lambda issue, result: finished.append(issue["issue_key"]))
+
+    assert [result["summary"] for result in results] == ["DAS-1 요약", "DAS-2 개별 요약", "DAS-3 요약"]
+    assert [result["issue_key"] for result in results] == ["DAS-1", "DAS-2", "DAS-3"]
+    assert len(calls) == 2 and "DAS-2" in calls[1] and "=== ITEM" not in calls[1]
+    assert sorted(finished) == ["DAS-1", "DAS-2", "DAS-3"]
+    assert processor.pack_stats == {"requests": 1, "items": 2, "retried": 1}
@@ -0,0 +1,74 @@
+"""증분 보고서 섹션 재사용 테스트"""
+
+import copy
+
+import llm_processor
+import report_template
+
+CONFIG = {"azure_openai_endpoint": "http://azure.test", "azure_openai_api_key": "key",
+          "azure_openai_api_version": "2024-05-01-preview", "azure_openai_chat_deployment": "gpt",
+          "llm_section_workers": 1}
+
+TEMPLATE = """# 주간 보고서
+작성자/기간
+
+## 1. Jira 이슈 진행
+- 이슈별 진행 내용
+
+## 2. 코드 리뷰
+- 리뷰 내용
+
+## 3. 협업 및 문서
+- 협업 내용
+
+## 4. 작업 통계
+- 건수
+"""
+
+WORKLOG = {
+    "jira_data": [{"issue_key": "DAS-1", "summary": "로그 개선", "status": "In Progress"},
+                  {"issue_key": "DAS-2", "summary": "빌드 수정", "status": "Open"}],
+    "confluence_data": [{"title": "설계 문서", "space": "DAS"}],
+    "gerrit_reviews": [{"change_id": "I1", "subject": "fix build"}],
+    "gerrit_comments": [],
+    "email_data": [],
+}
+
+
+def run_report(tmp_path, worklog_data):
+    """보고서 한 번 작성 - 새로 작성한 섹션 제목 목록 반환"""
+    processor = llm_processor.LLMProcessor(CONFIG)
+    written = []
+
+    def fake_complete(task, messages, max_tokens=None):
+        title = next(section["title"] for section in sections if section["text"] in messages[-1]["content"])
+        written.append(title)
+        return f"{title or '머리말'} 작성 결과"
+
+    processor.complete = fake_complete
+    sections = report_template.parse_template(TEMPLATE)
+    processor.load_report_state("kim", worklog_data, cache_dir=str(tmp_path))
+    report = processor._generate_by_sections("kim", worklog_data, sections)
+    processor.report_state.save()
+    return written, report
+
+
+def test_unchanged_dataset_reuses_sections(tmp_path):
+    first, report = run_report(tmp_path, WORKLOG)
+    second, reused_report = run_report(tmp_path, copy.deepcopy(WORKLOG))
+
+    assert len(first) == 5
+    assert second == []
+    assert reused_report == report
+
+
+def test_changed_issue_regenerates_only_jira_sections(tmp_path):
+    run_report(tmp_path, WORKLOG)
+    changed = copy.deepcopy(WORKLOG)
+    changed["jira_data"][1]["status"] = "Resolved"
+
+    written, report = run_report(tmp_path, changed)
+
+    # Jira 이슈 섹션과 jira_overview를 쓰는 통계 섹션만 다시 작성
+    assert sorted(written) == ["1. Jira 이슈 진행", "4. 작업 통계"]
+    assert "2. 코드 리뷰 작성 결과" in report and "3. 협업 및 문서 작성 결과" in report
@@ -0,0 +1,44 @@
+"""run_checkpoint 저장/복원 테스트"""
+
+import activity_records
+from activity_records import JiraComment, JiraIssue, JiraWorklog, GerritComment
+from report_state import fingerprint
+from run_checkpoint import RunCheckpoint
+
+
+def _jira_issue():
+    return JiraIssue(
+        source="jira", type="detailed_issue", issue_key="DAS-1", summary="체크포인트 복원",
+        description="설명", status="In Progress", updated="2026-10-01T09:00:00.000+0900",
+        updated_ts=1790000000.0,
+        comments=[JiraComment(author="홍길동", author_name="gildong", created="2026-10-01T09:00:00.000+0900",
+                              created_ts=1790000000.0, updated="", body="댓글")],
+        worklogs=[JiraWorklog(author="홍길동", created="", started="2026-10-01T10:00:00.000+0900",
+                              started_ts=1790003600.0, updated="", timeSpent="1h", comment="작업")],
+        attachments=[], comment_count=1, worklog_count=1,
+    )
+
+
+def _gerrit_comment():
+    return GerritComment(source="gerrit", type="file_comment", change_id="I1", change_number=1,
+                         subject="fix", project="das", file_path="a.py", line=3, message="nit",
+                         created="2026-10-01 00:00:00", created_ts=1790000000.0, url="http://gerrit/1")
+
+
+def test_dataset_round_trip_keeps_prompt_text_and_fingerprint(tmp_path):
+    run = RunCheckpoint.create("gildong", runs_dir=str(tmp_path))
+    fresh = {"jira_data": [_jira_issue()], "gerrit_comments": [_gerrit_comment()]}
+    for name, records in fresh.items():
+        run.save_dataset(name, records)
+
+    resumed_run = RunCheckpoint.latest_unfinished("gildong", runs_dir=str(tmp_path))
+    resumed = {name: resumed_run.load_dataset(name) for name in fresh}
+
+    issue = resumed["jira_data"][0]
+    assert isinstance(issue["comments"][0], JiraComment)
+    assert isinstance(issue["worklogs"][0], JiraWorklog)
+    for name in fresh:
+        assert activity_records.dumps(resumed[name], internal=False) == \
+            activity_records.dumps(fresh[name], internal=False)
+        assert fingerprint(resumed[name]) == fingerprint(fresh[name])
+    assert "created_ts" not in activity_records.dumps(resumed["jira_data"], internal=False)
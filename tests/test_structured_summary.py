@@ -0,0 +1,51 @@
+"""구조화 요약 파싱/포맷 테스트"""
+
+import llm_processor
+from llm_processor import format_structured_summary, parse_structured_summary
+
+CONFIG = {"azure_openai_endpoint": "http://azure.test", "azure_openai_api_key": "key",
+          "azure_openai_api_version": "2024-05-01-preview", "azure_openai_chat_deployment": "gpt",
+          "llm_structured_summaries": True}
+
+RESPONSE = ('{"status": "리뷰 진행 중", "actions": ["패치 업로드", "회귀 테스트", "문서 정리", "빌드 확인"],'
+            ' "collaborators": "QA팀", "risks": [], "next_steps": ["  배포  일정\\n확정 "]}')
+
+
+def test_well_formed_json():
+    summary = parse_structured_summary(RESPONSE)
+
+    assert summary == {"status": "리뷰 진행 중", "actions": ["패치 업로드", "회귀 테스트", "문서 정리"],
+                       "collaborators": ["QA팀"], "risks": [], "next_steps": ["배포 일정 확정"]}
+    assert format_structured_summary(summary) == (
+        "- 상태: 리뷰 진행 중\n"
+        "- 수행: 패치 업로드; 회귀 테스트; 문서 정리\n"
+        "- 협업: QA팀\n"
+        "- 다음 단계: 배포 일정 확정")
+
+
+def test_json_inside_code_fence():
+    fenced = f"요약입니다.\n```json\n{RESPONSE}\n```\n"
+
+    assert parse_structured_summary(fenced) == parse_structured_summary(RESPONSE)
+
+
+def test_long_text_is_clipped():
+    summary = parse_structured_summary('{"status": "' + "가" * 300 + '"}')
+
+    assert len(summary["status"]) == llm_processor.STRUCTURED_TEXT_LIMIT
+    assert summary["status"].endswith("…")
+    assert format_structured_summary({"status": "", "actions": []}) == ""
+
+
+def test_malformed_output_falls_back_to_plain_text(monkeypatch):
+    for text in ("그냥 문장 요약", '{"status": "닫히지 않음"', "[1, 2]", "", None):
+        assert parse_structured_summary(text) is None
+
+    processor = llm_processor.LLMProcessor(CONFIG)
+    monkeypatch.setattr(processor, "complete", lambda task, messages, max_tokens=None: "JSON이 아닌 요약")
+
+    result = processor.summarize_jira_issue({"issue_key": "DAS-1", "summary": "이슈"})
+
+    assert result["success"]
+    assert result["summary"] == "JSON이 아닌 요약"
+    assert result["structured"] is None
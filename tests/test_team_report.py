@@ -0,0 +1,21 @@
+"""팀 수집 실패 처리 테스트"""
+
+import requests
+
+import team_report
+import worklog_extractor
+
+
+def test_team_jira_search_failure_is_reported(monkeypatch):
+    def failing_search(headers, members, excluded_issues, master_key=None):
+        raise requests.exceptions.ConnectionError("jira down")
+
+    monkeypatch.setattr(worklog_extractor, "search_team_jira_issues", failing_search)
+    monkeypatch.setattr(worklog_extractor, "COLLECTION_ERRORS", {})
+    monkeypatch.setattr(worklog_extractor, "GERRIT_FAILED_SERVERS", {})
+
+    results = worklog_extractor.collect_team_jira_data(["kim.dev", "lee.qa"], "token")
+
+    assert results == {"kim.dev": [], "lee.qa": []}
+    assert "jira down" in worklog_extractor.COLLECTION_ERRORS["jira"]
+    assert team_report.collection_failures() == [f"jira: {worklog_extractor.COLLECTION_ERRORS['jira']}"]
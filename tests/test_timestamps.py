@@ -0,0 +1,47 @@
+"""parse_timestamp / iso_to_dt / in_window 테스트"""
+
+import datetime as dt
+
+import worklog_extractor
+from worklog_extractor import in_window, iso_to_dt, parse_timestamp
+
+# 2025-10-02 01:11:12 UTC
+BASE = 1759367472.0
+
+
+def test_timezone_offsets_resolve_to_same_epoch():
+    assert parse_timestamp("2025-10-02T01:11:12.000Z") == BASE
+    assert parse_timestamp("2025-10-02T10:11:12.000+0900") == BASE
+    assert parse_timestamp("2025-10-02T10:11:12.000+09:00") == BASE
+    assert parse_timestamp("2025-10-01T20:11:12.000-0500") == BASE
+    assert parse_timestamp("2025-10-02 01:11:12.000000000") == BASE  # Gerrit (UTC, 나노초)
+
+
+def test_missing_fraction_and_partial_fraction():
+    assert parse_timestamp("2025-10-02T10:11:12+09:00") == BASE
+    assert parse_timestamp("2025-10-02T01:11:12") == BASE
+    assert parse_timestamp("2025-10-02T01:11:12.5Z") == BASE + 0.5
+    assert parse_timestamp("2025-10-02T01:11:12.123456789Z") == BASE + 0.123456
+
+
+def test_invalid_strings_return_none():
+    for value in (None, "", "2025-10-02", "2025/10/02 01:11:12", "2025-10-02T01:11:12+9", "2025-10-02T01:11:12 KST"):
+        assert parse_timestamp(value) is None
+        assert iso_to_dt(value) is None
+
+
+def test_iso_to_dt_returns_naive_utc():
+    assert iso_to_dt("2025-10-02T10:11:12.250+0900") == dt.datetime(2025, 10, 2, 1, 11, 12, 250000)
+
+
+def test_in_window_boundaries():
+    since = worklog_extractor.SINCE.strftime("%Y-%m-%dT%H:%M:%S.%f") + "Z"
+    now = worklog_extractor.NOW_UTC.strftime("%Y-%m-%dT%H:%M:%S.%f") + "Z"
+
+    assert parse_timestamp(since) == worklog_extractor.SINCE_TS
+    assert parse_timestamp(now) == worklog_extractor.NOW_TS
+    assert in_window(worklog_extractor.SINCE_TS)
+    assert in_window(worklog_extractor.NOW_TS)
+    assert not in_window(worklog_extractor.SINCE_TS - 0.001)
+    assert not in_window(worklog_extractor.NOW_TS + 0.001)
+    assert not in_window(None)
@@ -1,17 +1,27 @@
 import sys
 import os
 import json
+import itertools
 from PyQt5 import QtWidgets, uic
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal, Qt
 from PyQt5.QtGui import QTextCursor, QMovie
 import worklog_extractor
 import llm_processor
 import email_processor
 import jira_uploader
+import http_client
+import llm_client
+import debug_dump
+import log_buffer
+import run_checkpoint
 from datetime import datetime
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+
+# 창을 닫을 때 AI 처리 스레드가 끝나기(배치 작업 대기 중단)를 기다리는 최대 시간 (ms)
+AI_WORKER_STOP_WAIT_MS = 5000
+
 def resource_path(relative_path):
     """PyInstaller 환경에서 리소스 파일 경로를 올바르게 찾기 위한 함수"""
     try:
@@ -35,26 +45,6 @@ def config_path(filename):
     
     return os.path.join(base_path, filename)
 
-class LoadingAnimationThread(QThread):
-    """Thread to control the loading animation."""
-    start_signal = pyqtSignal()  # Signal to start the animation
-    stop_signal = pyqtSignal()  # Signal to stop the animation
-
-    def __init__(self, parent=None):
-        super(LoadingAnimationThread, self).__init__(parent)
-        self.running = True  # Control flag for the animation loop
-
-    def run(self):
-        """Run the loading animation."""
-        self.start_signal.emit()  # Notify to start the animation
-        while self.running:
-            self.msleep(100)  # Keep the thread alive while the animation runs
-
-    def stop(self):
-        """Stop the loading animation."""
-        self.running = False
-        self.stop_signal.emit()  # Notify to stop the animation
-
 class MyApp(QtWidgets.QMainWindow):
     def __init__(self):
         super(MyApp, self).__init__()
@@ -64,9 +54,22 @@ class MyApp(QtWidgets.QMainWindow):
         self.pushButton.clicked.connect(self.submitText)  # Generate button
         self.closeButton.clicked.connect(self.closeApp)  # Close button
         self.pushButton_3.clicked.connect(self.openSettings)  # Setting button
+        self.resumeButton.clicked.connect(self.resumeRun)  # Resume button
+        self.run = None  # 현재 실행의 체크포인트 (run_checkpoint.RunCheckpoint)
 
         # 설정 파일 로드
         self.config = self.load_config()
+        settings = self.config or {}
+
+        # 로그는 버퍼에 모았다가 타이머로 한 번에 화면에 붙임 (화면에는 최근 줄만, 전체는 log/gui/에 기록)
+        max_lines = int(settings.get("gui_log_max_lines", log_buffer.LOG_VIEW_MAX_LINES))
+        self.log_buffer = log_buffer.LogBuffer(max_lines=max_lines)
+        self.log_timer = QTimer(self)
+        self.log_timer.setSingleShot(True)
+        self.log_timer.setInterval(int(settings.get("gui_log_flush_ms", log_buffer.LOG_FLUSH_INTERVAL_MS)))
+        self.log_timer.timeout.connect(self.flushLogs)
+        self.lineEdit_5.document().setMaximumBlockCount(max_lines)
+
         if not self.config:
             return  # 설정 로드 실패시 초기화 중단
         
@@ -91,9 +94,7 @@ class MyApp(QtWidgets.QMainWindow):
         self.loading_label.setStyleSheet("background-color: rgba(255, 255, 255, 200);")
         self.loading_label.setVisible(False)
         self.movie = QMovie(resource_path("Loading.gif"))  # Path to the loading GIF
-        self.loading_label.setMovie(self.movie)
-
-        self.loading_thread = None  # Placeholder for the loading animation thread
+        self.loading_label.setMovie(self.movie)  # QMovie가 자체 타이머로 프레임을 넘김 (별도 스레드 불필요)
 
 
     def load_config(self):
@@ -128,6 +129,10 @@ class MyApp(QtWidgets.QMainWindow):
                     f"user_config.json에서 다음 설정값들을 확인하세요:\n{', '.join(missing_keys)}"
                 )
             
+            # HTTP 녹화/재생 모드 (user_config.json에 설정된 경우)
+            http_client.configure_from_config(config)
+            llm_client.configure_from_config(config)
+            
             return config
             
         except json.JSONDecodeError as e:
@@ -149,10 +154,33 @@ class MyApp(QtWidgets.QMainWindow):
         self.settings_dialog.exec_()
 
     def submitText(self):
+        """새 실행 시작 (실행 버튼)"""
+        self.startRun()
 
+    def resumeRun(self):
+        """마지막으로 끝나지 않은 실행을 이어서 진행 (이어서 실행 버튼)"""
+        if not self.config:
+            QtWidgets.QMessageBox.critical(self, "오류", "설정이 로드되지 않았습니다.")
+            return
+        run = run_checkpoint.RunCheckpoint.latest_unfinished(self.config.get("username"))
+        if run is None:
+            QtWidgets.QMessageBox.information(
+                self, "이어서 실행", "이어서 진행할 실행이 없습니다.\n실행 버튼으로 새로 시작하세요."
+            )
+            return
+        self.startRun(run)
+
+    def startRun(self, run=None):
+        """
+        데이터 수집 → AI 처리 시작
+        
+        Args:
+            run (RunCheckpoint, optional): 이어서 진행할 실행 (없으면 새 실행 체크포인트 생성)
+        """
         # Disable the Generate button to block further clicks
         self.pushButton.setEnabled(False)
         self.pushButton_3.setEnabled(False)
+        self.resumeButton.setEnabled(False)
 
         # Clear the logs when Generate button is pressed
         self.clearLogs()
@@ -162,6 +190,7 @@ class MyApp(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.critical(self, "오류", "설정이 로드되지 않았습니다.")
             self.pushButton.setEnabled(True)  # Re-enable the button if there's an error
             self.pushButton_3.setEnabled(True) # Re-enable the Settings button if there's an error
+            self.resumeButton.setEnabled(True)
             return
 
         try:
@@ -174,8 +203,18 @@ class MyApp(QtWidgets.QMainWindow):
                 "AS": self.config["gerrit_token_as"]
             }
 
+            # 실행 체크포인트: 수집 데이터/항목 요약/보고서를 log/runs/<run_id>/에 저장 (중단 시 이어서 실행)
+            if run is None:
+                try:
+                    run = run_checkpoint.RunCheckpoint.create(username)
+                except OSError as e:
+                    self.updateLogs(f"⚠️ 실행 체크포인트 생성 실패 (이어서 실행 불가): {e}")
+            else:
+                self.updateLogs(f"♻️ 이어서 실행 - {run.describe()}\n")
+            self.run = run
+
             # Create and start the worker thread
-            self.worker = Worker(username, jira_token, confluence_token, gerrit_tokens)
+            self.worker = Worker(username, jira_token, confluence_token, gerrit_tokens, checkpoint=run)
             self.worker.log_signal.connect(self.updateLogs)  # Connect the log signal to updateLogs
             self.worker.data_signal.connect(self.processFetchedData)  # Connect the data signal to processFetchedData
             self.worker.start_animation_signal.connect(self.startLoadingAnimation)  # Start animation
@@ -194,6 +233,7 @@ class MyApp(QtWidgets.QMainWindow):
             )
             self.pushButton.setEnabled(True)  # Re-enable the button if there's an error
             self.pushButton_3.setEnabled(True)  # Re-enable the Settings button if there's an error
+            self.resumeButton.setEnabled(True)
             return
 
     def startLoadingAnimation(self):
@@ -207,7 +247,9 @@ class MyApp(QtWidgets.QMainWindow):
         self.loading_label.setVisible(False)
 
     def clearLogs(self):
-        """Clear the logs in lineEdit_5."""
+        """Clear the logs in lineEdit_5 and start a new log file for this run."""
+        self.log_timer.stop()
+        self.log_buffer.start_spool()
         self.lineEdit_5.clear()
 
     def processFetchedData(self, data):
@@ -224,7 +266,7 @@ class MyApp(QtWidgets.QMainWindow):
                 worklog_directory = os.path.dirname(os.path.abspath(__file__))
 
             # AI 처리를 별도 스레드에서 실행
-            self.ai_worker = AIWorker(self.config, username, data, worklog_directory)
+            self.ai_worker = AIWorker(self.config, username, data, worklog_directory, checkpoint=self.run)
             self.ai_worker.log_signal.connect(self.updateLogs)
             self.ai_worker.result_signal.connect(self.handleAIResult)
             self.ai_worker.error_signal.connect(self.handleAIError)
@@ -236,6 +278,7 @@ class MyApp(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.critical(self, "Error", f"An error occurred: {e}")
             self.pushButton.setEnabled(True) # Re-enable the button if there's an error
             self.pushButton_3.setEnabled(True)  # Re-enable the Settings button if there's an error
+            self.resumeButton.setEnabled(True)
 
     def handleAIResult(self, result):
         """AI 처리 결과를 처리합니다 (메인 스레드에서 실행)."""
@@ -298,10 +341,12 @@ class MyApp(QtWidgets.QMainWindow):
         # Re-enable the Generate button
         self.pushButton.setEnabled(True)
         self.pushButton_3.setEnabled(True) # Re-enable the Settings button
+        self.resumeButton.setEnabled(True)
 
     def handleAIError(self, error_msg):
         """AI 처리 오류를 처리합니다 (메인 스레드에서 실행)."""
         self.updateLogs(f"처리 실패: {error_msg}")
+        self.flushLogs()  # 오류 창을 띄우기 전에 남은 로그를 화면에 표시
         QtWidgets.QMessageBox.critical(
             self, "Processing Failed", f"워크로그 처리 중 오류가 발생했습니다:\n{error_msg}"
         )
@@ -309,15 +354,41 @@ class MyApp(QtWidgets.QMainWindow):
         # Re-enable the Generate button
         self.pushButton.setEnabled(True)
         self.pushButton_3.setEnabled(True) # Re-enable the Settings button
+        self.resumeButton.setEnabled(True)
 
     def updateLogs(self, message):
-        """Update the logs in lineEdit_5."""
-        self.lineEdit_5.append(message)
+        """Queue a log message; the log timer appends queued messages to lineEdit_5 in one batch."""
+        self.log_buffer.add(message)
+        if not self.log_timer.isActive():
+            self.log_timer.start()
+
+    def flushLogs(self):
+        """대기 중인 로그를 한 번에 lineEdit_5에 붙이고 끝으로 스크롤"""
+        lines = self.log_buffer.drain()
+        if not lines:
+            return
+        cursor = QTextCursor(self.lineEdit_5.document())
+        cursor.movePosition(QTextCursor.End)
+        # 일반 텍스트로 삽입 ("\n"은 줄 구분, 메시지 안의 <...>를 서식으로 해석하지 않음)
+        prefix = "" if self.lineEdit_5.document().isEmpty() else "\n"
+        cursor.insertText(prefix + "\n".join(lines))
         self.lineEdit_5.moveCursor(QTextCursor.End)  # Auto-scroll to the end
 
     def closeApp(self):
         self.close()
 
+    def closeEvent(self, event):
+        """AI 처리 중이면 중단을 요청하고, 남은 로그를 기록한 뒤 로그 파일을 닫음"""
+        ai_worker = getattr(self, "ai_worker", None)
+        if ai_worker is not None and ai_worker.isRunning():
+            # 배치 작업 대기 중이면 대기만 멈추고 끝남 (작업은 다음 실행에서 이어서 받음, 다른 요청 중이면 제한 시간까지만 기다림)
+            ai_worker.requestInterruption()
+            ai_worker.wait(AI_WORKER_STOP_WAIT_MS)
+        self.log_timer.stop()
+        self.log_buffer.drain()
+        self.log_buffer.close()
+        super(MyApp, self).closeEvent(event)
+
     def fetch_all_worklog_data(self, username, jira_token, confluence_token, gerrit_tokens):
         """
         worklog_extractor의 collect_jira_data, collect_confluence_data, collect_gerrit_data를 호출하여
@@ -334,35 +405,58 @@ class MyApp(QtWidgets.QMainWindow):
         print(f"사용자: {username}")
         print("각 시스템에서 데이터 수집을 시작합니다...")
         
-        # user_config.json에서 제외할 이슈 목록 읽기
-        excluded_issues = []
+        # user_config.json에서 마스터 이슈 읽기 (마스터와 그 서브태스크는 수집에서 제외)
+        master_jira = ""
+        dump_compress = True
         try:
             with open("user_config.json", "r", encoding="utf-8") as f:
                 config = json.load(f)
+                dump_compress = config.get("debug_dump_gzip", True)
                 master_jira = config.get("master_jira", "")
                 if master_jira:
-                    excluded_issues.append(master_jira)
-                    print(f"📋 제외 대상 마스터 이슈: {master_jira}")
+                    print(f"📋 제외 대상 마스터 이슈: {master_jira} (+ 서브태스크)")
         except Exception as e:
             print(f"⚠️ user_config.json 읽기 실패: {e}")
         
+        # 디버깅용 덤프: 수집 단계가 끝날 때마다 NDJSON으로 바로 기록
+        dump = None
+        try:
+            dump = debug_dump.DebugDumpWriter(compress=dump_compress)
+        except Exception as e:
+            print(f"⚠️ 디버깅 파일 생성 중 오류: {e}")
+        
+        def write_dump(section, records):
+            if dump is None:
+                return
+            try:
+                dump.write_many(section, records)
+            except Exception as e:
+                print(f"⚠️ 디버깅 파일 저장 중 오류: {e}")
+        
         print("JIRA 데이터 수집 중...")
-        jira_data = worklog_extractor.collect_jira_data(username, jira_token, excluded_issues)
+        jira_data = worklog_extractor.collect_jira_data(username, jira_token, master_issue=master_jira)
+        write_dump("jira_data", jira_data)
         print(f"JIRA 데이터 수집 완료: {len(jira_data)}개 항목")
         
         print("Confluence 데이터 수집 중...")
         confluence_data = worklog_extractor.collect_confluence_data(username, confluence_token)
+        write_dump("confluence_data", confluence_data)
         print(f"Confluence 데이터 수집 완료: {len(confluence_data)}개 항목")
         
         print("Gerrit 데이터 수집 중...")
         gerrit_reviews, gerrit_comments = worklog_extractor.collect_gerrit_data(username, gerrit_tokens)
+        write_dump("gerrit_reviews", gerrit_reviews)
+        write_dump("gerrit_comments", gerrit_comments)
         print(f"Gerrit 데이터 수집 완료: 리뷰 {len(gerrit_reviews)}개, 댓글 {len(gerrit_comments)}개")
+        for line in http_client.finish_collection():
+            print(line)
         
         # 이메일 데이터 수집 (LLM 처리 없음)
         print("이메일 데이터 수집 중...")
         try:
             email_proc = email_processor.create_email_processor()
             email_data_list = email_proc.collect_email_data()  # 변경: 데이터만 수집
+            write_dump("email_data", email_data_list)
             print(f"이메일 데이터 수집 완료: {len(email_data_list)}개")
         except Exception as e:
             print(f"이메일 데이터 수집 중 오류: {e}")
@@ -377,24 +471,11 @@ class MyApp(QtWidgets.QMainWindow):
             "email_data": email_data_list  # 변경: 원시 이메일 데이터
         }
 
-        # 디버깅용 파일 저장
-        print("디버깅용 데이터 파일 저장 중...")
+        # 디버깅용 파일 마무리 (레코드는 수집 단계마다 이미 기록됨)
         try:
-            from datetime import datetime
-            
-            # log 폴더 생성
-            log_dir = "./log"
-            if not os.path.exists(log_dir):
-                os.makedirs(log_dir)
-                print(f"📁 로그 폴더 생성: {log_dir}")
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            debug_filename = os.path.join(log_dir, f"worklog_debug_{timestamp}.json")
-            
-            with open(debug_filename, 'w', encoding='utf-8') as f:
-                json.dump(all_worklog_data, f, ensure_ascii=False, indent=2)
-            
-            print(f"✅ 디버깅 데이터 저장 완료: {debug_filename}")
+            if dump is not None:
+                dump.close()
+                print(f"✅ 디버깅 데이터 저장 완료: {dump.path}")
             print(f"   - JIRA: {len(jira_data)}개")
             print(f"   - Confluence: {len(confluence_data)}개")
             print(f"   - Gerrit Reviews: {len(gerrit_reviews)}개")
@@ -478,58 +559,127 @@ class Worker(QThread):
     start_animation_signal = pyqtSignal()  # Signal to start the loading animation
     stop_animation_signal = pyqtSignal()  # Signal to stop the loading animation
 
-    def __init__(self, username, jira_token, confluence_token, gerrit_tokens, parent=None):
+    def __init__(self, username, jira_token, confluence_token, gerrit_tokens, checkpoint=None, parent=None):
         super(Worker, self).__init__(parent)
         self.username = username
         self.jira_token = jira_token
         self.confluence_token = confluence_token
         self.gerrit_tokens = gerrit_tokens
+        self.checkpoint = checkpoint  # 실행 체크포인트 (수집이 끝난 데이터 종류는 저장, 재개 시 다시 수집하지 않음)
         
-        # user_config.json에서 제외할 이슈 목록 읽기
-        self.excluded_issues = []
+        # user_config.json에서 마스터 이슈 읽기 (마스터와 그 서브태스크는 수집에서 제외)
+        self.master_jira = ""
+        self.dump_compress = True
         try:
             config_file = config_path("user_config.json")
             with open(config_file, "r", encoding="utf-8") as f:
                 config = json.load(f)
-                master_jira = config.get("master_jira", "")
-                if master_jira:
-                    self.excluded_issues.append(master_jira)
-                    print(f"📋 제외 대상 마스터 이슈: {master_jira}")
+                self.dump_compress = config.get("debug_dump_gzip", True)
+                self.master_jira = config.get("master_jira", "")
+                if self.master_jira:
+                    print(f"📋 제외 대상 마스터 이슈: {self.master_jira} (+ 서브태스크)")
         except Exception as e:
             print(f"⚠️ user_config.json 읽기 실패: {e}")
 
+    def load_or_collect(self, names, label, collect, complete=None):
+        """
+        체크포인트에 저장된 데이터 종류는 불러오고, 없으면 collect()로 수집해 저장
+        
+        Args:
+            names (tuple): 데이터 종류 (collect()가 여러 개를 돌려주면 같은 순서)
+            label (str): 로그에 표시할 이름
+            collect (callable): 수집 함수
+            complete (callable, optional): 수집 결과를 저장해도 되는지 (일부 누락이면 False - 재개 시 다시 수집)
+            
+        Returns:
+            list 또는 tuple: names가 하나면 레코드 목록, 여러 개면 종류별 레코드 목록 튜플
+        """
+        if self.checkpoint is not None and all(self.checkpoint.has_dataset(name) for name in names):
+            datasets = tuple(self.checkpoint.load_dataset(name) for name in names)
+            self.log_signal.emit(f"♻️ {label}: 이전 실행에서 수집한 데이터를 사용합니다.")
+        else:
+            self.log_signal.emit(f"{label} 수집 중...")
+            datasets = collect()
+            if len(names) == 1:
+                datasets = (datasets,)
+            if self.checkpoint is not None and (complete is None or complete()):
+                try:
+                    for name, records in zip(names, datasets):
+                        self.checkpoint.save_dataset(name, records)
+                except OSError as e:
+                    self.log_signal.emit(f"⚠️ 수집 체크포인트 저장 실패: {e}")
+        return datasets if len(names) > 1 else datasets[0]
+
     def run(self):
         self.log_signal.emit(f"Version: 1.1.0")
         self.log_signal.emit(f"사용자: {self.username}")
         self.log_signal.emit("설정 파일에서 토큰들이 로드되었습니다.\n")
 
+        # 디버깅용 덤프: 수집 단계가 끝날 때마다 NDJSON으로 바로 기록
+        dump = None
+        try:
+            dump = debug_dump.DebugDumpWriter(compress=self.dump_compress)
+        except Exception as e:
+            self.log_signal.emit(f"⚠️ 디버깅 파일 생성 중 오류: {e}")
+
+        def write_dump(section, records):
+            if dump is None:
+                return
+            try:
+                dump.write_many(section, records)
+            except Exception as e:
+                self.log_signal.emit(f"⚠️ 디버깅 파일 저장 중 오류: {e}")
+
         try:
             # Fetch data
+            # 수집이 실패했거나 일부가 누락됐으면 저장하지 않음 (이어서 실행할 때 다시 수집)
+            worklog_extractor.COLLECTION_ERRORS.clear()
             self.start_animation_signal.emit()
-            self.log_signal.emit("JIRA 데이터 수집 중...")
-            jira_data = worklog_extractor.collect_jira_data(self.username, self.jira_token, self.excluded_issues)
+            jira_data = self.load_or_collect(("jira_data",), "JIRA 데이터", lambda: worklog_extractor.collect_jira_data(
+                self.username, self.jira_token, master_issue=self.master_jira),
+                complete=lambda: "jira" not in worklog_extractor.COLLECTION_ERRORS)
+            write_dump("jira_data", jira_data)
             self.stop_animation_signal.emit()
             self.log_signal.emit(f"JIRA 데이터 수집 완료: {len(jira_data)}개 항목\n")
+            if "jira" in worklog_extractor.COLLECTION_ERRORS:
+                self.log_signal.emit(f"⚠️ JIRA 수집 실패 (데이터 누락): {worklog_extractor.COLLECTION_ERRORS['jira']}")
 
             self.start_animation_signal.emit()
-            self.log_signal.emit("Confluence 데이터 수집 중...")
-            confluence_data = worklog_extractor.collect_confluence_data(self.username, self.confluence_token)
+            confluence_data = self.load_or_collect(("confluence_data",), "Confluence 데이터",
+                                                   lambda: worklog_extractor.collect_confluence_data(
+                                                       self.username, self.confluence_token),
+                                                   complete=lambda: "confluence" not in worklog_extractor.COLLECTION_ERRORS)
+            write_dump("confluence_data", confluence_data)
             self.stop_animation_signal.emit()
             self.log_signal.emit(f"Confluence 데이터 수집 완료: {len(confluence_data)}개 항목\n")
+            if "confluence" in worklog_extractor.COLLECTION_ERRORS:
+                self.log_signal.emit(f"⚠️ Confluence 수집 실패 (데이터 누락): {worklog_extractor.COLLECTION_ERRORS['confluence']}")
 
             self.start_animation_signal.emit()
-            self.log_signal.emit("Gerrit 데이터 수집 중...")
-            gerrit_reviews, gerrit_comments = worklog_extractor.collect_gerrit_data(self.username, self.gerrit_tokens)
+            worklog_extractor.GERRIT_FAILED_SERVERS.clear()
+            # 서버 일부나 변경 상세 댓글 조회가 실패했으면 저장하지 않음
+            gerrit_reviews, gerrit_comments = self.load_or_collect(
+                ("gerrit_reviews", "gerrit_comments"), "Gerrit 데이터",
+                lambda: worklog_extractor.collect_gerrit_data(self.username, self.gerrit_tokens),
+                complete=lambda: not (worklog_extractor.GERRIT_FAILED_SERVERS
+                                      or worklog_extractor.GERRIT_PAYLOAD_STATS["failed_comments"]))
+            write_dump("gerrit_reviews", gerrit_reviews)
+            write_dump("gerrit_comments", gerrit_comments)
             self.stop_animation_signal.emit()
             self.log_signal.emit(f"Gerrit 데이터 수집 완료: 리뷰 {len(gerrit_reviews)}개, 댓글 {len(gerrit_comments)}개\n")
+            for server, error in worklog_extractor.GERRIT_FAILED_SERVERS.items():
+                self.log_signal.emit(f"⚠️ Gerrit {server} 서버 수집 실패 (데이터 누락): {error}")
+            for line in http_client.finish_collection():
+                self.log_signal.emit(line)
             
             # 이메일 데이터 수집 (LLM 처리 없음)
             self.start_animation_signal.emit()
-            self.log_signal.emit("이메일 데이터 수집 중...")
             try:
                 import email_processor
-                email_proc = email_processor.create_email_processor()
-                email_data_list = email_proc.collect_email_data()  # 변경: 데이터만 수집
+                email_data_list = self.load_or_collect(  # 변경: 데이터만 수집
+                    ("email_data",), "이메일 데이터",
+                    lambda: email_processor.create_email_processor().collect_email_data())
+                write_dump("email_data", email_data_list)
                 self.stop_animation_signal.emit()
                 self.log_signal.emit(f"이메일 데이터 수집 완료: {len(email_data_list)}개\n")
             except Exception as e:
@@ -546,24 +696,11 @@ class Worker(QThread):
                 "email_data": email_data_list  # 변경: 원시 이메일 데이터
             }
 
-            # 디버깅용 파일 저장
-            #self.log_signal.emit("디버깅용 데이터 파일 저장 중...")
+            # 디버깅용 파일 마무리 (레코드는 수집 단계마다 이미 기록됨)
             try:
-                from datetime import datetime
-                
-                # log 폴더 생성
-                log_dir = "./log"
-                if not os.path.exists(log_dir):
-                    os.makedirs(log_dir)
-                    #self.log_signal.emit(f"📁 로그 폴더 생성: {log_dir}")
-                
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                debug_filename = os.path.join(log_dir, f"worklog_debug_{timestamp}.json")
-                
-                with open(debug_filename, 'w', encoding='utf-8') as f:
-                    json.dump(all_worklog_data, f, ensure_ascii=False, indent=2)
-                
-                #self.log_signal.emit(f"✅ 디버깅 데이터 저장 완료: {debug_filename}")
+                if dump is not None:
+                    dump.close()
+                    #self.log_signal.emit(f"✅ 디버깅 데이터 저장 완료: {dump.path}")
                 self.log_signal.emit(f"   - JIRA: {len(jira_data)}개")
                 self.log_signal.emit(f"   - Confluence: {len(confluence_data)}개")
                 self.log_signal.emit(f"   - Gerrit Reviews: {len(gerrit_reviews)}개")
@@ -580,6 +717,9 @@ class Worker(QThread):
         except Exception as e:
             self.stop_animation_signal.emit()
             self.log_signal.emit(f"오류 발생: {e}")
+        finally:
+            if dump is not None:
+                dump.close()
 
 class AIWorker(QThread):
     log_signal = pyqtSignal(str)  # Signal to send log messages to the main thread
@@ -588,12 +728,13 @@ class AIWorker(QThread):
     start_animation_signal = pyqtSignal()  # Signal to start the loading animation
     stop_animation_signal = pyqtSignal()  # Signal to stop the loading animation
 
-    def __init__(self, config, username, worklog_data, directory_path, parent=None):
+    def __init__(self, config, username, worklog_data, directory_path, checkpoint=None, parent=None):
         super(AIWorker, self).__init__(parent)
         self.config = config
         self.username = username
         self.worklog_data = worklog_data
         self.directory_path = directory_path
+        self.checkpoint = checkpoint  # 실행 체크포인트 (항목 요약/보고서 저장, 재개 시 끝난 항목과 단계는 건너뜀)
     
     def send_email(self, subject, to_emails, from_email, app_password, summary):
         """Send an email notification with the worklog summary."""
@@ -622,6 +763,34 @@ class AIWorker(QThread):
             print(f"Failed to send email: {e}")
             
 
+    def finish_run(self):
+        """실행 체크포인트를 완료로 표시 (이후 이어서 실행 대상에서 제외)"""
+        if self.checkpoint is None:
+            return
+        try:
+            self.checkpoint.finish()
+        except OSError as e:
+            self.log_signal.emit(f"⚠️ 실행 체크포인트 완료 표시 실패: {e}")
+
+    def summarize_with_batch_job(self, processor):
+        """이슈/이메일 요약을 배치 작업으로 처리해 worklog_data에 병합"""
+        jira_issues = [item for item in self.worklog_data.get('jira_data', []) if item.get('type') == 'detailed_issue']
+        emails = self.worklog_data.get('email_data') or []
+        self.log_signal.emit(f"📦 Jira 이슈 {len(jira_issues)}개, 이메일 {len(emails)}개 요약을 배치 작업으로 처리합니다...")
+        
+        issue_results, email_summaries = processor.summarize_in_batch(jira_issues, emails, progress=self.log_signal.emit)
+        jira_summaries = [{'issue_key': result['issue_key'], 'summary': result['summary'],
+                           'structured': result.get('structured'), 'original_data': issue}
+                          for issue, result in zip(jira_issues, issue_results) if result['success']]
+        
+        enhanced_worklog_data = self.worklog_data.copy()
+        if email_summaries:
+            enhanced_worklog_data['email_summaries'] = email_summaries
+        if jira_summaries:
+            enhanced_worklog_data['jira_issue_summaries'] = jira_summaries
+        self.worklog_data = enhanced_worklog_data
+        self.log_signal.emit(f"🎉 배치 요약 완료: 이슈 {len(jira_summaries)}개, 이메일 {len(email_summaries)}개")
+
     def run(self):
         try:
             self.start_animation_signal.emit()  # Start the loading animation
@@ -630,81 +799,107 @@ class AIWorker(QThread):
             # LLMProcessor 생성 및 새 세션 시작
             processor = llm_processor.LLMProcessor(self.config)
             processor.start_new_session()  # 새로운 대화 세션 시작
+            processor.checkpoint = self.checkpoint
+            processor.stop_requested = self.isInterruptionRequested
             
-            # 이메일 데이터 LLM 요약 처리 (새로운 방식)
-            self.log_signal.emit("📧 이메일 데이터 요약 중...")
-            try:
-                if 'email_data' in self.worklog_data and self.worklog_data['email_data']:
-                    email_summaries = processor.summarize_email_batch(self.worklog_data['email_data'])
-                    self.log_signal.emit(f"📧 이메일 요약 완료: {len(email_summaries)}개")
+            # 증분 작성 모드: 직전 보고서 기록과 비교해 바뀐 이슈/이메일 요약과 섹션만 다시 요청
+            if self.config.get("llm_incremental_report"):
+                changes = processor.load_report_state(self.username, self.worklog_data)
+                self.log_signal.emit(f"♻️ 증분 작성 모드: 직전 보고서 이후 바뀐 데이터 종류 {len(changes)}개")
+            
+            # 배치 작업 모드: 이슈/이메일 요약을 배치 작업 하나로 제출하고 결과를 기다림
+            # (제출 기록이 log/cache에 남아 창을 닫았다가 다시 실행해도 같은 작업을 이어서 받음)
+            if self.config.get("llm_batch_mode"):
+                self.summarize_with_batch_job(processor)
+            else:
+                # 이메일 데이터 LLM 요약 처리 (새로운 방식)
+                self.log_signal.emit("📧 이메일 데이터 요약 중...")
+                try:
+                    if 'email_data' in self.worklog_data and self.worklog_data['email_data']:
+                        email_summaries = processor.summarize_email_batch(self.worklog_data['email_data'])
+                        self.log_signal.emit(f"📧 이메일 요약 완료: {len(email_summaries)}개")
                     
-                    # 워크로그 데이터에 이메일 요약 추가
-                    enhanced_worklog_data = self.worklog_data.copy()
-                    enhanced_worklog_data['email_summaries'] = email_summaries
-                    self.worklog_data = enhanced_worklog_data
-                else:
-                    self.log_signal.emit("📧 요약할 이메일 데이터가 없습니다.")
+                        # 워크로그 데이터에 이메일 요약 추가
+                        enhanced_worklog_data = self.worklog_data.copy()
+                        enhanced_worklog_data['email_summaries'] = email_summaries
+                        self.worklog_data = enhanced_worklog_data
+                    else:
+                        self.log_signal.emit("📧 요약할 이메일 데이터가 없습니다.")
                     
-            except Exception as e:
-                self.log_signal.emit(f"⚠️ 이메일 요약 중 오류: {e}")
-                # 이메일 요약 실패해도 계속 진행
+                except Exception as e:
+                    self.log_signal.emit(f"⚠️ 이메일 요약 중 오류: {e}")
+                    # 이메일 요약 실패해도 계속 진행
             
-            # Jira 이슈 개별 요약 처리
-            self.log_signal.emit("🔍 Jira 이슈들을 개별적으로 LLM 요약 중...")
-            jira_summaries = []
+                # Jira 이슈 개별 요약 처리
+                self.log_signal.emit("🔍 Jira 이슈들을 개별적으로 LLM 요약 중...")
+                jira_summaries = []
             
-            # Jira 데이터에서 상세 이슈 정보 추출
-            jira_issues = []
-            for data_type, data_list in self.worklog_data.items():
-                if data_type == 'jira_data' and isinstance(data_list, list):
-                    for item in data_list:
-                        if item.get('type') == 'detailed_issue':
-                            jira_issues.append(item)
+                # Jira 데이터에서 상세 이슈 정보 추출
+                jira_issues = []
+                for data_type, data_list in self.worklog_data.items():
+                    if data_type == 'jira_data' and isinstance(data_list, list):
+                        for item in data_list:
+                            if item.get('type') == 'detailed_issue':
+                                jira_issues.append(item)
             
-            if jira_issues:
-                self.log_signal.emit(f"📋 총 {len(jira_issues)}개의 Jira 이슈를 개별 요약합니다...")
+                if jira_issues:
+                    self.log_signal.emit(f"📋 총 {len(jira_issues)}개의 Jira 이슈를 요약합니다...")
                 
-                for i, issue in enumerate(jira_issues, 1):
-                    try:
+                    # 이슈 하나가 끝날 때마다 진행 상황 표시 (묶음 요약은 묶음 응답이 오는 시점)
+                    finished = itertools.count(1)
+                
+                    def log_issue(issue, summary_result):
                         issue_key = issue.get('issue_key', 'Unknown')
-                        
-                        # 개별 이슈 요약
-                        summary_result = processor.summarize_jira_issue(issue)
-                        
+                        if summary_result['success']:
+                            self.log_signal.emit(f"✅ [{next(finished)}/{len(jira_issues)}] {issue_key} 요약 완료...")
+                        else:
+                            self.log_signal.emit(f"❌ [{next(finished)}/{len(jira_issues)}] {issue_key} "
+                                                 f"요약 실패: {summary_result['error']}")
+                
+                    # 활동이 적은 이슈는 묶어서 요약, 나머지는 개별 요약
+                    summary_results = processor.summarize_jira_issues(jira_issues, on_result=log_issue)
+                
+                    for issue, summary_result in zip(jira_issues, summary_results):
                         if summary_result['success']:
                             jira_summaries.append({
                                 'issue_key': summary_result['issue_key'],
                                 'summary': summary_result['summary'],
+                                'structured': summary_result.get('structured'),
                                 'original_data': issue
                             })
-                            self.log_signal.emit(f"✅ [{i}/{len(jira_issues)}] {issue_key} 요약 완료...")
-                        else:
-                            self.log_signal.emit(f"❌ {issue_key} 요약 실패: {summary_result['error']}")
-                            
-                    except Exception as e:
-                        self.log_signal.emit(f"❌ {issue.get('issue_key', 'Unknown')} 요약 중 오류: {e}")
                 
-                # 요약된 Jira 이슈들을 워크로그 데이터에 추가
-                enhanced_worklog_data = self.worklog_data.copy()
-                enhanced_worklog_data['jira_issue_summaries'] = jira_summaries
-                self.worklog_data = enhanced_worklog_data
+                    # 요약된 Jira 이슈들을 워크로그 데이터에 추가
+                    enhanced_worklog_data = self.worklog_data.copy()
+                    enhanced_worklog_data['jira_issue_summaries'] = jira_summaries
+                    self.worklog_data = enhanced_worklog_data
                 
-                self.log_signal.emit(f"🎉 Jira 이슈 개별 요약 완료: {len(jira_summaries)}개 성공")
-            else:
-                self.log_signal.emit("📋 요약할 Jira 이슈가 없습니다.")
+                    self.log_signal.emit(f"🎉 Jira 이슈 개별 요약 완료: {len(jira_summaries)}개 성공")
+                else:
+                    self.log_signal.emit("📋 요약할 Jira 이슈가 없습니다.")
 
             self.log_signal.emit("\n 모든 Data 정리를 완료 했습니다. 보고서 작성중 입니다. \n해당 과정은 다소 시간이 걸릴 수 있습니다. 잠시만 기다려 주세요.")
             
-            # 워크로그 데이터와 MD 파일을 함께 처리
-            result = processor.process_worklog_with_md_file(
-                username=self.username,
-                worklog_data=self.worklog_data,
-                directory_path=self.directory_path
-            )
+            # 워크로그 데이터와 MD 파일을 함께 처리 (재개한 실행에서 보고서가 이미 저장돼 있으면 그대로 사용)
+            result = self.checkpoint.load_report() if self.checkpoint is not None else None
+            if result is not None:
+                self.log_signal.emit("♻️ 이전 실행에서 작성한 보고서를 사용합니다.")
+            else:
+                result = processor.process_worklog_with_md_file(
+                    username=self.username,
+                    worklog_data=self.worklog_data,
+                    directory_path=self.directory_path
+                )
+                if result['success'] and self.checkpoint is not None:
+                    try:
+                        self.checkpoint.save_report(result)
+                    except OSError as e:
+                        self.log_signal.emit(f"⚠️ 보고서 체크포인트 저장 실패: {e}")
 
             self.stop_animation_signal.emit()  # Stop the loading animation
             if result['success']:
                 self.log_signal.emit("AI 처리 완료!")  # Log success
+                for line in processor.usage_lines():
+                    self.log_signal.emit(line)
                 
                 # 결과에 Jira 이슈 요약 정보 추가
                 if 'jira_issue_summaries' in self.worklog_data:
@@ -733,6 +928,7 @@ class AIWorker(QThread):
                             subtask_url = upload_result.get('url', 'URL 정보 없음')  # 'url' 키 사용
                             issue_key = upload_result.get('issue_key')  # issue_key 추가
                             self.log_signal.emit(f"✅ Jira 업로드 완료: {subtask_url}")
+                            self.finish_run()
                             # 결과에 서브태스크 URL 및 issue_key 정보 추가
                             result['subtask_url'] = subtask_url
                             result['issue_key'] = issue_key  # issue_key 추가
@@ -756,6 +952,7 @@ class AIWorker(QThread):
                     else:
                         self.log_signal.emit("⚠️ user_config.json에 master_jira가 설정되지 않았습니다. Jira 업로드를 건너뜁니다.")
                         result['upload_info'] = "master_jira 설정이 필요합니다."
+                        self.finish_run()
                         
                 except Exception as e:
                     self.log_signal.emit(f"❌ Jira 업로드 중 오류: {e}")
@@ -773,5 +970,7 @@ if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
     window = MyApp()
     window.show()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    llm_client.close_all()
+    sys.exit(exit_code)
 
@@ -34,6 +34,7 @@ hiddenimports = [
     'PyQt5.QtGui',
     'requests',
     'openai',
+    'httpx',
     'json',
     'datetime',
     'email',
@@ -50,7 +51,21 @@ hiddenimports = [
     'worklog_extractor',
     'llm_processor',
     'email_processor',
-    'jira_uploader'
+    'jira_uploader',
+    'http_client',
+    'activity_records',
+    'activity_table',
+    'debug_dump',
+    'jira_master',
+    'disk_cache',
+    'host_limiter',
+    'response_cache',
+    'team_report',
+    'llm_client',
+    'report_template',
+    'report_state',
+    'log_buffer',
+    'run_checkpoint'
 ]
 
 a = Analysis(
@@ -26,11 +26,22 @@
 import os
 import sys
 import csv
-import time
+import threading
 import datetime as dt
+import calendar
+import functools
 import requests
 from requests.auth import HTTPBasicAuth
 import json
+import http_client
+import jira_master
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from disk_cache import JsonCache
+from activity_records import (
+    JiraIssue, JiraComment, JiraWorklog, ConfluencePage,
+    GerritReview, GerritComment, ActivityView,
+)
+from activity_table import ActivityTable
 
 # UTF-8 인코딩 설정 (PyInstaller 호환성을 위한 안전한 처리)
 import codecs
@@ -92,26 +103,81 @@ GERRIT_URLS = {
     "AS": "http://vgit.lge.com/as"
 }
 
-def iso_to_dt(s):
-    """시간 문자열을 datetime 객체로 변환"""
-    try:
-        if s.endswith("Z"):
-            return dt.datetime.fromisoformat(s.replace("Z","+00:00")).replace(tzinfo=None)
-        if "+" in s and s[-5] in ["+", "-"] and s[-3] != ":":
-            s = s[:-5] + s[-5:-2] + ":" + s[-2:]
-        # Gerrit 시간 형식: "2025-09-18 02:47:20.000000000"
-        if "." in s and len(s.split(".")[-1]) > 6:
-            # 나노초를 마이크로초로 변환
-            parts = s.split(".")
-            microseconds = parts[1][:6]
-            s = f"{parts[0]}.{microseconds}"
-        return dt.datetime.fromisoformat(s).replace(tzinfo=None)
-    except Exception as e:
-        # Gerrit 시간 형식 처리
-        try:
-            return dt.datetime.strptime(s.split(".")[0], "%Y-%m-%d %H:%M:%S")
-        except:
+def _to_epoch(d):
+    """naive UTC datetime을 epoch 초로 변환"""
+    return calendar.timegm(d.timetuple()) + d.microsecond / 1_000_000
+
+# 수집 기간 (epoch 초) - 필터 비교는 모두 이 값으로 수행
+SINCE_TS = _to_epoch(SINCE)
+NOW_TS = _to_epoch(NOW_UTC)
+
+@functools.lru_cache(maxsize=16384)
+def parse_timestamp(s):
+    """
+    시간 문자열을 UTC epoch 초로 변환 (형식 전용 파서 + 메모이제이션)
+    
+    지원 형식 (고정 위치 슬라이싱으로 파싱, 예외 기반 fallback 없음):
+        - Jira      : 2025-10-02T10:11:12.000+0900
+        - Confluence: 2025-10-02T10:11:12.000+09:00 / ...Z
+        - Gerrit    : 2025-09-18 02:47:20.000000000 (UTC, 나노초)
+        - Email     : 2025-10-01T09:00:00+09:00
+        - 시간대 정보가 없으면 UTC로 간주
+    
+    Args:
+        s (str): 시간 문자열
+        
+    Returns:
+        float or None: epoch 초, 해석할 수 없으면 None
+    """
+    if not s or not isinstance(s, str) or len(s) < 19:
+        return None
+    if s[4] != "-" or s[7] != "-" or s[10] not in "T " or s[13] != ":" or s[16] != ":":
+        return None
+    
+    date_part = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+    if not date_part.isdigit():
+        return None
+    
+    epoch = float(calendar.timegm((int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                             int(s[11:13]), int(s[14:16]), int(s[17:19]), 0, 0, 0)))
+    
+    # 소수점 이하 초 (마이크로초까지만 사용)
+    pos = 19
+    if pos < len(s) and s[pos] == ".":
+        end = pos + 1
+        while end < len(s) and s[end].isdigit():
+            end += 1
+        fraction = s[pos + 1:end]
+        if fraction:
+            epoch += int(fraction[:6].ljust(6, "0")) / 1_000_000
+        pos = end
+    
+    # 시간대: "", "Z", "+0900", "+09:00"
+    tz = s[pos:]
+    if tz and tz != "Z":
+        sign = tz[0]
+        digits = tz[1:].replace(":", "")
+        if sign not in "+-" or len(digits) != 4 or not digits.isdigit():
             return None
+        offset = int(digits[:2]) * 3600 + int(digits[2:]) * 60
+        epoch -= offset if sign == "+" else -offset
+    
+    return epoch
+
+def iso_to_dt(s):
+    """시간 문자열을 naive UTC datetime 객체로 변환 (parse_timestamp 기반)"""
+    ts = parse_timestamp(s)
+    if ts is None:
+        return None
+    return dt.datetime(1970, 1, 1) + dt.timedelta(seconds=ts)
+
+def ts_to_str(ts, fmt="%Y-%m-%d %H:%M:%S"):
+    """epoch 초를 UTC 기준 문자열로 변환"""
+    return (dt.datetime(1970, 1, 1) + dt.timedelta(seconds=ts)).strftime(fmt)
+
+def in_window(ts):
+    """epoch 값이 수집 기간 내인지 확인"""
+    return ts is not None and SINCE_TS <= ts <= NOW_TS
 
 def extract_text_from_adf(adf_content):
     """
@@ -185,20 +251,21 @@ def filter_my_comments(comments, username):
         
         # 정확한 username 매칭
         if comment_author_name == username:
-            # 댓글 작성 날짜 확인
+            # 댓글 작성 날짜 확인 (수집 시 정규화된 epoch 값 사용)
             comment_created = comment.get("created", "")
             if comment_created:
-                try:
-                    comment_date = iso_to_dt(comment_created)
-                    # 지정된 기간 내에 작성된 댓글인지 확인
-                    if SINCE <= comment_date <= NOW_UTC:
-                        my_comments.append(comment)
-                    else:
-                        print(f"    ⏰ 댓글 제외 (기간 외): {comment_date.strftime('%Y-%m-%d %H:%M:%S')}")
-                except Exception as e:
-                    print(f"    ❌ 댓글 날짜 파싱 오류: {comment_created} - {e}")
+                comment_ts = comment.get("created_ts")
+                if comment_ts is None:
+                    comment_ts = parse_timestamp(comment_created)
+                if comment_ts is None:
+                    print(f"    ❌ 댓글 날짜 파싱 오류: {comment_created}")
                     # 날짜 파싱 실패 시에도 포함 (안전장치)
                     my_comments.append(comment)
+                # 지정된 기간 내에 작성된 댓글인지 확인
+                elif in_window(comment_ts):
+                    my_comments.append(comment)
+                else:
+                    print(f"    ⏰ 댓글 제외 (기간 외): {ts_to_str(comment_ts)}")
             else:
                 # 날짜 정보가 없는 경우에도 포함
                 my_comments.append(comment)
@@ -223,27 +290,28 @@ def filter_my_worklogs(worklogs, username):
         
         # 사용자명 매칭 확인 (대소문자 구분 없이)
         if username.lower() in worklog_author.lower():
-            # 워크로그 시작 날짜 확인
+            # 워크로그 시작 날짜 확인 (수집 시 정규화된 epoch 값 사용)
             worklog_started = worklog.get("started", "")
             if worklog_started:
-                try:
-                    worklog_date = iso_to_dt(worklog_started)
-                    # 지정된 기간 내에 작성된 워크로그인지 확인
-                    if SINCE <= worklog_date <= NOW_UTC:
-                        my_worklogs.append(worklog)
-                    else:
-                        print(f"    ⏰ 워크로그 제외 (기간 외): {worklog_date.strftime('%Y-%m-%d %H:%M:%S')}")
-                except Exception as e:
-                    print(f"    ❌ 워크로그 날짜 파싱 오류: {worklog_started} - {e}")
+                worklog_ts = worklog.get("started_ts")
+                if worklog_ts is None:
+                    worklog_ts = parse_timestamp(worklog_started)
+                if worklog_ts is None:
+                    print(f"    ❌ 워크로그 날짜 파싱 오류: {worklog_started}")
                     # 날짜 파싱 실패 시에도 포함 (안전장치)
                     my_worklogs.append(worklog)
+                # 지정된 기간 내에 작성된 워크로그인지 확인
+                elif in_window(worklog_ts):
+                    my_worklogs.append(worklog)
+                else:
+                    print(f"    ⏰ 워크로그 제외 (기간 외): {ts_to_str(worklog_ts)}")
             else:
                 # 날짜 정보가 없는 경우에도 포함
                 my_worklogs.append(worklog)
         
     return my_worklogs
 
-def get_jira_issue_details(username, token, issue_key):
+def get_jira_issue_details(username, token, issue_key, updated=None):
     """
     특정 Jira 이슈의 상세 정보와 댓글을 가져오기
     
@@ -251,150 +319,277 @@ def get_jira_issue_details(username, token, issue_key):
         username (str): Jira 사용자명
         token (str): Jira API 토큰
         issue_key (str): Jira 이슈 키 (예: CLUSTWORK-16153)
+        updated (str, optional): 검색 결과의 updated 값 - 이전 실행과 같으면 캐시된 응답 사용
         
     Returns:
-        dict: 이슈 상세 정보 (댓글 포함)
+        JiraIssue: 이슈 상세 정보 (내 댓글/워크로그 포함, 활동 목록에 그대로 사용)
+    """
+    try:
+        issue_data = fetch_jira_issue(token, issue_key, updated)
+        return build_jira_issue_details(issue_data, username)
+        
+    except Exception as e:
+        print(f"❌ Jira 이슈 상세 정보 가져오기 실패 ({issue_key}): {e}")
+        return None
+
+def fetch_jira_issue(token, issue_key, updated=None):
+    """
+    이슈 상세 응답 조회 (changelog, comments, worklog, attachments 포함)
+    
+    Args:
+        token (str): Jira API 토큰
+        issue_key (str): Jira 이슈 키
+        updated (str, optional): 검색 결과의 updated 값 - 이전 실행과 같으면 캐시된 응답 사용
+        
+    Returns:
+        dict: /rest/api/2/issue/{key} 응답
+        
+    Raises:
+        requests.exceptions.RequestException: 조회 실패 시
     """
     headers = {
         "Accept": "application/json",
         "Authorization": f"Bearer {token}"
     }
+    url = f"{JIRA_BASE}/rest/api/2/issue/{issue_key}"
+    params = {
+        "expand": "changelog,comments,worklog,attachments"
+    }
     
-    try:
-        # 이슈 기본 정보 가져오기
-        url = f"{JIRA_BASE}/rest/api/2/issue/{issue_key}"
-        params = {
-            "expand": "changelog,comments,worklog,attachments"
-        }
-        
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        issue_data = response.json()
-        
-        print(f"🔍 {issue_key} 이슈 댓글 수집:")
-        
-        # 댓글 정보 추출 (내가 작성한 댓글만)
-        all_comments = []
-        
-        # comments 필드 확인 (expand로 가져온 경우)
-        if "fields" in issue_data and "comment" in issue_data["fields"]:
-            comment_data = issue_data["fields"]["comment"]
-            
-            if "comments" in comment_data:
-                for comment in comment_data["comments"]:
-                    comment_info = {
-                        "author": comment.get("author", {}).get("displayName", "Unknown"),
-                        "author_name": comment.get("author", {}).get("name", ""),
-                        "created": comment.get("created", ""),
-                        "updated": comment.get("updated", ""),
-                        "body": comment.get("body", "")
-                    }
-                    # ADF 형태인 경우 텍스트 추출
-                    if isinstance(comment_info["body"], dict):
-                        comment_info["body"] = extract_text_from_adf(comment_info["body"])
-                    all_comments.append(comment_info)
-        
-        print(f"  - 전체 댓글 수: {len(all_comments)}")
-        
-        # 내가 작성한 댓글만 필터링
-        my_comments = filter_my_comments(all_comments, username)
-        print(f"  - 내 댓글 수: {len(my_comments)}")
+    response = http_client.get(url, headers=headers, params=params, cache=True, validator=updated)
+    response.raise_for_status()
+    return response.json()
+
+def build_jira_issue_details(issue_data, username):
+    """
+    이슈 상세 응답에서 특정 사용자의 댓글/워크로그만 남긴 JiraIssue 구성
+    
+    팀 모드에서는 이슈를 한 번만 조회한 뒤 구성원마다 이 함수로 나눠 담습니다.
+    
+    Args:
+        issue_data (dict): /rest/api/2/issue/{key} 응답 (changelog, comments, worklog 포함)
+        username (str): 댓글/워크로그를 남길 사용자명
         
-        # 내가 작성한 댓글만 필터링
-        my_comments = filter_my_comments(all_comments, username)
+    Returns:
+        JiraIssue: 이슈 상세 정보 (해당 사용자의 댓글/워크로그만 포함)
+    """
+    print(f"🔍 {issue_data.get('key', '')} 이슈 댓글 수집 ({username}):")
+    
+    # 댓글 정보 추출 (내가 작성한 댓글만)
+    all_comments = []
+    
+    # comments 필드 확인 (expand로 가져온 경우)
+    if "fields" in issue_data and "comment" in issue_data["fields"]:
+        comment_data = issue_data["fields"]["comment"]
         
-        # 워크로그 정보 추출 (내가 작성한 워크로그만)
-        all_worklogs = []
-        if "worklog" in issue_data.get("fields", {}):
-            for worklog in issue_data["fields"]["worklog"]["worklogs"]:
-                worklog_info = {
-                    "author": worklog.get("author", {}).get("displayName", "Unknown"),
-                    "created": worklog.get("created", ""),
-                    "updated": worklog.get("updated", ""),
-                    "timeSpent": worklog.get("timeSpent", ""),
-                    "comment": worklog.get("comment", "")
-                }
+        if "comments" in comment_data:
+            for comment in comment_data["comments"]:
+                comment_info = JiraComment(
+                    author=comment.get("author", {}).get("displayName", "Unknown"),
+                    author_name=comment.get("author", {}).get("name", ""),
+                    created=comment.get("created", ""),
+                    created_ts=parse_timestamp(comment.get("created", "")),
+                    updated=comment.get("updated", ""),
+                    body=comment.get("body", "")
+                )
                 # ADF 형태인 경우 텍스트 추출
-                if isinstance(worklog_info["comment"], dict):
-                    worklog_info["comment"] = extract_text_from_adf(worklog_info["comment"])
-                all_worklogs.append(worklog_info)
-        
-        # 내가 작성한 워크로그만 필터링
-        my_worklogs = filter_my_worklogs(all_worklogs, username)
-        
-        # 첨부파일 정보 추출
-        attachments = []
-        if "attachment" in issue_data.get("fields", {}):
-            for attachment in issue_data["fields"]["attachment"]:
-                attachments.append({
-                    "filename": attachment.get("filename", ""),
-                    "author": attachment.get("author", {}).get("displayName", "Unknown"),
-                    "created": attachment.get("created", ""),
-                    "size": attachment.get("size", 0)
+                if isinstance(comment_info["body"], dict):
+                    comment_info["body"] = extract_text_from_adf(comment_info["body"])
+                all_comments.append(comment_info)
+    
+    print(f"  - 전체 댓글 수: {len(all_comments)}")
+    
+    # 내가 작성한 댓글만 필터링
+    my_comments = filter_my_comments(all_comments, username)
+    print(f"  - 내 댓글 수: {len(my_comments)}")
+    
+    # 내가 작성한 댓글만 필터링
+    my_comments = filter_my_comments(all_comments, username)
+    
+    # 워크로그 정보 추출 (내가 작성한 워크로그만)
+    all_worklogs = []
+    if "worklog" in issue_data.get("fields", {}):
+        for worklog in issue_data["fields"]["worklog"]["worklogs"]:
+            worklog_info = JiraWorklog(
+                author=worklog.get("author", {}).get("displayName", "Unknown"),
+                created=worklog.get("created", ""),
+                started=worklog.get("started", ""),
+                started_ts=parse_timestamp(worklog.get("started", "")),
+                updated=worklog.get("updated", ""),
+                timeSpent=worklog.get("timeSpent", ""),
+                comment=worklog.get("comment", "")
+            )
+            # ADF 형태인 경우 텍스트 추출
+            if isinstance(worklog_info["comment"], dict):
+                worklog_info["comment"] = extract_text_from_adf(worklog_info["comment"])
+            all_worklogs.append(worklog_info)
+    
+    # 내가 작성한 워크로그만 필터링
+    my_worklogs = filter_my_worklogs(all_worklogs, username)
+    
+    # 첨부파일 정보 추출
+    attachments = []
+    if "attachment" in issue_data.get("fields", {}):
+        for attachment in issue_data["fields"]["attachment"]:
+            attachments.append({
+                "filename": attachment.get("filename", ""),
+                "author": attachment.get("author", {}).get("displayName", "Unknown"),
+                "created": attachment.get("created", ""),
+                "size": attachment.get("size", 0)
+            })
+    
+    # 변경 이력 추출
+    changelog = []
+    if "changelog" in issue_data:
+        for history in issue_data["changelog"]["histories"]:
+            for item in history.get("items", []):
+                changelog.append({
+                    "author": history.get("author", {}).get("displayName", "Unknown"),
+                    "created": history.get("created", ""),
+                    "field": item.get("field", ""),
+                    "fieldtype": item.get("fieldtype", ""),
+                    "from": item.get("fromString", ""),
+                    "to": item.get("toString", "")
                 })
-        
-        # 변경 이력 추출
-        changelog = []
-        if "changelog" in issue_data:
-            for history in issue_data["changelog"]["histories"]:
-                for item in history.get("items", []):
-                    changelog.append({
-                        "author": history.get("author", {}).get("displayName", "Unknown"),
-                        "created": history.get("created", ""),
-                        "field": item.get("field", ""),
-                        "fieldtype": item.get("fieldtype", ""),
-                        "from": item.get("fromString", ""),
-                        "to": item.get("toString", "")
-                    })
-        
-        # 통합 상세 정보 반환
-        fields = issue_data.get("fields", {})
-        
-        # description 필드 안전 처리
-        description = ""
-        description_field = fields.get("description")
-        if description_field:
-            if isinstance(description_field, str):
-                description = description_field
-            elif isinstance(description_field, dict):
-                description = extract_text_from_adf(description_field)
-        
-        detailed_issue = {
-            "key": issue_data.get("key", ""),
-            "summary": fields.get("summary", ""),
-            "description": description,
-            "status": fields.get("status", {}).get("name", "Unknown"),
-            "assignee": fields.get("assignee", {}).get("displayName", "Unassigned") if fields.get("assignee") else "Unassigned",
-            "reporter": fields.get("reporter", {}).get("displayName", "Unknown") if fields.get("reporter") else "Unknown",
-            "priority": fields.get("priority", {}).get("name", "Unknown") if fields.get("priority") else "Unknown",
-            "created": fields.get("created", ""),
-            "updated": fields.get("updated", ""),
-            "resolutiondate": fields.get("resolutiondate", ""),
-            "comments": my_comments,  # 내가 작성한 댓글만
-            "worklogs": my_worklogs,  # 내가 작성한 워크로그만
-            "attachments": attachments,
-            "changelog": changelog,
-            "url": f"{JIRA_BASE}/browse/{issue_data.get('key', '')}",
-            "total_comments": len(all_comments),  # 전체 댓글 수
-            "my_comments_count": len(my_comments),  # 내가 작성한 댓글 수
-            "total_worklogs": len(all_worklogs),  # 전체 워크로그 수  
-            "my_worklogs_count": len(my_worklogs)  # 내가 작성한 워크로그 수
-        }
-        
-        return detailed_issue
-        
+    
+    # 통합 상세 정보 반환
+    fields = issue_data.get("fields", {})
+    
+    # description 필드 안전 처리
+    description = ""
+    description_field = fields.get("description")
+    if description_field:
+        if isinstance(description_field, str):
+            description = description_field
+        elif isinstance(description_field, dict):
+            description = extract_text_from_adf(description_field)
+    
+    detailed_issue = JiraIssue(
+        source="jira",
+        type="detailed_issue",
+        issue_key=issue_data.get("key", ""),
+        summary=fields.get("summary", ""),
+        description=description,
+        status=fields.get("status", {}).get("name", "Unknown"),
+        assignee=fields.get("assignee", {}).get("displayName", "Unassigned") if fields.get("assignee") else "Unassigned",
+        reporter=fields.get("reporter", {}).get("displayName", "Unknown") if fields.get("reporter") else "Unknown",
+        priority=fields.get("priority", {}).get("name", "Unknown") if fields.get("priority") else "Unknown",
+        created=fields.get("created", ""),
+        updated=fields.get("updated", ""),
+        updated_ts=parse_timestamp(fields.get("updated", "")),
+        resolutiondate=fields.get("resolutiondate", ""),
+        comments=my_comments,  # 내가 작성한 댓글만
+        worklogs=my_worklogs,  # 내가 작성한 워크로그만
+        attachments=attachments,
+        changelog=changelog,
+        url=f"{JIRA_BASE}/browse/{issue_data.get('key', '')}",
+        comment_count=len(my_comments),  # 내가 작성한 댓글 수
+        worklog_count=len(my_worklogs),  # 내가 작성한 워크로그 수
+        attachment_count=len(attachments),
+        total_comments=len(all_comments),  # 전체 댓글 수 (참고용)
+        total_worklogs=len(all_worklogs)  # 전체 워크로그 수 (참고용)
+    )
+    
+    return detailed_issue
+
+
+# 마지막 collect_jira_data 실행의 사전 필터 통계 (벤치마크/로그 확인용)
+JIRA_PRUNE_STATS = {"candidates": 0, "pruned": 0, "detail_calls": 0, "comment_calls": 0}
+
+# 마지막 수집에서 실패했거나 일부가 누락된 데이터 종류 {"jira"/"confluence": 오류 메시지}
+# (빈 목록을 돌려줘도 실패로 구분 - 실행 체크포인트는 이 종류를 완료로 저장하지 않음)
+COLLECTION_ERRORS = {}
+
+def search_my_worklog_issue_keys(headers, authors=None):
+    """
+    기간 내 내 워크로그가 있는 이슈 키 집합 (worklogAuthor/worklogDate JQL, 키만 조회)
+    
+    Args:
+        authors (list, optional): 워크로그 작성자 목록 (팀 모드) - 없으면 currentUser()
+    
+    Returns:
+        set: 이슈 키 집합 (조회 실패 시 None - 사전 필터를 사용하지 않음)
+    """
+    since_str = SINCE.strftime("%Y-%m-%d")
+    end_str = NOW_UTC.strftime("%Y-%m-%d")
+    author_clause = f"worklogAuthor in ({_jql_user_list(authors)})" if authors else "worklogAuthor = currentUser()"
+    jql = f"{author_clause} AND worklogDate >= '{since_str}' AND worklogDate <= '{end_str}'"
+    
+    keys = set()
+    start = 0
+    try:
+        while True:
+            params = {"jql": jql, "fields": "key", "startAt": start, "maxResults": 500}
+            r = http_client.get(f"{JIRA_BASE}/rest/api/2/search", headers=headers, params=params)
+            r.raise_for_status()
+            data = r.json()
+            issues = data.get("issues", [])
+            keys.update(issue.get("key", "") for issue in issues)
+            start += len(issues)
+            if not issues or start >= data.get("total", 0):
+                return keys
     except Exception as e:
-        print(f"❌ Jira 이슈 상세 정보 가져오기 실패 ({issue_key}): {e}")
+        print(f"⚠️ 워크로그 사전 조회 실패 (사전 필터 생략): {e}")
         return None
 
-def collect_jira_data(username, token, excluded_issues=None):
+def has_my_comment_in_window(headers, issue, username):
+    """
+    이슈에 기간 내 내 댓글이 있는지 확인 (상세 조회 전 사전 필터)
+    
+    검색 결과의 comment 필드를 우선 사용하고, 없거나 일부만 온 경우에만
+    댓글 전용 엔드포인트(/issue/{key}/comment)를 조회합니다. 확인할 수 없으면 True.
+    """
+    authors = comment_authors_in_window(headers, issue)
+    return authors is None or username in authors
+
+def comment_authors_in_window(headers, issue):
+    """
+    기간 내 댓글(날짜를 알 수 없는 댓글 포함)을 작성한 사용자명 집합
+    
+    Returns:
+        set: 작성자 사용자명 집합 (댓글을 확인할 수 없으면 None)
+    """
+    comment_field = issue.get("fields", {}).get("comment")
+    if isinstance(comment_field, dict) and len(comment_field.get("comments", [])) >= comment_field.get("total", 0):
+        comments = comment_field.get("comments", [])
+    else:
+        try:
+            JIRA_PRUNE_STATS["comment_calls"] += 1
+            r = http_client.get(f"{JIRA_BASE}/rest/api/2/issue/{issue.get('key', '')}/comment",
+                                headers=headers, params={"maxResults": 1000})
+            r.raise_for_status()
+            comments = r.json().get("comments", [])
+        except Exception as e:
+            print(f"⚠️ {issue.get('key', '')} 댓글 사전 조회 실패: {e}")
+            return None
+    
+    authors = set()
+    for comment in comments:
+        ts = parse_timestamp(comment.get("created", ""))
+        # 날짜를 알 수 없는 댓글은 filter_my_comments와 같이 포함으로 간주
+        if ts is None or in_window(ts):
+            authors.add(comment.get("author", {}).get("name", ""))
+    return authors
+
+def _jql_user_list(usernames):
+    """JQL in (...) 목록용 사용자명 문자열"""
+    return ", ".join(f'"{name}"' for name in usernames)
+
+def jira_date_clause():
+    """모드에 따른 JQL 날짜 조건"""
+    if RELEASE_MODE:
+        return f"(updated >= {JQL_DATE_RANGE})"
+    return "(updated >= '2025-10-02' AND updated <= '2025-10-03')"
+
+def collect_jira_data(username, token, excluded_issues=None, master_issue=None):
     """
     Jira 데이터 수집
     
     Args:
         username (str): Jira 사용자명
         token (str): Jira API 토큰
-        excluded_issues (list, optional): 분석에서 제외할 이슈 키 목록
+        excluded_issues (list, optional): 분석에서 제외할 이슈 키 목록 (URL도 가능)
+        master_issue (str, optional): 마스터 이슈 키/URL - 마스터와 그 서브태스크(과거 보고서)를 제외
         
     Returns:
         list: Jira 활동 데이터 리스트
@@ -404,12 +599,18 @@ def collect_jira_data(username, token, excluded_issues=None):
         "Authorization": f"Bearer {token}"
     }
     
-    if excluded_issues is None:
-        excluded_issues = []
+    # 이슈 URL로 지정된 경우도 키로 정규화
+    excluded_issues = [jira_master.issue_key_from(key) for key in (excluded_issues or []) if key]
+    COLLECTION_ERRORS.pop("jira", None)
+    
+    # 마스터의 서브태스크는 JQL parent 조건으로 제외 (서브태스크 목록을 조회하지 않음)
+    master_key = jira_master.issue_key_from(master_issue) if master_issue else None
+    if master_key and master_key not in excluded_issues:
+        excluded_issues.append(master_key)
     
     try:
         # 사용자 ID 가져오기
-        r = requests.get(f"{JIRA_BASE}/rest/api/2/myself", headers=headers)
+        r = http_client.get(f"{JIRA_BASE}/rest/api/2/myself", headers=headers)
         r.raise_for_status()
         user_data = r.json()
         
@@ -419,20 +620,21 @@ def collect_jira_data(username, token, excluded_issues=None):
         # 3. watcher에 내가 있는 경우: watcher = currentUser()
         
         # 모드에 따른 JQL 날짜 조건 사용
-        if RELEASE_MODE:
-            jql = f"(updated >= {JQL_DATE_RANGE}) AND (assignee = currentUser() OR assignee was currentUser() OR reporter = currentUser() OR watcher = currentUser() OR comment ~ currentUser() OR worklogAuthor = currentUser())"
-        else:
-            #jql = f"({JQL_DATE_RANGE}) AND (assignee = currentUser() OR assignee was currentUser() OR reporter = currentUser() OR watcher = currentUser() OR comment ~ currentUser() OR worklogAuthor = currentUser())"
-            jql = "(updated >= '2025-10-02' AND updated <= '2025-10-03') AND (assignee = currentUser() OR assignee was currentUser() OR reporter = currentUser() OR watcher = currentUser() OR comment ~ currentUser() OR worklogAuthor = currentUser())"
+        jql = f"{jira_date_clause()} AND (assignee = currentUser() OR assignee was currentUser() OR reporter = currentUser() OR watcher = currentUser() OR comment ~ currentUser() OR worklogAuthor = currentUser())"
+
+        # 제외 대상은 서버 측에서 걸러 상세 조회 자체를 하지 않음
+        jql += jira_master.exclusion_jql(master_key, excluded_issues)
+        if master_key:
+            print(f"📋 JQL 제외: 마스터 이슈 {master_key}와 서브태스크")
 
         params = {
             "jql": jql,
-            "fields": "key,summary,updated,status,assignee,reporter,created,description",
+            "fields": "key,summary,updated,status,assignee,reporter,created,description,comment",
             "expand": "comments",
             "maxResults": 500
         }
         
-        r = requests.get(f"{JIRA_BASE}/rest/api/2/search", headers=headers, params=params)
+        r = http_client.get(f"{JIRA_BASE}/rest/api/2/search", headers=headers, params=params)
         r.raise_for_status()
         
         # JSON 응답 검증
@@ -440,16 +642,19 @@ def collect_jira_data(username, token, excluded_issues=None):
             data = r.json()
         except json.JSONDecodeError:
             print(f"❌ Jira API 응답이 올바른 JSON 형식이 아닙니다: {r.text[:200]}")
+            COLLECTION_ERRORS["jira"] = "응답이 JSON 형식이 아님"
             return []
         
         # 응답 구조 검증
         if not isinstance(data, dict):
             print(f"❌ Jira API 응답이 딕셔너리가 아닙니다: {type(data)}")
+            COLLECTION_ERRORS["jira"] = "응답이 딕셔너리가 아님"
             return []
         
         # issues 필드 검증
         if "issues" not in data:
             print(f"❌ Jira API 응답에 'issues' 필드가 없습니다. 사용 가능한 키: {list(data.keys())}")
+            COLLECTION_ERRORS["jira"] = "응답에 'issues' 필드 없음"
             return []
         
         issues = data.get("issues", [])
@@ -457,10 +662,16 @@ def collect_jira_data(username, token, excluded_issues=None):
         # issues가 리스트인지 확인
         if not isinstance(issues, list):
             print(f"❌ 'issues' 필드가 리스트가 아닙니다: {type(issues)}")
+            COLLECTION_ERRORS["jira"] = "'issues' 필드가 리스트가 아님"
             return []
         
         print(f"✅ Jira에서 {len(issues)}개의 이슈를 가져왔습니다.")
         
+        # 사전 필터: 기간 내 내 워크로그/댓글이 없는 이슈(단순 watcher/reporter)는 상세 조회 생략
+        for name in JIRA_PRUNE_STATS:
+            JIRA_PRUNE_STATS[name] = 0
+        my_worklog_keys = search_my_worklog_issue_keys(headers)
+        
         activities = []
         excluded_count = 0
         
@@ -469,7 +680,7 @@ def collect_jira_data(username, token, excluded_issues=None):
                 # 이슈 키 확인
                 issue_key = issue.get("key", "")
                 
-                # 제외 대상 이슈인지 확인
+                # 제외 대상 이슈인지 확인 (JQL에서 이미 제외되지만 안전장치로 유지)
                 if issue_key in excluded_issues:
                     excluded_count += 1
                     fields = issue.get("fields", {})
@@ -489,56 +700,41 @@ def collect_jira_data(username, token, excluded_issues=None):
                 if not updated_str:
                     continue
                     
-                updated_dt = iso_to_dt(updated_str)
-                created_dt = iso_to_dt(created_str) if created_str else None
+                updated_ts = parse_timestamp(updated_str)
                 
-                if updated_dt and updated_dt >= SINCE:
+                if updated_ts is not None and updated_ts >= SINCE_TS:
+                    JIRA_PRUNE_STATS["candidates"] += 1
+                    if (my_worklog_keys is not None and issue_key not in my_worklog_keys
+                            and not has_my_comment_in_window(headers, issue, username)):
+                        JIRA_PRUNE_STATS["pruned"] += 1
+                        print(f"⏭️ {issue_key} 건너뜀 - 기간 내 내 댓글/워크로그 없음 (사전 필터)")
+                        continue
+                    
+                    JIRA_PRUNE_STATS["detail_calls"] += 1
                     print(f"🔍 {issue_key} 상세 정보 수집 중...")
                     
                     # 이슈 상세 정보 가져오기 (댓글, 워크로그 등 포함)
-                    detailed_issue = get_jira_issue_details(username, token, issue_key)
+                    detailed_issue = get_jira_issue_details(username, token, issue_key, updated=updated_str)
                     #print(f"🔍 {issue_key} 상세 정보: {detailed_issue}")
 
                     if detailed_issue:
                         # 내가 작성한 댓글이나 워크로그가 있는 경우만 포함
                         has_my_activity = (
-                            detailed_issue.get("my_comments_count", 0) > 0 or 
-                            detailed_issue.get("my_worklogs_count", 0) > 0
+                            detailed_issue.comment_count > 0 or
+                            detailed_issue.worklog_count > 0
                         )
                         
                         if has_my_activity:
-                            # 상세 정보가 있고 내 활동이 있는 경우에만 활동 목록에 추가
-                            activities.append({
-                                "source": "jira",
-                                "type": "detailed_issue",
-                                "issue_key": detailed_issue["key"],
-                                "summary": detailed_issue["summary"],
-                                "description": detailed_issue["description"],
-                                "status": detailed_issue["status"],
-                                "assignee": detailed_issue["assignee"],
-                                "reporter": detailed_issue["reporter"],
-                                "priority": detailed_issue["priority"],
-                                "created": detailed_issue["created"],
-                                "updated": detailed_issue["updated"],
-                                "resolutiondate": detailed_issue["resolutiondate"],
-                                "comments": detailed_issue["comments"],  # 내가 작성한 댓글만
-                                "worklogs": detailed_issue["worklogs"],  # 내가 작성한 워크로그만
-                                "attachments": detailed_issue["attachments"],
-                                "changelog": detailed_issue["changelog"],
-                                "url": detailed_issue["url"],
-                                "comment_count": detailed_issue["my_comments_count"],  # 내가 작성한 댓글 수
-                                "worklog_count": detailed_issue["my_worklogs_count"],  # 내가 작성한 워크로그 수
-                                "attachment_count": len(detailed_issue["attachments"]),
-                                "total_comments": detailed_issue["total_comments"],  # 전체 댓글 수 (참고용)
-                                "total_worklogs": detailed_issue["total_worklogs"]  # 전체 워크로그 수 (참고용)
-                            })
+                            # 상세 정보가 있고 내 활동이 있는 경우에만 활동 목록에 추가 (복사 없이 그대로 사용)
+                            activities.append(detailed_issue)
                             
-                            print(f"✅ {issue_key} 상세 정보 수집 완료 (내 댓글: {detailed_issue['my_comments_count']}/{detailed_issue['total_comments']}개, 내 워크로그: {detailed_issue['my_worklogs_count']}/{detailed_issue['total_worklogs']}개)")
+                            print(f"✅ {issue_key} 상세 정보 수집 완료 (내 댓글: {detailed_issue.comment_count}/{detailed_issue.total_comments}개, 내 워크로그: {detailed_issue.worklog_count}/{detailed_issue.total_worklogs}개)")
                         else:
                             print(f"⏭️ {issue_key} 건너뜀 - 내가 작성한 댓글/워크로그 없음 (전체 댓글: {detailed_issue.get('total_comments', 0)}개, 전체 워크로그: {detailed_issue.get('total_worklogs', 0)}개)")
                     else:
                         # 상세 정보 가져오기 실패한 경우 기본 정보만 추가
                         print(f"⚠️ {issue_key} 상세 정보 수집 실패, 기본 정보만 사용")
+                        COLLECTION_ERRORS["jira"] = f"{issue_key} 상세 정보 수집 실패"
                         
                         # description 필드 안전하게 처리
                         description = ""
@@ -574,71 +770,184 @@ def collect_jira_data(username, token, excluded_issues=None):
                         # summary 필드 안전 처리
                         summary = fields.get("summary", "No Summary")
                         
-                        activities.append({
-                            "source": "jira",
-                            "type": "basic_issue",
-                            "issue_key": issue_key,
-                            "summary": summary,
-                            "description": description,
-                            "status": status_name,
-                            "assignee": assignee_name,
-                            "reporter": reporter_name,
-                            "created": created_str or "Unknown",
-                            "updated": updated_str,
-                            "url": f"{JIRA_BASE}/browse/{issue_key}",
-                            "comments": [],
-                            "worklogs": [],
-                            "attachments": [],
-                            "changelog": [],
-                            "comment_count": 0,
-                            "worklog_count": 0,
-                            "attachment_count": 0
-                        })
+                        activities.append(JiraIssue(
+                            source="jira",
+                            type="basic_issue",
+                            issue_key=issue_key,
+                            summary=summary,
+                            description=description,
+                            status=status_name,
+                            assignee=assignee_name,
+                            reporter=reporter_name,
+                            created=created_str or "Unknown",
+                            updated=updated_str,
+                            updated_ts=updated_ts,
+                            url=f"{JIRA_BASE}/browse/{issue_key}",
+                            comments=[],
+                            worklogs=[],
+                            attachments=[],
+                            changelog=[],
+                            comment_count=0,
+                            worklog_count=0,
+                            attachment_count=0
+                        ))
                     
             except Exception as e:
                 print(f"⚠️ 이슈 처리 중 오류 (키: {issue.get('key', 'Unknown')}): {e}")
+                COLLECTION_ERRORS["jira"] = f"{issue.get('key', 'Unknown')} 처리 오류: {e}"
                 continue
         
         if excluded_count > 0:
             print(f"📊 Jira 분석 결과: {len(activities)}개 포함, {excluded_count}개 제외")
+        if JIRA_PRUNE_STATS["candidates"]:
+            print(f"⚡ Jira 사전 필터: 후보 {JIRA_PRUNE_STATS['candidates']}개 중 상세 조회 "
+                  f"{JIRA_PRUNE_STATS['pruned']}회 생략 (상세 조회 {JIRA_PRUNE_STATS['detail_calls']}회, "
+                  f"댓글 조회 {JIRA_PRUNE_STATS['comment_calls']}회)")
         
         return activities
         
     except requests.exceptions.RequestException as e:
         print(f"❌ Jira 네트워크 요청 오류: {e}")
+        COLLECTION_ERRORS["jira"] = f"네트워크 요청 오류: {e}"
         return []
     except json.JSONDecodeError as e:
         print(f"❌ Jira JSON 디코딩 오류: {e}")
+        COLLECTION_ERRORS["jira"] = f"JSON 디코딩 오류: {e}"
         return []
     except KeyError as e:
         print(f"❌ Jira 응답에서 필수 필드 누락: {e}")
+        COLLECTION_ERRORS["jira"] = f"필수 필드 누락: {e}"
         return []
     except Exception as e:
         print(f"❌ Jira 데이터 수집 예상치 못한 오류: {e}")
         import traceback
         traceback.print_exc()
+        COLLECTION_ERRORS["jira"] = str(e)
         return []
 
 # =============================================================================
 # CONFLUENCE 데이터 수집 함수
 # =============================================================================
 
+# 페이지 버전 이력 동시 조회 수
+CONFLUENCE_HISTORY_WORKERS = 4
+# 검색 한 페이지당 요청 결과 수 (서버 상한이 더 작으면 _links.next로 이어서 조회)
+CONFLUENCE_PAGE_LIMIT = 100
+
+# 페이지 id -> {"latest": 최신 버전 번호, "versions": {번호: {"when", "by", "message"}}}
+_confluence_version_cache = JsonCache("confluence_versions.json")
+
+# 마지막 수집의 버전 이력 조회 통계 (벤치마크/로그용)
+CONFLUENCE_VERSION_STATS = {"pages": 0, "fetched": 0, "cached": 0, "failed": 0}
+
+def search_confluence_pages(headers, cql):
+    """
+    CQL 검색 결과를 _links.next를 따라 끝까지 조회
+    
+    Returns:
+        list: 검색된 페이지 목록 (space, version 포함)
+    """
+    url = f"{CONFLUENCE_BASE}/rest/api/content/search"
+    params = {"cql": cql, "limit": CONFLUENCE_PAGE_LIMIT, "expand": "space,version"}
+    pages = []
+    
+    while url:
+        # 결과가 바뀌지 않았으면 조건부 요청(304)으로 본문을 다시 받지 않음
+        r = http_client.get(url, headers=headers, params=params, cache=True)
+        r.raise_for_status()
+        data = r.json()
+        pages.extend(data.get("results", []))
+        
+        # 다음 페이지 링크는 쿼리 파라미터가 모두 포함된 상대 경로
+        links = data.get("_links", {})
+        next_link = links.get("next")
+        if not next_link or not data.get("results"):
+            break
+        url = next_link if next_link.startswith("http") else f"{links.get('base', CONFLUENCE_BASE)}{next_link}"
+        params = None
+    
+    return pages
+
+def get_confluence_versions(headers, page_id, latest_number):
+    """
+    페이지 버전 이력 (page id + 버전 번호 기준 캐시)
+    
+    캐시된 최신 버전이 현재 버전과 같으면 요청하지 않고, 아니면 새 버전까지만 조회합니다.
+    이력은 최신 버전부터 오므로 수집 기간(SINCE) 이전 버전에 닿으면 더 조회하지 않고,
+    캐시에도 기간 내 버전만 보관합니다 (since: 캐시가 담고 있는 기간의 시작).
+    
+    Args:
+        headers (dict): 요청 헤더
+        page_id (str): 페이지 id
+        latest_number (int): 검색 결과의 현재 버전 번호
+        
+    Returns:
+        tuple: (버전 딕셔너리 {번호(str): {"when", "by", "message"}}, 서버 조회 여부)
+    """
+    cached = _confluence_version_cache.get(page_id)
+    if cached is None or cached.get("since", 0) > SINCE_TS:
+        # 캐시가 이번 기간의 시작보다 늦은 버전만 담고 있으면 처음부터 다시 조회
+        cached = {"latest": 0, "versions": {}}
+    if latest_number and cached["latest"] >= latest_number:
+        return cached["versions"], False
+    
+    versions = dict(cached["versions"])
+    url = f"{CONFLUENCE_BASE}/rest/api/content/{page_id}/version"
+    params = {"start": 0, "limit": 50}
+    while url:
+        r = http_client.get(url, headers=headers, params=params)
+        r.raise_for_status()
+        data = r.json()
+        reached_known = False
+        for version in data.get("results", []):
+            number = version.get("number", 0)
+            if number <= cached["latest"] or _before_since(version):
+                reached_known = True
+                break
+            by = version.get("by", {})
+            versions[str(number)] = {
+                "when": version.get("when", ""),
+                "by": by.get("username", by.get("name", "")),
+                "message": version.get("message", "")
+            }
+        
+        links = data.get("_links", {})
+        next_link = links.get("next")
+        if reached_known or not next_link or not data.get("results"):
+            break
+        url = next_link if next_link.startswith("http") else f"{links.get('base', CONFLUENCE_BASE)}{next_link}"
+        params = None
+    
+    latest = max([int(n) for n in versions] + [latest_number or 0, cached["latest"]])
+    versions = {number: version for number, version in versions.items() if not _before_since(version)}
+    _confluence_version_cache.set(page_id, {"latest": latest, "since": SINCE_TS, "versions": versions})
+    return versions, True
+
+def _before_since(version):
+    """수집 기간 시작 전에 작성된 버전인지 (시간을 알 수 없으면 False)"""
+    when_ts = parse_timestamp(version.get("when", ""))
+    return when_ts is not None and when_ts < SINCE_TS
+
 def collect_confluence_data(username, token):
     """
     Confluence 데이터 수집
     
+    검색 결과를 끝까지 페이지 단위로 조회한 뒤, 각 페이지의 버전 이력을 동시에 받아
+    기간 내 내가 작성한 버전이 있는 페이지만 남깁니다.
+    
     Args:
         username (str): Confluence 사용자명
         token (str): Confluence API 토큰
         
     Returns:
-        list: Confluence 활동 데이터 리스트
+        list: Confluence 활동 데이터 리스트 (versions: 기간 내 내가 작성한 버전 목록)
     """
     headers = {
         "Accept": "application/json",
         "Authorization": f"Bearer {token}"
     }
     
+    COLLECTION_ERRORS.pop("confluence", None)
     try:
         # 모드에 따른 날짜 범위 설정 (전역 변수 사용)
         since_str = SINCE.strftime("%Y-%m-%d")
@@ -646,82 +955,166 @@ def collect_confluence_data(username, token):
         
         print(f"📝 Confluence 검색 기간: {since_str} ~ {end_str}")
         
-        params = {
-            "cql": f"contributor = currentUser() AND lastModified >= '{since_str}' AND lastModified <= '{end_str}'",
-            "limit": 500
-        }
-        
-        r = requests.get(f"{CONFLUENCE_BASE}/rest/api/content/search", headers=headers, params=params)
-        r.raise_for_status()
-        data = r.json()
-        
-        activities = []
-        for page in data.get("results", []):
-            activities.append({
-                "source": "confluence",
-                "type": "page_activity", 
-                "page_id": page["id"],
-                "title": page["title"],
-                "space": page.get("space", {}).get("name", ""),
-                "space_key": page.get("space", {}).get("key", ""),
-                "last_modified": page.get("version", {}).get("when", ""),
-                "url": f"{CONFLUENCE_BASE}/pages/viewpage.action?pageId={page['id']}"
-            })
+        cql = f"contributor = currentUser() AND lastModified >= '{since_str}' AND lastModified <= '{end_str}'"
+        pages = search_confluence_pages(headers, cql)
+        print(f"📝 Confluence 검색 결과: {len(pages)}개 페이지")
         
-        return activities
+        history = fetch_confluence_histories(headers, pages)
+        if CONFLUENCE_VERSION_STATS["failed"]:
+            COLLECTION_ERRORS["confluence"] = f"버전 이력 조회 실패 {CONFLUENCE_VERSION_STATS['failed']}개 페이지"
+        return build_confluence_activities(pages, history, username)
         
     except Exception as e:
         print(f"❌ Confluence 데이터 수집 오류: {e}")
+        COLLECTION_ERRORS["confluence"] = str(e)
         return []
 
+def fetch_confluence_histories(headers, pages):
+    """
+    검색된 페이지들의 버전 이력 동시 조회 (캐시에 최신 버전이 있으면 요청 생략)
+    
+    Returns:
+        dict: {page_id: {버전 번호: 버전 정보} 또는 None(조회 실패)}
+    """
+    history = {}
+    fetched = failed = 0
+    with ThreadPoolExecutor(max_workers=CONFLUENCE_HISTORY_WORKERS) as executor:
+        futures = {
+            executor.submit(get_confluence_versions, headers, page["id"],
+                            page.get("version", {}).get("number", 0)): page["id"]
+            for page in pages
+        }
+        for future in as_completed(futures):
+            page_id = futures[future]
+            try:
+                history[page_id], from_server = future.result()
+                fetched += from_server
+            except Exception as e:
+                print(f"⚠️ Confluence {page_id} 버전 이력 조회 실패: {e}")
+                history[page_id] = None
+                failed += 1
+    
+    # 이번 검색에 나오지 않은 페이지의 이력은 캐시에서 제거 (캐시 크기를 최근 검색 결과 분량으로 유지)
+    seen = {str(page["id"]) for page in pages}
+    for page_id in _confluence_version_cache.keys():
+        if page_id not in seen:
+            _confluence_version_cache.pop(page_id)
+    try:
+        _confluence_version_cache.save()
+    except Exception as e:
+        print(f"⚠️ Confluence 버전 캐시 저장 실패: {e}")
+    CONFLUENCE_VERSION_STATS.update(pages=len(pages), fetched=fetched,
+                                    cached=len(pages) - fetched - failed, failed=failed)
+    print(f"📝 Confluence 버전 이력: {fetched}개 페이지 조회, "
+          f"{CONFLUENCE_VERSION_STATS['cached']}개 캐시 사용")
+    return history
+
+def build_confluence_activities(pages, history, username):
+    """
+    버전 이력에서 기간 내 username이 작성한 버전이 있는 페이지만 활동으로 변환
+    
+    Returns:
+        list: ConfluencePage 리스트 (이력 조회에 실패한 페이지는 버전 정보 없이 포함)
+    """
+    activities = []
+    for page in pages:
+        versions = history.get(page["id"])
+        my_versions = None
+        if versions is not None:
+            my_versions = []
+            for number, version in versions.items():
+                if version.get("by") != username:
+                    continue
+                when_ts = parse_timestamp(version.get("when", ""))
+                if in_window(when_ts):
+                    my_versions.append({"number": int(number), "when": version.get("when", ""),
+                                        "message": version.get("message", "")})
+            if not my_versions:
+                # 기간 내 내가 작성한 버전이 없으면 제외 (다른 사람의 수정만 있는 페이지)
+                continue
+            my_versions.sort(key=lambda v: v["number"])
+        
+        activities.append(ConfluencePage(
+            source="confluence",
+            type="page_activity",
+            page_id=page["id"],
+            title=page["title"],
+            space=page.get("space", {}).get("name", ""),
+            space_key=page.get("space", {}).get("key", ""),
+            last_modified=page.get("version", {}).get("when", ""),
+            last_modified_ts=parse_timestamp(page.get("version", {}).get("when", "")),
+            url=f"{CONFLUENCE_BASE}/pages/viewpage.action?pageId={page['id']}",
+            versions=my_versions or [],
+            my_version_count=len(my_versions or [])
+        ))
+    return activities
+
 # =============================================================================
 # GERRIT 데이터 수집 함수
 # =============================================================================
 
-def collect_gerrit_data(username, tokens):
+def collect_gerrit_data(username, tokens, members=None):
     """
     Gerrit 데이터 수집 (모든 서버)
     
     Args:
         username (str): Gerrit 사용자명
         tokens (dict): 서버별 Gerrit 토큰 딕셔너리 {"NA": "token1", "EU": "token2", "AS": "token3"}
+        members (list, optional): 팀 모드 구성원 목록 (username은 인증 계정으로만 사용)
         
     Returns:
         tuple: (reviews, comments) - 리뷰 데이터와 댓글 데이터
+            (팀 모드에서는 {구성원: (reviews, comments)})
     """
-    all_reviews = []
-    all_comments = []
+    users = members or [username]
+    results = {user: ([], []) for user in users}
+    for name in GERRIT_PAYLOAD_STATS:
+        GERRIT_PAYLOAD_STATS[name] = 0
+    GERRIT_FAILED_SERVERS.clear()
     
     for server, token in tokens.items():
         if server not in GERRIT_URLS:
             continue
             
         try:
-            reviews, comments = collect_gerrit_server_data(username, token, server)
-            all_reviews.extend(reviews)
-            all_comments.extend(comments)
+            server_results = collect_gerrit_server_data(username, token, server, members=users)
+            for user, (reviews, comments) in server_results.items():
+                results[user][0].extend(reviews)
+                results[user][1].extend(comments)
         except Exception as e:
             print(f"❌ Gerrit {server} 서버 데이터 수집 오류: {e}")
+            GERRIT_FAILED_SERVERS[server] = str(e)
+    
+    stats = GERRIT_PAYLOAD_STATS
+    print(f"📦 Gerrit 응답 크기: 검색 {stats['search_requests']}회 {stats['search_bytes'] / 1024:.1f} KB "
+          f"(변경사항 {stats['changes']}개), 댓글 {stats['comment_requests']}회 {stats['comment_bytes'] / 1024:.1f} KB")
+    if GERRIT_FAILED_SERVERS or stats["failed_comments"]:
+        print(f"⚠️ Gerrit 데이터 일부 누락: 실패 서버 {', '.join(GERRIT_FAILED_SERVERS) or '없음'}, "
+              f"상세 댓글 실패 {stats['failed_comments']}건")
     
-    return all_reviews, all_comments
+    if members is None:
+        return results[username]
+    return results
 
-def collect_gerrit_server_data(username, token, server="NA"):
+def collect_gerrit_server_data(username, token, server="NA", members=None):
     """
     특정 Gerrit 서버에서 데이터 수집
     
     Args:
-        username (str): Gerrit 사용자명
+        username (str): Gerrit 사용자명 (인증 계정)
         token (str): Gerrit API 토큰
         server (str): 서버 이름 (NA, EU, AS)
+        members (list, optional): 팀 모드 구성원 목록 - 지정하면 한 번 검색/조회한 변경사항을
+            구성원별로 나눔
         
     Returns:
         tuple: (reviews, comments) - 해당 서버의 리뷰 데이터와 댓글 데이터
+            (팀 모드에서는 {구성원: (reviews, comments)})
     """
     auth = HTTPBasicAuth(username, token)
     base_url = GERRIT_URLS[server]
-    
-    all_reviews = []
-    all_comments = []
+    users = members or [username]
+    results = {user: ([], []) for user in users}
     
     # 모드에 따른 날짜 범위 설정 (전역 변수 사용)
     since_str = SINCE.strftime("%Y-%m-%d")
@@ -729,158 +1122,455 @@ def collect_gerrit_server_data(username, token, server="NA"):
     
     print(f"🔍 Gerrit {server} 서버 검색 기간: {since_str} ~ {end_str}")
     
-    queries = [
-        f"owner:{username} after:{since_str} before:{end_str}",  # 내가 작성한 리뷰
-        f"reviewer:{username} after:{since_str} before:{end_str}",  # 내가 리뷰한 것들
-        f"commentby:{username} after:{since_str} before:{end_str}"  # 내가 댓글 단 것들
-    ]
+    # 작성/리뷰/댓글 조건을 OR로 묶어 한 번에 검색 (조건별로 따로 검색하면 결과가 크게 겹침)
+    # 검색 실패는 호출자(collect_gerrit_data)에 그대로 전달해 서버 단위 누락으로 기록
+    query = build_gerrit_query(users, since_str, end_str)
+    changes = search_gerrit_changes(auth, base_url, query)
     
-    processed_changes = set()  # 중복 방지
+    processed_changes = set()  # 중복 방지 (페이지 경계에서 결과가 밀리는 경우)
     
-    for query in queries:
+    for change in changes:
+        change_id = change.get("id", "")
+        if change_id in processed_changes:
+            continue
+        processed_changes.add(change_id)
+        
+        # 시간 필터링
+        updated = change.get("updated", "")
+        updated_ts = parse_timestamp(updated)
+        if updated_ts is None or updated_ts < SINCE_TS:
+            continue
+        
+        # 상세 댓글 가져오기 (변경사항마다 한 번만 조회)
         try:
-            changes = search_gerrit_changes(auth, base_url, query, limit=500)
-            
-            for change in changes:
-                change_id = change.get("id", "")
-                if change_id in processed_changes:
-                    continue
-                processed_changes.add(change_id)
-                
-                change_number = change.get("_number", "")
-                subject = change.get("subject", "")
-                status = change.get("status", "")
-                owner = change.get("owner", {})
-                created = change.get("created", "")
-                updated = change.get("updated", "")
-                project = change.get("project", "")
-                branch = change.get("branch", "")
-                
-                # 시간 필터링
-                updated_dt = iso_to_dt(updated)
-                if not updated_dt or updated_dt < SINCE:
-                    continue
-                
-                # 내가 소유자인 경우 (내가 작성한 리뷰)
-                owner_username = owner.get("username", owner.get("name", ""))
-                if owner_username == username:
-                    all_reviews.append({
-                        "source": f"gerrit_{server.lower()}",
-                        "type": "review_created",
-                        "change_id": change_id,
-                        "change_number": change_number,
-                        "subject": subject,
-                        "status": status,
-                        "project": project,
-                        "branch": branch,
-                        "created": created,
-                        "updated": updated,
-                        "url": f"{base_url}/c/{change_number}"
-                    })
-                
-                # 메시지 확인 (내 댓글)
-                messages = change.get("messages", [])
-                for message in messages:
-                    author = message.get("author", {})
-                    author_username = author.get("username", author.get("name", ""))
-                    message_date = message.get("date", "")
-                    
-                    if author_username == username:
-                        message_dt = iso_to_dt(message_date)
-                        if message_dt and message_dt >= SINCE:
-                            all_comments.append({
-                                "source": f"gerrit_{server.lower()}",
-                                "type": "review_comment",
-                                "change_id": change_id,
-                                "change_number": change_number,
-                                "subject": subject,
-                                "project": project,
-                                "message": message.get("message", ""),
-                                "created": message_date,
-                                "url": f"{base_url}/c/{change_number}"
-                            })
-                
-                # 상세 댓글 가져오기
-                try:
-                    detailed_comments = get_gerrit_comments(auth, base_url, change_id)
-                    
-                    for file_path, comments_list in detailed_comments.items():
-                        for comment in comments_list:
-                            author = comment.get("author", {})
-                            author_username = author.get("username", author.get("name", ""))
-                            comment_updated = comment.get("updated", "")
-                            
-                            if author_username == username:
-                                comment_dt = iso_to_dt(comment_updated)
-                                if comment_dt and comment_dt >= SINCE:
-                                    all_comments.append({
-                                        "source": f"gerrit_{server.lower()}",
-                                        "type": "code_comment",
-                                        "change_id": change_id,
-                                        "change_number": change_number,
-                                        "subject": subject,
-                                        "project": project,
-                                        "file_path": file_path,
-                                        "line": comment.get("line", ""),
-                                        "message": comment.get("message", ""),
-                                        "created": comment_updated,
-                                        "url": f"{base_url}/c/{change_number}"
-                                    })
-                except Exception as e:
-                    print(f"    ⚠️ {change_id} 상세 댓글 오류: {e}")
-                
-                time.sleep(0.1)  # API 부하 방지
-                
+            detailed_comments = get_gerrit_comments(auth, base_url, change_id, updated)
         except Exception as e:
-            print(f"  ⚠️ 쿼리 '{query}' 오류: {e}")
+            print(f"    ⚠️ {change_id} 상세 댓글 오류: {e}")
+            with _gerrit_stats_lock:
+                GERRIT_PAYLOAD_STATS["failed_comments"] += 1
+            detailed_comments = {}
+        
+        for user in users:
+            reviews, comments = gerrit_change_records(change, detailed_comments, user, server, base_url)
+            results[user][0].extend(reviews)
+            results[user][1].extend(comments)
     
-    return all_reviews, all_comments
+    if members is None:
+        return results[username]
+    return results
 
-def gerrit_request(url, auth, params=None):
-    """Gerrit API 요청"""
-    try:
-        response = requests.get(url, auth=auth, params=params, timeout=30)
-        
-        # Gerrit은 보안상 ")]}'" 접두사를 응답에 추가함
-        text = response.text
-        if text.startswith(")]}'\n"):
-            text = text[5:]
+def gerrit_change_records(change, detailed_comments, username, server, base_url):
+    """
+    검색 결과의 변경사항 하나와 상세 댓글에서 특정 사용자의 리뷰/댓글 레코드 구성
+    
+    Args:
+        change (dict): 검색 결과 변경사항 (DETAILED_ACCOUNTS, MESSAGES 포함)
+        detailed_comments (dict): /changes/{id}/comments 응답 {파일 경로: [댓글, ...]}
+        username (str): 사용자명
+        server (str): 서버 이름
+        base_url (str): 서버 기본 URL
         
-        response.raise_for_status()
+    Returns:
+        tuple: (reviews, comments)
+    """
+    reviews = []
+    comments = []
+    
+    change_id = change.get("id", "")
+    change_number = change.get("_number", "")
+    subject = change.get("subject", "")
+    status = change.get("status", "")
+    owner = change.get("owner", {})
+    created = change.get("created", "")
+    updated = change.get("updated", "")
+    project = change.get("project", "")
+    branch = change.get("branch", "")
+    updated_ts = parse_timestamp(updated)
+    
+    # 내가 소유자인 경우 (내가 작성한 리뷰)
+    owner_username = owner.get("username", owner.get("name", ""))
+    if owner_username == username:
+        reviews.append(GerritReview(
+            source=f"gerrit_{server.lower()}",
+            type="review_created",
+            change_id=change_id,
+            change_number=change_number,
+            subject=subject,
+            status=status,
+            project=project,
+            branch=branch,
+            created=created,
+            updated=updated,
+            updated_ts=updated_ts,
+            url=f"{base_url}/c/{change_number}"
+        ))
+    
+    # 메시지 확인 (내 댓글)
+    messages = change.get("messages", [])
+    for message in messages:
+        author = message.get("author", {})
+        author_username = author.get("username", author.get("name", ""))
+        message_date = message.get("date", "")
         
-        # UTF-8 인코딩 확인
-        if response.encoding:
-            response.encoding = 'utf-8'
+        if author_username == username:
+            message_ts = parse_timestamp(message_date)
+            if message_ts is not None and message_ts >= SINCE_TS:
+                comments.append(GerritComment(
+                    source=f"gerrit_{server.lower()}",
+                    type="review_comment",
+                    change_id=change_id,
+                    change_number=change_number,
+                    subject=subject,
+                    project=project,
+                    message=message.get("message", ""),
+                    created=message_date,
+                    created_ts=message_ts,
+                    url=f"{base_url}/c/{change_number}"
+                ))
+    
+    # 상세 댓글 (파일/라인 단위)
+    for file_path, comments_list in detailed_comments.items():
+        for comment in comments_list:
+            author = comment.get("author", {})
+            author_username = author.get("username", author.get("name", ""))
+            comment_updated = comment.get("updated", "")
+            
+            if author_username == username:
+                comment_ts = parse_timestamp(comment_updated)
+                if comment_ts is not None and comment_ts >= SINCE_TS:
+                    comments.append(GerritComment(
+                        source=f"gerrit_{server.lower()}",
+                        type="code_comment",
+                        change_id=change_id,
+                        change_number=change_number,
+                        subject=subject,
+                        project=project,
+                        file_path=file_path,
+                        line=comment.get("line", ""),
+                        message=comment.get("message", ""),
+                        created=comment_updated,
+                        created_ts=comment_ts,
+                        url=f"{base_url}/c/{change_number}"
+                    ))
+    
+    return reviews, comments
+
+# 검색 결과에서 실제로 사용하는 옵션만 요청 (owner 계정명, 메시지)
+# DETAILED_LABELS, CURRENT_REVISION은 응답 크기만 키우고 사용하지 않음
+GERRIT_QUERY_OPTIONS = ("DETAILED_ACCOUNTS", "MESSAGES")
+# 검색 한 페이지의 결과 수 (_more_changes가 false가 될 때까지 S=로 이어서 조회)
+GERRIT_PAGE_SIZE = 500
+
+# 마지막 collect_gerrit_data 실행의 요청/응답 크기 통계 (벤치마크/로그 확인용)
+GERRIT_PAYLOAD_STATS = {"search_requests": 0, "search_bytes": 0, "comment_requests": 0,
+                        "comment_bytes": 0, "changes": 0, "failed_comments": 0}
+# 마지막 collect_gerrit_data 실행에서 수집에 실패한 서버 {서버: 오류 메시지}
+GERRIT_FAILED_SERVERS = {}
+_gerrit_stats_lock = threading.Lock()
+
+def _count_gerrit_payload(kind, size):
+    with _gerrit_stats_lock:
+        GERRIT_PAYLOAD_STATS[f"{kind}_requests"] += 1
+        GERRIT_PAYLOAD_STATS[f"{kind}_bytes"] += size
+
+def build_gerrit_query(usernames, since_str, end_str):
+    """
+    작성/리뷰/댓글 단 변경사항을 한 번에 찾는 검색 쿼리
+    
+    Args:
+        usernames (str 또는 list): 사용자명 (팀 모드에서는 구성원 목록)
+    """
+    if isinstance(usernames, str):
+        usernames = [usernames]
+    terms = " OR ".join(f"owner:{name} OR reviewer:{name} OR commentby:{name}" for name in usernames)
+    return f"({terms}) after:{since_str} before:{end_str}"
+
+def gerrit_request(url, auth, params=None, kind=None, cache=False, validator=None):
+    """
+    Gerrit API 요청
+    
+    Args:
+        kind (str, optional): 응답 크기 통계 구분 ("search" 또는 "comment")
+        cache (bool): 응답 캐시 사용 여부 (http_client.get 참고)
+        validator (str, optional): 변경사항의 updated 값 - 이전 실행과 같으면 요청 없이 캐시 사용
         
+    Raises:
+        requests.exceptions.RequestException: 요청 실패 (재시도 후) 또는 오류 응답
+        ValueError: 응답 JSON 파싱 실패
+    """
+    response = http_client.get(url, auth=auth, params=params, timeout=30, cache=cache, validator=validator)
+    if kind and not getattr(response, "from_cache", False):
+        _count_gerrit_payload(kind, len(response.content))
+    response.raise_for_status()
+    
+    # Gerrit은 보안상 ")]}'" 접두사를 응답에 추가함
+    response.encoding = 'utf-8'
+    text = response.text
+    if text.startswith(")]}'\n"):
+        text = text[5:]
+    
+    try:
         return json.loads(text) if text.strip() else []
-    except requests.exceptions.RequestException as e:
-        print(f"⚠️ Gerrit 요청 오류: {e}")
-        return []
     except json.JSONDecodeError as e:
-        print(f"⚠️ JSON 파싱 오류: {e}")
-        return []
+        raise ValueError(f"Gerrit 응답 JSON 파싱 오류 ({url}): {e}") from e
 
-def search_gerrit_changes(auth, base_url, query, limit=1000):
-    """Gerrit에서 변경사항 검색"""
+def search_gerrit_changes(auth, base_url, query, limit=GERRIT_PAGE_SIZE, options=GERRIT_QUERY_OPTIONS):
+    """
+    Gerrit에서 변경사항 검색 (마지막 결과의 _more_changes가 없어질 때까지 S=로 페이지 조회)
+    
+    Args:
+        limit (int): 한 페이지의 결과 수
+        options (tuple): 요청할 응답 옵션 (o=)
+        
+    Returns:
+        list: 전체 검색 결과
+    """
     url = f"{base_url}/a/changes/"
-    params = {
-        "q": query,
-        "o": ["DETAILED_ACCOUNTS", "DETAILED_LABELS", "MESSAGES", "CURRENT_REVISION"],
-        "n": limit
-    }
+    changes = []
     
     print(f"  Gerrit 검색: {query}")
-    return gerrit_request(url, auth, params)
+    while True:
+        params = {
+            "q": query,
+            "o": list(options),
+            "n": limit,
+            "S": len(changes)
+        }
+        page = gerrit_request(url, auth, params, kind="search")
+        if not page:
+            break
+        changes.extend(page)
+        if not page[-1].get("_more_changes"):
+            break
+    
+    with _gerrit_stats_lock:
+        GERRIT_PAYLOAD_STATS["changes"] += len(changes)
+    return changes
 
-def get_gerrit_comments(auth, base_url, change_id):
-    """특정 변경사항의 댓글 가져오기"""
+def get_gerrit_comments(auth, base_url, change_id, updated=None):
+    """특정 변경사항의 댓글 가져오기 (updated가 이전 실행과 같으면 캐시된 응답 사용)"""
     url = f"{base_url}/a/changes/{change_id}/comments"
-    return gerrit_request(url, auth)
+    return gerrit_request(url, auth, kind="comment", cache=True, validator=updated)
+
+# =============================================================================
+# 팀 모드 (여러 구성원을 한 번에 수집)
+# =============================================================================
+#
+# 구성원마다 따로 수집하면 같은 이슈/변경사항/페이지를 구성원 수만큼 다시 받습니다.
+# 팀 모드는 구성원 목록으로 한 번 검색하고 각 항목을 한 번만 조회한 뒤,
+# 댓글/워크로그/메시지/페이지 버전의 작성자로 구성원별 활동을 로컬에서 나눕니다.
+
+# 팀 Jira 이슈 상세 동시 조회 수
+TEAM_JIRA_WORKERS = 4
+
+# 마지막 collect_team_data 실행 통계 (벤치마크/로그용)
+TEAM_STATS = {"members": 0, "jira_candidates": 0, "jira_detail_calls": 0,
+              "confluence_pages": 0, "gerrit_changes": 0}
+
+def search_team_jira_issues(headers, members, excluded_issues, master_key=None):
+    """
+    구성원 중 누군가가 담당/보고/관찰/댓글/워크로그 작성한 기간 내 이슈 (startAt 페이지 조회)
+    
+    Returns:
+        list: 검색 결과 이슈 목록 (comment 필드 포함)
+    """
+    users = _jql_user_list(members)
+    # comment ~ 는 목록(in)을 지원하지 않으므로 구성원마다 조건 추가 (단일 모드의 comment ~ currentUser()와 같은 범위)
+    comments = "".join(f' OR comment ~ "{name}"' for name in members)
+    jql = (f"{jira_date_clause()} AND (assignee in ({users}) OR assignee was in ({users}) "
+           f"OR reporter in ({users}) OR watcher in ({users}){comments} OR worklogAuthor in ({users}))")
+    jql += jira_master.exclusion_jql(master_key, excluded_issues)
+    
+    issues = []
+    start = 0
+    while True:
+        params = {
+            "jql": jql,
+            "fields": "key,summary,updated,status,assignee,reporter,created,description,comment",
+            "startAt": start,
+            "maxResults": 500
+        }
+        r = http_client.get(f"{JIRA_BASE}/rest/api/2/search", headers=headers, params=params)
+        r.raise_for_status()
+        data = r.json()
+        page = data.get("issues", [])
+        issues.extend(page)
+        start += len(page)
+        if not page or start >= data.get("total", 0):
+            return issues
+
+def collect_team_jira_data(members, token, excluded_issues=None, master_issue=None):
+    """
+    팀 Jira 데이터 수집 (이슈 상세는 구성원 수와 관계없이 이슈당 한 번)
+    
+    Args:
+        members (list): 구성원 사용자명 목록
+        token (str): Jira API 토큰 (검색/조회 권한이 있는 계정)
+        excluded_issues (list, optional): 분석에서 제외할 이슈 키 목록 (URL도 가능)
+        master_issue (str, optional): 마스터 이슈 키/URL - 마스터와 그 서브태스크를 제외
+        
+    Returns:
+        dict: {구성원: JiraIssue 리스트} (기간 내 본인 댓글/워크로그가 있는 이슈만)
+    """
+    headers = {
+        "Accept": "application/json",
+        "Authorization": f"Bearer {token}"
+    }
+    results = {member: [] for member in members}
+    excluded_issues = [jira_master.issue_key_from(key) for key in (excluded_issues or []) if key]
+    COLLECTION_ERRORS.pop("jira", None)
+    master_key = jira_master.issue_key_from(master_issue) if master_issue else None
+    if master_key and master_key not in excluded_issues:
+        excluded_issues.append(master_key)
+    
+    try:
+        issues = search_team_jira_issues(headers, members, excluded_issues, master_key)
+    except Exception as e:
+        print(f"❌ 팀 Jira 검색 오류: {e}")
+        COLLECTION_ERRORS["jira"] = f"팀 검색 오류: {e}"
+        return results
+    print(f"✅ 팀 Jira에서 {len(issues)}개의 이슈를 가져왔습니다.")
+    
+    # 사전 필터: 구성원 누구의 워크로그/댓글도 기간 내에 없는 이슈는 상세 조회 생략
+    for name in JIRA_PRUNE_STATS:
+        JIRA_PRUNE_STATS[name] = 0
+    worklog_keys = search_my_worklog_issue_keys(headers, authors=members)
+    member_set = set(members)
+    
+    candidates = []
+    for issue in issues:
+        issue_key = issue.get("key", "")
+        updated_str = issue.get("fields", {}).get("updated")
+        updated_ts = parse_timestamp(updated_str) if updated_str else None
+        if issue_key in excluded_issues or updated_ts is None or updated_ts < SINCE_TS:
+            continue
+        JIRA_PRUNE_STATS["candidates"] += 1
+        if worklog_keys is not None and issue_key not in worklog_keys:
+            authors = comment_authors_in_window(headers, issue)
+            if authors is not None and not authors & member_set:
+                JIRA_PRUNE_STATS["pruned"] += 1
+                continue
+        candidates.append((issue_key, updated_str))
+    
+    # 이슈 상세를 한 번씩만 조회한 뒤 구성원별로 나눔
+    JIRA_PRUNE_STATS["detail_calls"] = len(candidates)
+    with ThreadPoolExecutor(max_workers=TEAM_JIRA_WORKERS) as executor:
+        futures = {executor.submit(fetch_jira_issue, token, key, updated): key for key, updated in candidates}
+        fetched = {}
+        for future in as_completed(futures):
+            try:
+                fetched[futures[future]] = future.result()
+            except Exception as e:
+                print(f"❌ Jira 이슈 상세 정보 가져오기 실패 ({futures[future]}): {e}")
+                COLLECTION_ERRORS["jira"] = f"{futures[future]} 상세 정보 수집 실패"
+    
+    for issue_key, _ in candidates:
+        issue_data = fetched.get(issue_key)
+        if issue_data is None:
+            continue
+        for member in members:
+            try:
+                detailed_issue = build_jira_issue_details(issue_data, member)
+            except Exception as e:
+                print(f"⚠️ {issue_key} {member} 활동 분리 오류: {e}")
+                continue
+            if detailed_issue.comment_count > 0 or detailed_issue.worklog_count > 0:
+                results[member].append(detailed_issue)
+    
+    print(f"⚡ 팀 Jira: 후보 {JIRA_PRUNE_STATS['candidates']}개, 사전 필터 {JIRA_PRUNE_STATS['pruned']}개 생략, "
+          f"상세 조회 {JIRA_PRUNE_STATS['detail_calls']}회 (구성원 {len(members)}명)")
+    return results
+
+def collect_team_confluence_data(members, token):
+    """
+    팀 Confluence 데이터 수집 (검색/버전 이력은 한 번, 버전 작성자로 구성원별 분리)
+    
+    Returns:
+        dict: {구성원: ConfluencePage 리스트}
+    """
+    headers = {
+        "Accept": "application/json",
+        "Authorization": f"Bearer {token}"
+    }
+    since_str = SINCE.strftime("%Y-%m-%d")
+    end_str = NOW_UTC.strftime("%Y-%m-%d")
+    
+    COLLECTION_ERRORS.pop("confluence", None)
+    try:
+        cql = (f"contributor in ({_jql_user_list(members)}) "
+               f"AND lastModified >= '{since_str}' AND lastModified <= '{end_str}'")
+        pages = search_confluence_pages(headers, cql)
+        print(f"📝 팀 Confluence 검색 결과: {len(pages)}개 페이지")
+        history = fetch_confluence_histories(headers, pages)
+    except Exception as e:
+        print(f"❌ 팀 Confluence 데이터 수집 오류: {e}")
+        COLLECTION_ERRORS["confluence"] = str(e)
+        return {member: [] for member in members}
+    if CONFLUENCE_VERSION_STATS["failed"]:
+        COLLECTION_ERRORS["confluence"] = f"버전 이력 조회 실패 {CONFLUENCE_VERSION_STATS['failed']}개 페이지"
+    
+    return {member: build_confluence_activities(pages, history, member) for member in members}
+
+def collect_team_data(members, jira_token=None, confluence_token=None, gerrit_username=None,
+                      gerrit_tokens=None, excluded_issues=None, master_issue=None):
+    """
+    팀 전체 활동 수집 (API 호출 수가 구성원 수가 아닌 서로 다른 이슈/페이지/변경사항 수에 비례)
+    
+    Args:
+        members (list): 구성원 사용자명 목록
+        jira_token (str, optional): Jira API 토큰
+        confluence_token (str, optional): Confluence API 토큰
+        gerrit_username (str, optional): Gerrit 인증 계정
+        gerrit_tokens (dict, optional): 서버별 Gerrit 토큰
+        excluded_issues (list, optional): 분석에서 제외할 이슈 키 목록
+        master_issue (str, optional): 마스터 이슈 키/URL
+        
+    Returns:
+        dict: {구성원: {"jira_data", "confluence_data", "gerrit_reviews", "gerrit_comments"}}
+    """
+    members = list(dict.fromkeys(member for member in members if member))
+    team = {member: {"jira_data": [], "confluence_data": [], "gerrit_reviews": [], "gerrit_comments": []}
+            for member in members}
+    for name in TEAM_STATS:
+        TEAM_STATS[name] = 0
+    TEAM_STATS["members"] = len(members)
+    COLLECTION_ERRORS.clear()
+    if not members:
+        return team
+    
+    print(f"👥 팀 모드 수집: {', '.join(members)}")
+    if jira_token:
+        for member, issues in collect_team_jira_data(members, jira_token, excluded_issues, master_issue).items():
+            team[member]["jira_data"] = issues
+        TEAM_STATS["jira_candidates"] = JIRA_PRUNE_STATS["candidates"]
+        TEAM_STATS["jira_detail_calls"] = JIRA_PRUNE_STATS["detail_calls"]
+    if confluence_token:
+        for member, pages in collect_team_confluence_data(members, confluence_token).items():
+            team[member]["confluence_data"] = pages
+        TEAM_STATS["confluence_pages"] = CONFLUENCE_VERSION_STATS["pages"]
+    if gerrit_username and gerrit_tokens:
+        for member, (reviews, comments) in collect_gerrit_data(gerrit_username, gerrit_tokens,
+                                                               members=members).items():
+            team[member]["gerrit_reviews"] = reviews
+            team[member]["gerrit_comments"] = comments
+        TEAM_STATS["gerrit_changes"] = GERRIT_PAYLOAD_STATS["changes"]
+    
+    for member, data in team.items():
+        print(f"👤 {member}: Jira {len(data['jira_data'])}개, Confluence {len(data['confluence_data'])}개, "
+              f"Gerrit 리뷰 {len(data['gerrit_reviews'])}개, 댓글 {len(data['gerrit_comments'])}개")
+    return team
 
 # =============================================================================
 # 데이터 가공 및 분석 함수
 # =============================================================================
 
+def _activity_epoch(activity, ts_field, raw_field):
+    """수집 시 정규화된 epoch 값을 우선 사용하고, 없으면 원본 문자열을 파싱"""
+    ts = activity.get(ts_field)
+    if ts is None:
+        ts = parse_timestamp(activity.get(raw_field))
+    return ts
+
 def process_activity_data(jira_data, confluence_data, gerrit_reviews, gerrit_comments):
     """
     수집된 데이터를 가공하여 통합 활동 타임라인 생성
@@ -892,7 +1582,7 @@ def process_activity_data(jira_data, confluence_data, gerrit_reviews, gerrit_com
         gerrit_comments (list): Gerrit 댓글 데이터
         
     Returns:
-        list: 통합된 활동 타임라인 데이터
+        list: 통합된 활동 타임라인 데이터 (ActivityView, 원본 레코드는 raw_data로 참조)
     """
     all_activities = []
     
@@ -903,56 +1593,60 @@ def process_activity_data(jira_data, confluence_data, gerrit_reviews, gerrit_com
         if len(description_preview) > 100:
             description_preview = description_preview[:100] + "..."
         
-        all_activities.append({
-            "timestamp": activity["updated"],
-            "source": "JIRA",
-            "type": "이슈 활동",
-            "reference": activity["issue_key"],
-            "description": f"[{activity['status']}] {activity['summary']}",
-            "content": description_preview if description_preview else activity["url"],
-            "full_description": activity.get("description", ""),  # 전체 설명 보관
-            "raw_data": activity
-        })
+        # 전체 설명(full_description)과 원본(raw_data)은 복사하지 않고 레코드를 참조
+        all_activities.append(ActivityView(
+            timestamp=activity["updated"],
+            timestamp_epoch=_activity_epoch(activity, "updated_ts", "updated"),
+            source="JIRA",
+            type="이슈 활동",
+            reference=activity["issue_key"],
+            description=f"[{activity['status']}] {activity['summary']}",
+            content=description_preview if description_preview else activity["url"],
+            record=activity
+        ))
     
     # Confluence 활동 변환
     for activity in confluence_data:
-        all_activities.append({
-            "timestamp": activity.get("last_modified", dt.datetime.now().isoformat()),
-            "source": "CONFLUENCE",
-            "type": "페이지 활동",
-            "reference": activity["page_id"],
-            "description": f"{activity['space']}: {activity['title']}",
-            "content": activity["url"],
-            "raw_data": activity
-        })
+        all_activities.append(ActivityView(
+            timestamp=activity.get("last_modified", dt.datetime.now().isoformat()),
+            timestamp_epoch=_activity_epoch(activity, "last_modified_ts", "last_modified"),
+            source="CONFLUENCE",
+            type="페이지 활동",
+            reference=activity["page_id"],
+            description=f"{activity['space']}: {activity['title']}",
+            content=activity["url"],
+            record=activity
+        ))
     
     # Gerrit 리뷰 변환
     for review in gerrit_reviews:
-        all_activities.append({
-            "timestamp": review["updated"],
-            "source": review["source"].upper(),
-            "type": "코드리뷰 생성",
-            "reference": f"{review['project']}#{review['change_number']}",
-            "description": f"[{review['status']}] {review['subject']}",
-            "content": review["url"],
-            "raw_data": review
-        })
+        all_activities.append(ActivityView(
+            timestamp=review["updated"],
+            timestamp_epoch=_activity_epoch(review, "updated_ts", "updated"),
+            source=review["source"].upper(),
+            type="코드리뷰 생성",
+            reference=f"{review['project']}#{review['change_number']}",
+            description=f"[{review['status']}] {review['subject']}",
+            content=review["url"],
+            record=review
+        ))
     
     # Gerrit 댓글 변환
     for comment in gerrit_comments:
         comment_type = "코드 댓글" if comment["type"] == "code_comment" else "리뷰 댓글"
-        all_activities.append({
-            "timestamp": comment["created"],
-            "source": comment["source"].upper(),
-            "type": comment_type,
-            "reference": f"{comment['project']}#{comment['change_number']}",
-            "description": f"{comment['subject']}",
-            "content": comment["message"][:100] + "..." if len(comment["message"]) > 100 else comment["message"],
-            "raw_data": comment
-        })
-    
-    # 시간순 정렬
-    all_activities.sort(key=lambda x: x["timestamp"], reverse=True)
+        all_activities.append(ActivityView(
+            timestamp=comment["created"],
+            timestamp_epoch=_activity_epoch(comment, "created_ts", "created"),
+            source=comment["source"].upper(),
+            type=comment_type,
+            reference=f"{comment['project']}#{comment['change_number']}",
+            description=f"{comment['subject']}",
+            content=comment["message"][:100] + "..." if len(comment["message"]) > 100 else comment["message"],
+            record=comment
+        ))
+    
+    # 시간순 정렬 (형식이 섞인 원본 문자열 대신 정규화된 epoch 값 기준)
+    all_activities.sort(key=lambda x: x["timestamp_epoch"] or 0.0, reverse=True)
     
     return all_activities
 
@@ -961,46 +1655,17 @@ def generate_activity_summary(activities):
     활동 데이터 요약 생성
     
     Args:
-        activities (list): 활동 데이터 리스트
+        activities (list | ActivityTable): 활동 데이터 리스트 또는 컬럼형 테이블
         
     Returns:
-        dict: 활동 요약 정보
+        dict: 활동 요약 정보 (소스/타입/일자/프로젝트별 건수, 기간)
     """
-    summary = {
-        "total_activities": len(activities),
-        "by_source": {},
-        "by_type": {},
-        "date_range": {
-            "start": None,
-            "end": None
-        }
-    }
-    
-    dates = []
-    for activity in activities:
-        # 소스별 카운트
-        source = activity["source"]
-        summary["by_source"][source] = summary["by_source"].get(source, 0) + 1
-        
-        # 타입별 카운트
-        activity_type = activity["type"]
-        summary["by_type"][activity_type] = summary["by_type"].get(activity_type, 0) + 1
-        
-        # 날짜 수집
-        try:
-            date = iso_to_dt(activity["timestamp"])
-            if date:
-                dates.append(date)
-        except:
-            pass
-    
-    # 날짜 범위 설정
-    if dates:
-        dates.sort()
-        summary["date_range"]["start"] = dates[0].strftime("%Y-%m-%d")
-        summary["date_range"]["end"] = dates[-1].strftime("%Y-%m-%d")
-    
-    return summary
+    table = activities if isinstance(activities, ActivityTable) else build_activity_table(activities)
+    return table.summary()
+
+def build_activity_table(activities):
+    """통합 타임라인을 컬럼형 ActivityTable로 변환 (집계/내보내기용)"""
+    return ActivityTable.from_activities(activities, parse=parse_timestamp)
 
 # =============================================================================
 # 유틸리티 함수들
@@ -1018,11 +1683,15 @@ def write_csv(path, headers, rows):
     log_path = os.path.join(log_dir, os.path.basename(path))
     
     with open(log_path, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow({h: r.get(h, "") for h in headers})
-    print(f"✓ {log_path} 작성 완료 ({len(rows)}개 행)")
+        if isinstance(rows, ActivityTable):
+            count = rows.write_csv(f, headers)
+        else:
+            writer = csv.DictWriter(f, fieldnames=headers)
+            writer.writeheader()
+            for r in rows:
+                writer.writerow({h: r.get(h, "") for h in headers})
+            count = len(rows)
+    print(f"✓ {log_path} 작성 완료 ({count}개 행)")
 
 # =============================================================================
 # 메인 실행 함수 (예제)
@@ -1047,19 +1716,14 @@ def main():
         "AS": ""
     }
     
-    # user_config.json에서 제외할 이슈 목록 읽기
-    excluded_issues = []
+    # user_config.json에서 마스터 이슈 읽기 (마스터와 그 서브태스크는 수집에서 제외)
+    master_jira = ""
     try:
         with open("user_config.json", "r", encoding="utf-8") as f:
             config = json.load(f)
             master_jira = config.get("master_jira", "")
             if master_jira:
-                # master_jira를 제외 목록에 추가
-                excluded_issues.append(master_jira)
-                print(f"📋 제외 대상 마스터 이슈: {master_jira}")
-                
-                # TODO: 나중에 Jira API를 통해 master_jira의 subtask들도 가져와서 제외 목록에 추가
-                # (현재는 master_jira만 제외)
+                print(f"📋 제외 대상 마스터 이슈: {master_jira} (+ 서브태스크)")
                 
     except Exception as e:
         print(f"⚠️ user_config.json 읽기 실패: {e}")
@@ -1068,7 +1732,7 @@ def main():
     print("\n=== 데이터 수집 ===")
     
     print("JIRA 데이터 수집 중...")
-    jira_data = collect_jira_data(USERNAME, JIRA_TOKEN, excluded_issues)
+    jira_data = collect_jira_data(USERNAME, JIRA_TOKEN, master_issue=master_jira)
     print(f"✓ Jira 활동: {len(jira_data)}개")
     
     print("Confluence 데이터 수집 중...")
@@ -1079,11 +1743,14 @@ def main():
     gerrit_reviews, gerrit_comments = collect_gerrit_data(USERNAME, GERRIT_TOKENS)
     print(f"✓ Gerrit 리뷰: {len(gerrit_reviews)}개")
     print(f"✓ Gerrit 댓글: {len(gerrit_comments)}개")
+    for line in http_client.finish_collection():
+        print(line)
     
     # 2. 데이터 가공
     print("\n=== 데이터 가공 ===")
     integrated_activities = process_activity_data(jira_data, confluence_data, gerrit_reviews, gerrit_comments)
-    activity_summary = generate_activity_summary(integrated_activities)
+    activity_table = build_activity_table(integrated_activities)
+    activity_summary = generate_activity_summary(activity_table)
     
     print(f"통합 활동: {activity_summary['total_activities']}개")
     print("소스별 활동:")
@@ -1105,10 +1772,10 @@ def main():
                   ["source", "type", "change_id", "change_number", "subject", "project", "file_path", "line", "message", "created", "url"],
                   gerrit_comments)
     
-    # 통합 활동 타임라인 CSV
+    # 통합 활동 타임라인 CSV (컬럼형 테이블에서 바로 작성)
     write_csv("integrated_activity_timeline.csv",
               ["timestamp", "source", "type", "reference", "description", "content", "full_description"],
-              integrated_activities)
+              activity_table)
     
     print(f"\n🎉 완료! 모든 데이터가 수집 및 가공되었습니다.")
     print(f"   - 통합 활동: {len(integrated_activities)}개")
@@ -1120,6 +1787,7 @@ def main():
         "gerrit_reviews": gerrit_reviews,
         "gerrit_comments": gerrit_comments,
         "integrated_activities": integrated_activities,
+        "activity_table": activity_table,
         "summary": activity_summary
     }
 